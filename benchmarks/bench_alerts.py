@@ -0,0 +1,108 @@
+"""Benchmark evaluating alert rules on a tick of samples.
+
+A tick is one sample from each of SERVER_COUNT servers, evaluated against
+RULE_COUNT rules spread over SERIES_COUNT watched series: static thresholds,
+ratios to a reference series (like jvm.memory.used / jvm.memory.max), rates
+of change and z-scores with a few baseline settings. Values follow a random
+walk, so most ticks only raise a few alerts.
+
+The whole-tick time should stay within a few milliseconds: rules computing
+the same score on a series are evaluated together, so the cost grows with the
+number of rule groups and alerts rather than with the number of rules.
+
+Run with: python -m benchmarks.bench_alerts [SERVER_COUNT] [RULE_COUNT]
+(default 100 servers and 10,000 rules)
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from src.analytics import AlertEngine, RateOfChangeRule, ThresholdRule, ZScoreRule
+
+DEFAULT_SERVER_COUNT = 100
+DEFAULT_RULE_COUNT = 10_000
+SERIES_COUNT = 10
+WARMUP_TICKS = 20
+TICKS = 50
+START = datetime(2025, 4, 23, 11, 0, 0, tzinfo=timezone.utc)
+
+
+def make_rules(rule_count):
+    rules = []
+    for index in range(rule_count):
+        series = f"series.{index % SERIES_COUNT}"
+        kind = index // SERIES_COUNT % 4
+        if kind == 0:
+            rules.append(
+                ThresholdRule(
+                    f"threshold.{index}", series, above=random.uniform(0.8, 1.0)
+                )
+            )
+        elif kind == 1:
+            rules.append(
+                ThresholdRule(
+                    f"ratio.{index}",
+                    series,
+                    below=random.uniform(0.0, 0.2),
+                    reference="series.max",
+                )
+            )
+        elif kind == 2:
+            rules.append(
+                RateOfChangeRule(f"rate.{index}", series, random.uniform(0.05, 0.5))
+            )
+        else:
+            rules.append(
+                ZScoreRule(
+                    f"zscore.{index}",
+                    series,
+                    threshold=random.uniform(3, 6),
+                    alpha=random.choice((0.05, 0.1)),
+                )
+            )
+    return rules
+
+
+def main():
+    server_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SERVER_COUNT
+    rule_count = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_RULE_COUNT
+    random.seed(42)
+    engine = AlertEngine(make_rules(rule_count))
+    servers = {
+        f"server-{index}": {f"series.{series}": 0.5 for series in range(SERIES_COUNT)}
+        for index in range(server_count)
+    }
+
+    def run_tick(tick):
+        samples = []
+        for server_id, values in servers.items():
+            for name, value in values.items():
+                values[name] = min(max(value + random.gauss(0, 0.01), 0.0), 1.0)
+            samples.append((server_id, dict(values, **{"series.max": 1.0})))
+        timestamp = START + timedelta(seconds=tick)
+        started = time.perf_counter()
+        alerts = 0
+        for server_id, values in samples:
+            alerts += len(engine.evaluate(server_id, values, timestamp))
+        return time.perf_counter() - started, alerts
+
+    for tick in range(WARMUP_TICKS):
+        run_tick(tick)
+    results = [run_tick(WARMUP_TICKS + tick) for tick in range(TICKS)]
+    times = sorted(elapsed for elapsed, _ in results)
+    alerts = sum(count for _, count in results) / TICKS
+
+    print(
+        f"{server_count:,} servers x {rule_count:,} rules on {SERIES_COUNT} series, "
+        f"{TICKS} ticks"
+    )
+    print(f"  best   {times[0] * 1e3:8.2f} ms per tick")
+    print(f"  median {times[len(times) // 2] * 1e3:8.2f} ms per tick")
+    print(f"  worst  {times[-1] * 1e3:8.2f} ms per tick")
+    print(f"  {alerts:.1f} alerts per tick on average")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Benchmark the memory of validated models against their compact mirrors.
+
+For each high-volume model, COUNT instances are validated from sample JSON
+and converted with the compact_* functions. The memory retained by each
+list of instances is measured with tracemalloc, and the conversion time
+without tracing.
+
+Run with: python -m benchmarks.bench_compact_models [COUNT]
+(default 1,000,000; the HttpExchange and Event rows need several GB, pass a
+smaller count on small machines)
+"""
+
+import gc
+import sys
+import timeit
+import tracemalloc
+
+from src.actuator.containers.auditevents import AuditEvent
+from src.actuator.containers.compact import (
+    compact_audit_event,
+    compact_event,
+    compact_exchange,
+    compact_measurement,
+    compact_stack_frame,
+    compact_tag,
+)
+from src.actuator.containers.httpexchanges import HttpExchange
+from src.actuator.containers.metrics import Measurement, Tag
+from src.actuator.containers.startup import Event
+from src.actuator.containers.threaddump import StackTraceElement
+
+DEFAULT_COUNT = 1_000_000
+TIMING_COUNT = 10_000
+
+SAMPLES = [
+    (
+        Measurement,
+        compact_measurement,
+        lambda i: {"statistic": "COUNT", "value": float(i)},
+    ),
+    (
+        Tag,
+        compact_tag,
+        lambda i: {"tag": "uri", "values": ["/api/info", f"/api/users/{i}"]},
+    ),
+    (
+        StackTraceElement,
+        compact_stack_frame,
+        lambda i: {
+            "classLoaderName": "app",
+            "methodName": "invoke",
+            "fileName": "Method.java",
+            "lineNumber": i % 1000,
+            "className": "java.lang.reflect.Method",
+            "nativeMethod": False,
+        },
+    ),
+    (
+        HttpExchange,
+        compact_exchange,
+        lambda i: {
+            "timestamp": "2025-04-23T10:24:55.240133900Z",
+            "request": {
+                "uri": f"http://localhost:9090/api/users/{i}",
+                "method": "GET",
+                "headers": {"accept": ["application/json"]},
+            },
+            "response": {
+                "status": 200,
+                "headers": {"Content-Type": ["application/json"]},
+            },
+            "timeTaken": "PT0.015S",
+        },
+    ),
+    (
+        AuditEvent,
+        compact_audit_event,
+        lambda i: {
+            "timestamp": "2025-04-23T10:24:55.240133900Z",
+            "principal": "anonymous",
+            "type": "INFO_ACCESS",
+            "data": {"endpoint": "/api/info"},
+        },
+    ),
+    (
+        Event,
+        compact_event,
+        lambda i: {
+            "endTime": "2025-04-23T10:24:55.240133900Z",
+            "duration": "PT0.001S",
+            "startTime": "2025-04-23T10:24:55.239133900Z",
+            "startupStep": {
+                "name": "spring.beans.instantiate",
+                "id": i,
+                "tags": [{"key": "beanName", "value": "dataSource"}],
+                "parentId": i - 1,
+            },
+        },
+    ),
+]
+
+
+def traced_memory():
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    print(f"Memory retained by {count:,} instances per representation")
+    for model, convert, sample in SAMPLES:
+        data = [sample(i) for i in range(count)]
+        tracemalloc.start()
+        baseline = traced_memory()
+        models = [model.model_validate(item) for item in data]
+        model_bytes = traced_memory() - baseline
+        del data
+        # The compact instances may share objects with the models (headers,
+        # datetimes), so they are measured once the models are gone
+        compact = [convert(instance) for instance in models]
+        del models
+        compact_bytes = traced_memory() - baseline
+        tracemalloc.stop()
+        del compact
+
+        models = [model.model_validate(sample(i)) for i in range(TIMING_COUNT)]
+        convert_time = min(
+            timeit.repeat(
+                lambda: [convert(instance) for instance in models],
+                number=1,
+                repeat=3,
+            )
+        )
+        print(
+            f"  {model.__name__:18} model: {model_bytes / count:6.0f} B"
+            f"   compact: {compact_bytes / count:6.0f} B"
+            f"   ({model_bytes / compact_bytes:4.1f}x smaller,"
+            f" {convert_time / TIMING_COUNT * 1e6:5.2f} us per conversion)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark formatting metric values for table views.
+
+Compares the formatting code used before formatters were registered by base
+unit (copied below: the base unit compared as a string for every value, bytes
+divided by 1024 in a loop and trailing zeros stripped with rstrip) with the
+registered formatters applied to a column with format_values.
+
+Run with: python -m benchmarks.bench_metric_formatters
+"""
+
+import random
+import timeit
+
+from src.actuator.containers.metrics import format_values
+
+VALUE_COUNT = 100_000
+REPEAT = 5
+
+
+def old_format_bytes(bytes_value):
+    units = ["B", "KB", "MB", "GB", "TB"]
+    unit_index = 0
+    while bytes_value >= 1024 and unit_index < len(units) - 1:
+        bytes_value /= 1024
+        unit_index += 1
+    formatted = (
+        f"{bytes_value:.2f}".rstrip("0").rstrip(".")
+        if bytes_value % 1 != 0
+        else f"{int(bytes_value)}"
+    )
+    return f"{formatted} {units[unit_index]}"
+
+
+def old_format_time(ms_value):
+    if ms_value < 1000:
+        return (
+            f"{ms_value:.1f} ms".rstrip("0").rstrip(".")
+            if ms_value % 1 != 0
+            else f"{int(ms_value)} ms"
+        )
+    seconds = ms_value / 1000
+    if seconds < 60:
+        return (
+            f"{seconds:.1f} s".rstrip("0").rstrip(".")
+            if seconds % 1 != 0
+            else f"{int(seconds)} s"
+        )
+    minutes = seconds / 60
+    if minutes < 60:
+        return (
+            f"{minutes:.1f} m".rstrip("0").rstrip(".")
+            if minutes % 1 != 0
+            else f"{int(minutes)} m"
+        )
+    hours = minutes / 60
+    return (
+        f"{hours:.1f} h".rstrip("0").rstrip(".")
+        if hours % 1 != 0
+        else f"{int(hours)} h"
+    )
+
+
+def old_format_value(value, base_unit):
+    if base_unit == "bytes":
+        return old_format_bytes(value)
+    elif base_unit == "milliseconds" or base_unit == "ms":
+        return old_format_time(value)
+    elif base_unit == "percent":
+        return f"{value:.1f}%"
+    else:
+        return f"{value:.2f}" if value % 1 != 0 else f"{int(value)}"
+
+
+def old_format_column(values, base_unit):
+    return [old_format_value(value, base_unit) for value in values]
+
+
+def main():
+    random.seed(42)
+    # Only the units the old code formatted: it printed seconds and
+    # nanoseconds as plain numbers
+    columns = {
+        "bytes": [random.uniform(0, 64 * 1024**3) for _ in range(VALUE_COUNT)],
+        "ms": [random.uniform(0, 120_000) for _ in range(VALUE_COUNT)],
+        "percent": [random.uniform(0, 100) for _ in range(VALUE_COUNT)],
+        None: [float(random.randint(0, 500)) for _ in range(VALUE_COUNT)],
+    }
+
+    print(f"Formatting {VALUE_COUNT:,} values, best of {REPEAT} runs")
+    for base_unit, values in columns.items():
+        old = min(
+            timeit.repeat(
+                lambda: old_format_column(values, base_unit), number=1, repeat=REPEAT
+            )
+        )
+        new = min(
+            timeit.repeat(
+                lambda: format_values(values, base_unit), number=1, repeat=REPEAT
+            )
+        )
+        print(
+            f"  {str(base_unit):8} old: {old * 1000:7.1f} ms"
+            f"   new: {new * 1000:7.1f} ms"
+            f"   ({old / new:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
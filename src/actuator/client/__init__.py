@@ -0,0 +1,3 @@
+from .actuator_client import ActuatorClient
+
+__all__ = ["ActuatorClient"]
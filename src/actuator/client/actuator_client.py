@@ -0,0 +1,183 @@
+import base64
+import json
+import urllib.parse
+import urllib.request
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...config.servers.spring_boot_server import SpringBootServer
+from ..containers.auditevents import AuditEvents
+from ..containers.metrics import Metric
+
+
+class ActuatorClient:
+    """Minimal HTTP client for the Spring Boot Actuator API of one server.
+
+    The base URL is the Actuator root, e.g. "http://localhost:9090/actuator",
+    since the /actuator prefix is configurable per server.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        timeout: float = 5.0,
+    ):
+        """Initialize the client.
+
+        Args:
+            base_url: The Actuator root URL
+            username: Optional username for HTTP basic authentication
+            password: Optional password for HTTP basic authentication
+            timeout: Timeout in seconds for each request
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._headers = {"Accept": "application/json"}
+        if username is not None:
+            credentials = f"{username}:{password or ''}".encode()
+            self._headers["Authorization"] = (
+                "Basic " + base64.b64encode(credentials).decode()
+            )
+
+    @classmethod
+    def from_server(
+        cls, server: SpringBootServer, timeout: float = 5.0
+    ) -> "ActuatorClient":
+        """Create a client for a configured SpringBootServer.
+
+        Args:
+            server: The SpringBootServer
+            timeout: Timeout in seconds for each request
+
+        Returns:
+            An ActuatorClient for the server.
+        """
+        return cls(server.url, server.username, server.password, timeout)
+
+    def build_url(
+        self, path: str, params: Optional[List[Tuple[str, str]]] = None
+    ) -> str:
+        """Build the URL of an Actuator endpoint.
+
+        Args:
+            path: The path relative to the Actuator root, e.g. "metrics/jvm.memory.used"
+            params: Optional query parameters; repeated keys are allowed
+
+        Returns:
+            The full URL.
+        """
+        url = f"{self.base_url}/{urllib.parse.quote(path.lstrip('/'), safe='/.-_~')}"
+        if params:
+            url += "?" + urllib.parse.urlencode(params)
+        return url
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[List[Tuple[str, str]]] = None,
+        body: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        headers = dict(self._headers)
+        data = None
+        if body is not None:
+            data = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+        request = urllib.request.Request(
+            self.build_url(path, params), data=data, headers=headers, method=method
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            content = response.read()
+        return json.loads(content) if content else None
+
+    def get_json(
+        self, path: str, params: Optional[List[Tuple[str, str]]] = None
+    ) -> Any:
+        """Send a GET request and parse the JSON response.
+
+        Args:
+            path: The path relative to the Actuator root
+            params: Optional query parameters
+
+        Returns:
+            The parsed JSON response, or None if the response is empty.
+
+        Raises:
+            urllib.error.URLError: If the request fails.
+        """
+        return self._request("GET", path, params)
+
+    def post_json(self, path: str, body: Dict[str, Any]) -> Any:
+        """Send a POST request with a JSON body.
+
+        Args:
+            path: The path relative to the Actuator root
+            body: The request body
+
+        Returns:
+            The parsed JSON response, or None if the response is empty.
+
+        Raises:
+            urllib.error.URLError: If the request fails.
+        """
+        return self._request("POST", path, body=body)
+
+    def get_metric(self, name: str, tags: Optional[Dict[str, str]] = None) -> Metric:
+        """Fetch a metric, optionally restricted to specific tag values.
+
+        Args:
+            name: The metric name, e.g. "http.server.requests"
+            tags: Optional tag filter, e.g. {"uri": "/api/info"}
+
+        Returns:
+            The Metric object.
+
+        Raises:
+            urllib.error.URLError: If the request fails; Actuator answers 404
+                when no meter matches the tag filter.
+        """
+        params = [("tag", f"{key}:{value}") for key, value in (tags or {}).items()]
+        return Metric.model_validate(self.get_json(f"metrics/{name}", params))
+
+    def set_logger_level(self, name: str, level: Optional[str]) -> None:
+        """Set the configured level of a logger or logger group.
+
+        Args:
+            name: The logger or group name, e.g. "org.springframework.web"
+            level: The level, e.g. "DEBUG", or None to clear the configured
+                level so the logger inherits it again
+
+        Raises:
+            urllib.error.URLError: If the request fails.
+        """
+        self.post_json(f"loggers/{name}", {"configuredLevel": level})
+
+    def get_audit_events(
+        self,
+        after: Optional[datetime] = None,
+        principal: Optional[str] = None,
+        type: Optional[str] = None,
+    ) -> AuditEvents:
+        """Fetch audit events, optionally filtered on the server.
+
+        Args:
+            after: Only return events at or after this time
+            principal: Only return events of this principal
+            type: Only return events of this type, e.g. "AUTHENTICATION_FAILURE"
+
+        Returns:
+            The AuditEvents object.
+
+        Raises:
+            urllib.error.URLError: If the request fails.
+        """
+        params = []
+        if after is not None:
+            params.append(("after", after.isoformat()))
+        if principal is not None:
+            params.append(("principal", principal))
+        if type is not None:
+            params.append(("type", type))
+        return AuditEvents.model_validate(self.get_json("auditevents", params))
@@ -1,3 +1,4 @@
 from .models import Beans, Bean, Context
+from .graph import BeanGraph
 
-__all__ = ["Beans", "Bean", "Context"]
+__all__ = ["Beans", "Bean", "Context", "BeanGraph"]
@@ -0,0 +1,228 @@
+from collections import deque
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Mapping, Optional, Set
+
+if TYPE_CHECKING:
+    from .models import Bean
+
+
+class BeanGraph:
+    """Dependency graph index over the beans of a single context.
+
+    Forward and reverse adjacency are built once from the bean definitions.
+    Strongly connected components, topological order and transitive closure
+    queries are computed on first use and cached, so repeated queries against
+    the same snapshot do not rescan the beans.
+
+    Dependencies on names that are not beans of the context (for instance beans
+    from a parent context) are kept as nodes without dependencies of their own.
+    Dependencies on aliases are resolved to the aliased bean.
+    """
+
+    def __init__(self, beans: Mapping[str, "Bean"]):
+        """Build the graph.
+
+        Args:
+            beans: A dictionary mapping bean names to Bean objects
+        """
+        aliases = {
+            alias: name for name, bean in beans.items() for alias in bean.aliases
+        }
+
+        self._dependencies: Dict[str, List[str]] = {}
+        self._dependents: Dict[str, List[str]] = {}
+        for name in beans:
+            self._dependencies[name] = []
+            self._dependents[name] = []
+
+        for name, bean in beans.items():
+            seen: Set[str] = set()
+            for dependency in bean.dependencies:
+                target = aliases.get(dependency, dependency)
+                if target in seen:
+                    continue
+                seen.add(target)
+                if target not in self._dependencies:
+                    self._dependencies[target] = []
+                    self._dependents[target] = []
+                self._dependencies[name].append(target)
+                self._dependents[target].append(name)
+
+        self._components: Optional[List[List[str]]] = None
+        self._topological_order: Optional[List[str]] = None
+        self._transitive_dependencies: Dict[str, FrozenSet[str]] = {}
+        self._transitive_dependents: Dict[str, FrozenSet[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._dependencies)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._dependencies
+
+    def get_dependencies(self, name: str) -> List[str]:
+        """Get the beans a bean directly depends on.
+
+        Args:
+            name: The name of the bean
+
+        Returns:
+            A list of bean names, or an empty list if the bean doesn't exist.
+        """
+        return list(self._dependencies.get(name, []))
+
+    def get_dependents(self, name: str) -> List[str]:
+        """Get the beans that directly depend on a bean.
+
+        Args:
+            name: The name of the bean
+
+        Returns:
+            A list of bean names, or an empty list if the bean doesn't exist.
+        """
+        return list(self._dependents.get(name, []))
+
+    def get_transitive_dependencies(self, name: str) -> FrozenSet[str]:
+        """Get every bean a bean depends on, directly or indirectly.
+
+        Args:
+            name: The name of the bean
+
+        Returns:
+            A set of bean names, excluding the bean itself unless it is part of
+            a dependency cycle.
+        """
+        return self._reachable(name, self._dependencies, self._transitive_dependencies)
+
+    def get_transitive_dependents(self, name: str) -> FrozenSet[str]:
+        """Get every bean that depends on a bean, directly or indirectly.
+
+        Args:
+            name: The name of the bean
+
+        Returns:
+            A set of bean names, excluding the bean itself unless it is part of
+            a dependency cycle.
+        """
+        return self._reachable(name, self._dependents, self._transitive_dependents)
+
+    def _reachable(
+        self,
+        name: str,
+        adjacency: Dict[str, List[str]],
+        cache: Dict[str, FrozenSet[str]],
+    ) -> FrozenSet[str]:
+        cached = cache.get(name)
+        if cached is not None:
+            return cached
+
+        reached: Set[str] = set()
+        queue = deque(adjacency.get(name, []))
+        while queue:
+            current = queue.popleft()
+            if current in reached:
+                continue
+            reached.add(current)
+            known = cache.get(current)
+            if known is not None:
+                # Reuse closures computed by earlier queries
+                reached.update(known)
+                continue
+            queue.extend(adjacency[current])
+
+        result = frozenset(reached)
+        cache[name] = result
+        return result
+
+    def get_strongly_connected_components(self) -> List[List[str]]:
+        """Get the strongly connected components of the graph.
+
+        Components are returned in reverse topological order: every component
+        only depends on components that appear before it.
+
+        Returns:
+            A list of components, each a list of bean names.
+        """
+        if self._components is None:
+            self._compute_components()
+        return [list(component) for component in self._components or []]
+
+    def _compute_components(self) -> None:
+        # Iterative Tarjan, to stay clear of the recursion limit on large graphs
+        index_of: Dict[str, int] = {}
+        low_link: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+        counter = 0
+
+        for root in self._dependencies:
+            if root in index_of:
+                continue
+            work = [(root, iter(self._dependencies[root]))]
+            index_of[root] = low_link[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in index_of:
+                        index_of[child] = low_link[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self._dependencies[child])))
+                        advanced = True
+                        break
+                    if child in on_stack:
+                        low_link[node] = min(low_link[node], index_of[child])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[node])
+                if low_link[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        self._components = components
+
+    def get_cycles(self) -> List[List[str]]:
+        """Get the groups of beans that depend on each other in a cycle.
+
+        Returns:
+            A list of cycles, each a list of bean names. A bean depending on
+            itself forms a cycle of one.
+        """
+        return [
+            component
+            for component in self.get_strongly_connected_components()
+            if len(component) > 1 or component[0] in self._dependencies[component[0]]
+        ]
+
+    def get_topological_order(self) -> List[str]:
+        """Get the beans ordered so that dependencies come before dependents.
+
+        Beans within a dependency cycle are kept together in arbitrary order.
+
+        Returns:
+            A list of all bean names.
+        """
+        if self._topological_order is None:
+            # Tarjan emits components in reverse topological order of the
+            # dependents graph, i.e. dependencies first
+            self._topological_order = [
+                member
+                for component in self.get_strongly_connected_components()
+                for member in component
+            ]
+        return list(self._topological_order)
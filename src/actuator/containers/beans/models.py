@@ -1,8 +1,9 @@
 from typing import Dict, List
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from ..common.extra_base_model import ExtraBaseModel
+from .graph import BeanGraph
 
 
 class Bean(ExtraBaseModel):
@@ -33,6 +34,8 @@ class Beans(ExtraBaseModel):
 
     contexts: Dict[str, Context] = Field(default_factory=dict)
 
+    _graphs: Dict[str, BeanGraph] = PrivateAttr(default_factory=dict)
+
     def get_context_names(self) -> List[str]:
         """Get the names of all available contexts.
 
@@ -70,3 +73,22 @@ class Beans(ExtraBaseModel):
         ):
             return self.contexts[context_name].beans[bean_name]
         return None
+
+    def get_graph(self, context_name: str) -> BeanGraph | None:
+        """Get the dependency graph of the beans in a specific context.
+
+        The graph is built on first access and cached for this snapshot.
+
+        Args:
+            context_name: The name of the context
+
+        Returns:
+            The BeanGraph object, or None if the context doesn't exist.
+        """
+        if context_name not in self.contexts:
+            return None
+        graph = self._graphs.get(context_name)
+        if graph is None:
+            graph = BeanGraph(self.contexts[context_name].beans)
+            self._graphs[context_name] = graph
+        return graph
@@ -0,0 +1,40 @@
+import re
+
+_DURATION_PATTERN = re.compile(
+    r"^(?P<sign>-)?P(?:(?P<days>\d+(?:\.\d+)?)D)?"
+    r"(?:T(?:(?P<hours>-?\d+(?:\.\d+)?)H)?"
+    r"(?:(?P<minutes>-?\d+(?:\.\d+)?)M)?"
+    r"(?:(?P<seconds>-?\d+(?:\.\d+)?)S)?)?$"
+)
+
+
+def parse_duration(duration: str) -> float:
+    """Parse an ISO-8601 duration as produced by Java's Duration.toString().
+
+    Args:
+        duration: The duration string, e.g. "PT0.0150707S" or "PT1M2.5S"
+
+    Returns:
+        The duration in seconds.
+
+    Raises:
+        ValueError: If the string is not a valid ISO-8601 duration.
+    """
+    # Fast path for the common "PT<seconds>S" form used by Actuator
+    if duration.startswith("PT") and duration.endswith("S"):
+        try:
+            return float(duration[2:-1])
+        except ValueError:
+            pass
+
+    match = _DURATION_PATTERN.match(duration)
+    if match is None or duration in ("P", "PT", "-P", "-PT"):
+        raise ValueError(f"Invalid ISO-8601 duration: {duration!r}")
+
+    seconds = (
+        float(match.group("days") or 0) * 86400
+        + float(match.group("hours") or 0) * 3600
+        + float(match.group("minutes") or 0) * 60
+        + float(match.group("seconds") or 0)
+    )
+    return -seconds if match.group("sign") else seconds
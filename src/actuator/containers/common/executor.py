@@ -0,0 +1,25 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+_shared_executor: Optional[ThreadPoolExecutor] = None
+_shared_executor_lock = threading.Lock()
+
+
+def get_shared_executor() -> ThreadPoolExecutor:
+    """Get the executor shared by background work, e.g. building indexes.
+
+    The executor is created on first use and lives as long as the process, so
+    callers that do not pass their own executor share a few worker threads
+    instead of each starting a pool.
+
+    Returns:
+        A process-wide ThreadPoolExecutor.
+    """
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="actuator-background"
+            )
+        return _shared_executor
@@ -0,0 +1,188 @@
+import re
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_VARIABLE_SEGMENT = re.compile(r"^\{[^{}*:]+\}$")
+_CATCH_ALL_SEGMENT = re.compile(r"^(\*\*|\{\*[^{}]+\})$")
+
+# Matches the first "[...]" group of a mappings predicate, e.g.
+# "{GET [/actuator/loggers/{name}], produces [...]}" -> "/actuator/loggers/{name}"
+_PREDICATE_PATTERNS = re.compile(r"\[(/[^\]]*|\s*)\]")
+
+
+def split_path(path: str) -> List[str]:
+    """Split a URI path into its non-empty segments.
+
+    Args:
+        path: The path, e.g. "/actuator/metrics/jvm.memory.used"
+
+    Returns:
+        The list of path segments.
+    """
+    return [segment for segment in path.split("/") if segment]
+
+
+def get_predicate_patterns(predicate: str) -> List[str]:
+    """Extract the path patterns from an /actuator/mappings predicate.
+
+    Args:
+        predicate: The predicate, e.g. "{GET [/actuator/info], produces [...]}"
+            or a plain pattern such as "/webjars/**"
+
+    Returns:
+        A list of path patterns.
+    """
+    if predicate.startswith("/"):
+        return [predicate]
+    for group in _PREDICATE_PATTERNS.findall(predicate):
+        return [pattern.strip() or "/" for pattern in group.split("||")]
+    return []
+
+
+def template_key(template: str) -> Tuple[str, ...]:
+    """Get the key of the trie node a path pattern ends on.
+
+    Patterns that only differ in the names of whole-segment variables, such
+    as "/users/{id}" and "/users/{userId}", have the same key.
+
+    Args:
+        template: The path pattern
+
+    Returns:
+        A tuple with one item per segment.
+    """
+    segments = split_path(template)
+    key = []
+    for position, segment in enumerate(segments):
+        if _CATCH_ALL_SEGMENT.match(segment) and position == len(segments) - 1:
+            key.append("**")
+        elif segment == "*" or _VARIABLE_SEGMENT.match(segment):
+            key.append("{}")
+        elif "{" in segment or "*" in segment:
+            key.append(_segment_regex(segment).pattern)
+        else:
+            key.append(segment)
+    return tuple(key)
+
+
+def _segment_regex(segment: str) -> re.Pattern:
+    """Compile a segment mixing literals and wildcards, e.g. "{name}.json"."""
+    parts = []
+    for token in re.split(r"(\{[^{}]+\}|\*)", segment):
+        if not token:
+            continue
+        if token == "*":
+            parts.append("[^/]*")
+        elif token.startswith("{") and token.endswith("}"):
+            _, _, constraint = token[1:-1].partition(":")
+            parts.append(f"(?:{constraint})" if constraint else "[^/]+")
+        else:
+            parts.append(re.escape(token))
+    return re.compile("^" + "".join(parts) + "$")
+
+
+class _Node(Generic[T]):
+    __slots__ = ("literals", "patterns", "variable", "catch_all", "entry")
+
+    def __init__(self) -> None:
+        self.literals: Dict[str, _Node[T]] = {}
+        self.patterns: List[Tuple[re.Pattern, _Node[T]]] = []
+        self.variable: Optional[_Node[T]] = None
+        self.catch_all: Optional[Tuple[str, T]] = None
+        self.entry: Optional[Tuple[str, T]] = None
+
+
+class PathTemplateTrie(Generic[T]):
+    """Segment trie over Spring MVC style path patterns.
+
+    Supports literal segments, whole-segment variables ("{id}", "*"),
+    segments mixing literals and wildcards ("{name}.json") and trailing
+    catch-all patterns ("**", "{*path}"). Matching walks the trie one segment
+    at a time, preferring literal segments over mixed segments over
+    variables over catch-alls, and backtracks to the next preference when a
+    branch fails deeper in the path. A lookup costs O(path segments) when
+    the first branch tried matches; with backtracking it is bounded by the
+    number of trie nodes the path's segments can reach, which is still far
+    fewer than one regex per pattern.
+    """
+
+    def __init__(self) -> None:
+        self._root: _Node[T] = _Node()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, template: str, value: T) -> None:
+        """Add a path pattern to the trie.
+
+        Adding the same pattern again replaces its value. So does adding a
+        pattern with the same template_key, e.g. "/users/{userId}" after
+        "/users/{id}", since both end on the same node.
+
+        Args:
+            template: The path pattern, e.g. "/actuator/metrics/{name}"
+            value: The value returned when the pattern matches
+        """
+        node = self._root
+        segments = split_path(template)
+        for position, segment in enumerate(segments):
+            if _CATCH_ALL_SEGMENT.match(segment) and position == len(segments) - 1:
+                if node.catch_all is None:
+                    self._size += 1
+                node.catch_all = (template, value)
+                return
+            if segment == "*" or _VARIABLE_SEGMENT.match(segment):
+                if node.variable is None:
+                    node.variable = _Node()
+                node = node.variable
+            elif "{" in segment or "*" in segment:
+                regex = _segment_regex(segment)
+                for existing, child in node.patterns:
+                    if existing.pattern == regex.pattern:
+                        node = child
+                        break
+                else:
+                    child = _Node()
+                    node.patterns.append((regex, child))
+                    node = child
+            else:
+                node = node.literals.setdefault(segment, _Node())
+        if node.entry is None:
+            self._size += 1
+        node.entry = (template, value)
+
+    def match(self, path: str) -> Optional[Tuple[str, T]]:
+        """Find the most specific pattern matching a path.
+
+        Args:
+            path: The path to match, without scheme, host or query string
+
+        Returns:
+            A tuple of (pattern, value), or None if no pattern matches.
+        """
+        return self._match(self._root, split_path(path), 0)
+
+    def _match(
+        self, node: _Node[T], segments: List[str], position: int
+    ) -> Optional[Tuple[str, T]]:
+        if position == len(segments):
+            return node.entry or node.catch_all
+
+        segment = segments[position]
+        child = node.literals.get(segment)
+        if child is not None:
+            found = self._match(child, segments, position + 1)
+            if found is not None:
+                return found
+        for regex, child in node.patterns:
+            if regex.match(segment):
+                found = self._match(child, segments, position + 1)
+                if found is not None:
+                    return found
+        if node.variable is not None:
+            found = self._match(node.variable, segments, position + 1)
+            if found is not None:
+                return found
+        return node.catch_all
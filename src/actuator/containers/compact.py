@@ -0,0 +1,212 @@
+# Immutable tuple mirrors of the high-volume models, for history that keeps
+# millions of instances: a validated model also carries a __dict__, its extra
+# fields and its set fields. Repeated names are interned so they are shared.
+import sys
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .auditevents import AuditEvent
+from .httpexchanges import HttpExchange
+from .metrics import Measurement, Tag
+from .startup import Event
+from .threaddump import StackTraceElement
+
+_intern = sys.intern
+
+
+def _intern_optional(value: Optional[str]) -> Optional[str]:
+    return _intern(value) if value is not None else None
+
+
+class CompactMeasurement(NamedTuple):
+    """A metric measurement."""
+
+    statistic: str
+    value: float
+
+
+class CompactTag(NamedTuple):
+    """An available tag of a metric and its values."""
+
+    tag: str
+    values: Tuple[str, ...]
+
+
+class CompactStackFrame(NamedTuple):
+    """A stack trace element of a thread dump."""
+
+    class_name: str
+    method_name: str
+    file_name: Optional[str]
+    line_number: int
+    native_method: bool
+    module_name: Optional[str] = None
+    module_version: Optional[str] = None
+
+
+class CompactExchange(NamedTuple):
+    """An HTTP exchange; the headers dictionaries are shared, not copied."""
+
+    timestamp: datetime
+    method: str
+    uri: str
+    status: int
+    time_taken: float
+    request_headers: Dict[str, List[str]]
+    response_headers: Dict[str, List[str]]
+
+
+class CompactAuditEvent(NamedTuple):
+    """An audit event; data holds every field of the event data."""
+
+    timestamp: datetime
+    principal: str
+    type: str
+    data: Dict[str, Any]
+
+
+class CompactEvent(NamedTuple):
+    """A startup step event."""
+
+    id: int
+    parent_id: Optional[int]
+    name: str
+    start_time: datetime
+    end_time: datetime
+    duration: float
+    tags: Tuple[Tuple[str, str], ...]
+
+
+def compact_measurement(measurement: Measurement) -> CompactMeasurement:
+    """Convert a Measurement.
+
+    Args:
+        measurement: The Measurement
+
+    Returns:
+        The CompactMeasurement.
+    """
+    return CompactMeasurement(_intern(measurement.statistic), measurement.value)
+
+
+def compact_tag(tag: Tag) -> CompactTag:
+    """Convert a metric Tag.
+
+    Args:
+        tag: The Tag
+
+    Returns:
+        The CompactTag.
+    """
+    return CompactTag(_intern(tag.tag), tuple(tag.values))
+
+
+def compact_stack_frame(element: StackTraceElement) -> CompactStackFrame:
+    """Convert a StackTraceElement.
+
+    Args:
+        element: The StackTraceElement
+
+    Returns:
+        The CompactStackFrame.
+    """
+    return CompactStackFrame(
+        _intern(element.class_name),
+        _intern(element.method_name),
+        _intern_optional(element.file_name),
+        element.line_number,
+        element.native_method,
+        _intern_optional(element.module_name),
+        _intern_optional(element.module_version),
+    )
+
+
+def compact_exchange(exchange: HttpExchange) -> CompactExchange:
+    """Convert an HttpExchange, parsing its time taken.
+
+    Args:
+        exchange: The HttpExchange
+
+    Returns:
+        The CompactExchange, with time_taken in seconds.
+    """
+    request = exchange.request
+    response = exchange.response
+    return CompactExchange(
+        exchange.timestamp,
+        _intern(request.method),
+        request.uri,
+        response.status,
+        exchange.get_time_taken_seconds(),
+        request.headers,
+        response.headers,
+    )
+
+
+def compact_audit_event(event: AuditEvent) -> CompactAuditEvent:
+    """Convert an AuditEvent.
+
+    Args:
+        event: The AuditEvent
+
+    Returns:
+        The CompactAuditEvent.
+    """
+    return CompactAuditEvent(
+        event.timestamp,
+        _intern(event.principal),
+        _intern(event.type),
+        event.data.model_dump(),
+    )
+
+
+def compact_event(event: Event) -> CompactEvent:
+    """Convert a startup Event.
+
+    Args:
+        event: The Event
+
+    Returns:
+        The CompactEvent, with the duration in seconds.
+    """
+    step = event.startup_step
+    return CompactEvent(
+        step.id,
+        step.parent_id,
+        _intern(step.name),
+        event.start_time,
+        event.end_time,
+        event.get_duration_seconds(),
+        tuple((_intern(tag.key), tag.value) for tag in step.tags),
+    )
+
+
+def compact_measurements(
+    measurements: Iterable[Measurement],
+) -> List[CompactMeasurement]:
+    """Convert measurements in bulk.
+
+    Args:
+        measurements: The Measurement objects
+
+    Returns:
+        A list of CompactMeasurement objects, in the same order.
+    """
+    return [
+        CompactMeasurement(_intern(measurement.statistic), measurement.value)
+        for measurement in measurements
+    ]
+
+
+def compact_stack_trace(
+    elements: Iterable[StackTraceElement],
+) -> Tuple[CompactStackFrame, ...]:
+    """Convert a thread's stack trace.
+
+    Args:
+        elements: The StackTraceElement objects, innermost first
+
+    Returns:
+        A tuple of CompactStackFrame objects, in the same order.
+    """
+    return tuple(compact_stack_frame(element) for element in elements)
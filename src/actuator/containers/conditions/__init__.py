@@ -1,3 +1,19 @@
 from .models import Conditions, Context, ConditionEvaluation
+from .analyzer import (
+    ConditionRecord,
+    ConditionsAnalysis,
+    ConfigurationCost,
+    get_referenced_classes,
+    get_referenced_properties,
+)
 
-__all__ = ["Conditions", "Context", "ConditionEvaluation"]
+__all__ = [
+    "Conditions",
+    "Context",
+    "ConditionEvaluation",
+    "ConditionRecord",
+    "ConditionsAnalysis",
+    "ConfigurationCost",
+    "get_referenced_classes",
+    "get_referenced_properties",
+]
@@ -0,0 +1,289 @@
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
+
+from ..startup.analyzer import BEAN_INSTANTIATION_STEP
+
+if TYPE_CHECKING:
+    from ..startup import Startup
+    from .models import Conditions
+
+_CLASS_PATTERN = re.compile(r"\b(?:[a-z_][\w]*\.)+[A-Z][\w$]*")
+_PROPERTY_LIST_PATTERN = re.compile(r"@ConditionalOn\w*Property \(([^)]*)\)")
+_QUOTED_PROPERTY_PATTERN = re.compile(r"'([\w.\-\[\]]+)' property")
+
+
+def get_referenced_classes(message: str) -> Set[str]:
+    """Extract the fully qualified class names mentioned in a condition message.
+
+    Args:
+        message: The condition message, e.g. "@ConditionalOnClass found
+            required class 'org.springframework.cache.CacheManager'"
+
+    Returns:
+        A set of class names.
+    """
+    return set(_CLASS_PATTERN.findall(message))
+
+
+def get_referenced_properties(message: str) -> Set[str]:
+    """Extract the property names mentioned in a condition message.
+
+    Args:
+        message: The condition message, e.g. "@ConditionalOnProperty
+            (spring.jmx.enabled=true) matched"
+
+    Returns:
+        A set of property names.
+    """
+    properties = set()
+    for names in _PROPERTY_LIST_PATTERN.findall(message):
+        for name in names.split(","):
+            name = name.split("=", 1)[0].strip()
+            if name:
+                properties.add(name)
+    properties.update(_QUOTED_PROPERTY_PATTERN.findall(message))
+    return properties
+
+
+def get_configuration_class(configuration: str) -> str:
+    """Get the class of a configuration key from the conditions report.
+
+    Args:
+        configuration: The key, e.g. "AopAutoConfiguration",
+            "WebMvcAutoConfiguration.EnableWebMvcConfiguration" or
+            "JacksonAutoConfiguration#jsonComponentModule"
+
+    Returns:
+        The simple class name, with nested classes separated by ".".
+    """
+    return configuration.split("#", 1)[0]
+
+
+def _simple_class_name(class_name: str) -> str:
+    # "org.example.Outer$Inner" -> "Outer.Inner"
+    return class_name.rsplit(".", 1)[-1].replace("$", ".")
+
+
+@dataclass(frozen=True)
+class ConditionRecord:
+    """One condition evaluated for a configuration."""
+
+    context: str
+    configuration: str
+    condition: str
+    message: str
+    matched: bool
+
+
+@dataclass
+class ConfigurationCost:
+    """Startup time spent creating the beans of an auto-configuration."""
+
+    configuration: str
+    time: float
+    beans: List[str]
+
+
+class ConditionsAnalysis:
+    """Indexes over a conditions report.
+
+    Every condition evaluation is indexed by condition type (OnClassCondition,
+    OnBeanCondition, ...), by the classes and properties its message refers
+    to, and by configuration, so "why is this auto-configuration not active"
+    and "what depends on this property" are dictionary lookups.
+    """
+
+    def __init__(self, conditions: "Conditions"):
+        """Build the indexes.
+
+        Args:
+            conditions: The /actuator/conditions snapshot
+        """
+        self.records: List[ConditionRecord] = []
+        self._by_condition: Dict[str, List[ConditionRecord]] = {}
+        self._by_class: Dict[str, List[ConditionRecord]] = {}
+        self._by_property: Dict[str, List[ConditionRecord]] = {}
+        self._by_configuration: Dict[str, List[ConditionRecord]] = {}
+        self._positive: Set[str] = set()
+
+        for context_name, context in conditions.contexts.items():
+            for configuration, evaluations in context.positive_matches.items():
+                self._positive.add(configuration)
+                self._add(context_name, configuration, evaluations, True)
+            for configuration, evaluations in context.negative_matches.items():
+                self._add(context_name, configuration, evaluations, False)
+                self._add(
+                    context_name,
+                    configuration,
+                    context.partial_matches.get(configuration, []),
+                    True,
+                )
+
+    def _add(
+        self,
+        context_name: str,
+        configuration: str,
+        evaluations: Iterable,
+        matched: bool,
+    ) -> None:
+        self._by_configuration.setdefault(configuration, [])
+        for evaluation in evaluations:
+            record = ConditionRecord(
+                context_name,
+                configuration,
+                evaluation.condition,
+                evaluation.message,
+                matched,
+            )
+            self.records.append(record)
+            self._by_configuration[configuration].append(record)
+            self._by_condition.setdefault(evaluation.condition, []).append(record)
+            for class_name in get_referenced_classes(evaluation.message):
+                self._by_class.setdefault(class_name, []).append(record)
+                simple_name = _simple_class_name(class_name)
+                if simple_name != class_name:
+                    self._by_class.setdefault(simple_name, []).append(record)
+            for name in get_referenced_properties(evaluation.message):
+                self._by_property.setdefault(name, []).append(record)
+
+    def get_condition_types(self) -> Dict[str, int]:
+        """Get the number of evaluations of each condition type.
+
+        Returns:
+            A dictionary mapping condition types to counts, most common first.
+        """
+        counts = {
+            condition: len(records) for condition, records in self._by_condition.items()
+        }
+        return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+
+    def get_by_condition(
+        self, condition: str, matched: Optional[bool] = None
+    ) -> List[ConditionRecord]:
+        """Get the evaluations of a condition type.
+
+        Args:
+            condition: The condition type, e.g. "OnClassCondition"
+            matched: Only return matched (True) or unmatched (False) conditions
+
+        Returns:
+            A list of ConditionRecord objects.
+        """
+        return [
+            record
+            for record in self._by_condition.get(condition, [])
+            if matched is None or record.matched == matched
+        ]
+
+    def get_by_class(self, class_name: str) -> List[ConditionRecord]:
+        """Get the evaluations that refer to a class.
+
+        Args:
+            class_name: A fully qualified name, e.g.
+                "org.springframework.cache.CacheManager", or a simple name
+                such as "CacheManager"
+
+        Returns:
+            A list of ConditionRecord objects.
+        """
+        return list(self._by_class.get(class_name, []))
+
+    def get_by_property(self, name: str) -> List[ConditionRecord]:
+        """Get the evaluations that refer to a property.
+
+        Args:
+            name: The property name, e.g. "spring.jmx.enabled"
+
+        Returns:
+            A list of ConditionRecord objects.
+        """
+        return list(self._by_property.get(name, []))
+
+    def find_configurations(self, text: str) -> List[str]:
+        """Find configurations whose name contains some text.
+
+        Args:
+            text: Case-insensitive text, e.g. "datasource"
+
+        Returns:
+            A sorted list of configuration names.
+        """
+        lower_text = text.lower()
+        return sorted(
+            configuration
+            for configuration in self._by_configuration
+            if lower_text in configuration.lower()
+        )
+
+    def is_active(self, configuration: str) -> bool:
+        """Check whether a configuration matched its conditions.
+
+        Args:
+            configuration: The configuration name
+
+        Returns:
+            True if the configuration is a positive match.
+        """
+        return configuration in self._positive
+
+    def explain(self, configuration: str) -> List[ConditionRecord]:
+        """Get every condition evaluated for a configuration.
+
+        For a configuration that did not match, the unmatched conditions come
+        first: they are why it is not active.
+
+        Args:
+            configuration: The configuration name
+
+        Returns:
+            A list of ConditionRecord objects.
+        """
+        records = self._by_configuration.get(configuration, [])
+        return sorted(records, key=lambda record: record.matched)
+
+    def get_configuration_costs(
+        self, startup: "Startup", limit: Optional[int] = None
+    ) -> List[ConfigurationCost]:
+        """Estimate the startup time spent on each active configuration.
+
+        The cost of a configuration is the self time of instantiating its own
+        class plus the self time of the beans created by its @Bean methods
+        that are listed in the report (keys such as "Config#beanName").
+
+        Args:
+            startup: The /actuator/startup snapshot of the same run
+            limit: Maximum number of configurations (default: all)
+
+        Returns:
+            A list of ConfigurationCost objects, most expensive first.
+        """
+        steps_by_class: Dict[str, List] = {}
+        steps_by_bean: Dict[str, List] = {}
+        for node in startup.get_analysis().get_nodes(BEAN_INSTANTIATION_STEP):
+            bean_type = node.get_tag("beanType")
+            if bean_type:
+                steps_by_class.setdefault(_simple_class_name(bean_type), []).append(
+                    node
+                )
+            bean_name = node.get_tag("beanName")
+            if bean_name:
+                steps_by_bean.setdefault(bean_name, []).append(node)
+
+        costs: Dict[str, ConfigurationCost] = {}
+        for configuration in self._positive:
+            class_name = get_configuration_class(configuration)
+            if "#" in configuration:
+                nodes = steps_by_bean.get(configuration.split("#", 1)[1], [])
+            else:
+                nodes = steps_by_class.get(class_name, [])
+            if not nodes:
+                continue
+            cost = costs.setdefault(class_name, ConfigurationCost(class_name, 0.0, []))
+            for node in nodes:
+                cost.time += node.self_time
+                cost.beans.append(node.get_tag("beanName") or node.name)
+
+        ranked = sorted(costs.values(), key=lambda cost: cost.time, reverse=True)
+        return ranked[:limit] if limit is not None else ranked
+
@@ -1,8 +1,11 @@
-from typing import Dict, List
+from concurrent.futures import Executor, Future
+from typing import Any, Dict, List, Optional
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr, model_validator
 
 from ..common.extra_base_model import ExtraBaseModel
+from ..common.executor import get_shared_executor
+from .analyzer import ConditionsAnalysis
 
 
 class ConditionEvaluation(ExtraBaseModel):
@@ -17,6 +20,10 @@ class Context(ExtraBaseModel):
 
     The positive_matches and negative_matches dictionaries map class names to lists of
     ConditionEvaluation objects. The keys are class names like 'BeansEndpointAutoConfiguration'.
+
+    Actuator reports each negative match as {"notMatched": [...], "matched": [...]}:
+    negative_matches keeps the conditions that did not match, and partial_matches the
+    conditions of the same configurations that did.
     """
 
     positive_matches: Dict[str, List[ConditionEvaluation]] = Field(
@@ -25,10 +32,38 @@ class Context(ExtraBaseModel):
     negative_matches: Dict[str, List[ConditionEvaluation]] = Field(
         default_factory=dict, alias="negativeMatches"
     )
+    partial_matches: Dict[str, List[ConditionEvaluation]] = Field(
+        default_factory=dict, alias="partialMatches"
+    )
     unconditional_classes: List[str] = Field(
         default_factory=list, alias="unconditionalClasses"
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def _split_negative_matches(cls, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        negative_matches = data.get("negativeMatches")
+        if not isinstance(negative_matches, dict) or not any(
+            isinstance(outcome, dict) for outcome in negative_matches.values()
+        ):
+            return data
+        not_matched = {}
+        partial_matches = dict(data.get("partialMatches", {}))
+        for configuration, outcome in negative_matches.items():
+            if isinstance(outcome, dict):
+                not_matched[configuration] = outcome.get("notMatched", [])
+                if outcome.get("matched"):
+                    partial_matches[configuration] = outcome["matched"]
+            else:
+                not_matched[configuration] = outcome
+        return {
+            **data,
+            "negativeMatches": not_matched,
+            "partialMatches": partial_matches,
+        }
+
     def get_positive_configurations(self) -> List[str]:
         """Get the names of all positively matched configurations.
 
@@ -79,6 +114,7 @@ class Conditions(ExtraBaseModel):
     """
 
     contexts: Dict[str, Context] = Field(default_factory=dict)
+    _analysis: Optional[ConditionsAnalysis] = PrivateAttr(default=None)
 
     def get_context_names(self) -> List[str]:
         """Get the names of all contexts.
@@ -98,3 +134,33 @@ class Conditions(ExtraBaseModel):
             The Context object, or None if not found.
         """
         return self.contexts.get(context_name)
+
+    def get_analysis(self) -> ConditionsAnalysis:
+        """Get the indexes over the condition evaluations of every context.
+
+        The analysis is built on first access and cached for this snapshot.
+        Threads racing on the first access may each build one; they are
+        equivalent and the first one stored is kept.
+
+        Returns:
+            The ConditionsAnalysis object.
+        """
+        if self._analysis is None:
+            analysis = ConditionsAnalysis(self)
+            if self._analysis is None:
+                self._analysis = analysis
+        return self._analysis
+
+    def get_analysis_async(
+        self, executor: Optional[Executor] = None
+    ) -> "Future[ConditionsAnalysis]":
+        """Build the analysis on a worker thread.
+
+        Args:
+            executor: The executor to use (default: an executor shared by all
+                snapshots)
+
+        Returns:
+            A Future resolving to the ConditionsAnalysis.
+        """
+        return (executor or get_shared_executor()).submit(self.get_analysis)
@@ -0,0 +1,15 @@
+from .models import (
+    ConfigProps,
+    ConfigPropsContext,
+    ConfigPropsBean,
+    ConfigProperty,
+    flatten_properties,
+)
+
+__all__ = [
+    "ConfigProps",
+    "ConfigPropsContext",
+    "ConfigPropsBean",
+    "ConfigProperty",
+    "flatten_properties",
+]
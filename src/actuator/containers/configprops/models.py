@@ -0,0 +1,219 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import Field, PrivateAttr
+
+from ..common.extra_base_model import ExtraBaseModel
+
+
+def flatten_properties(prefix: str, value: Any) -> Iterator[Tuple[str, Any]]:
+    """Flatten a nested properties tree into dotted keys.
+
+    Lists and empty objects are leaves, so a bean without any property is
+    still reported under its prefix.
+
+    Args:
+        prefix: The key of the tree, e.g. "spring.datasource"
+        value: The tree
+
+    Yields:
+        Tuples of (dotted key, leaf value).
+    """
+    stack = [(prefix, value)]
+    while stack:
+        key, current = stack.pop()
+        if isinstance(current, dict) and current:
+            for name, child in reversed(current.items()):
+                stack.append((f"{key}.{name}" if key else name, child))
+        else:
+            yield key, current
+
+
+def _get_path(tree: Dict[str, Any], path: str) -> Any:
+    node: Any = tree
+    for segment in path.split(".") if path else []:
+        if not isinstance(node, dict) or segment not in node:
+            return None
+        node = node[segment]
+    return node
+
+
+@dataclass(frozen=True)
+class ConfigProperty:
+    """A leaf of the flattened configuration properties index."""
+
+    key: str
+    value: Any
+    bean: str
+    context: str
+
+
+class ConfigPropsBean(ExtraBaseModel):
+    """A @ConfigurationProperties bean.
+
+    The properties and inputs trees are kept as the parsed JSON and only
+    walked when a value is requested, so loading a large report and listing
+    its prefixes does not pay for the nested values.
+    """
+
+    prefix: str
+    properties: Dict[str, Any] = Field(default_factory=dict)
+    inputs: Dict[str, Any] = Field(default_factory=dict)
+
+    _flattened: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    def get_property(self, path: str) -> Any:
+        """Get a value or subtree of the properties.
+
+        Args:
+            path: The dotted path relative to the prefix, e.g. "hikari.maxPoolSize"
+
+        Returns:
+            The value, a dictionary for a subtree, or None if not found.
+        """
+        return _get_path(self.properties, path)
+
+    def get_input(self, path: str) -> Optional[Dict[str, Any]]:
+        """Get the input a property was bound from.
+
+        Args:
+            path: The dotted path relative to the prefix
+
+        Returns:
+            A dictionary with the "value" and "origin" of the input, or None
+            if the property was not bound from any property source.
+        """
+        node = _get_path(self.inputs, path)
+        return node if isinstance(node, dict) and "value" in node else None
+
+    def get_flattened(self) -> Dict[str, Any]:
+        """Get the properties as dotted keys, flattening them on first use.
+
+        Returns:
+            A dictionary mapping full property keys, e.g.
+            "spring.datasource.hikari.maxPoolSize", to leaf values.
+        """
+        if self._flattened is None:
+            self._flattened = dict(flatten_properties(self.prefix, self.properties))
+        return self._flattened
+
+
+class ConfigPropsContext(ExtraBaseModel):
+    """An application context in the /actuator/configprops response.
+
+    The beans dictionary maps bean names to ConfigPropsBean objects.
+    """
+
+    beans: Dict[str, ConfigPropsBean] = Field(default_factory=dict)
+    parent_id: Optional[str] = Field(default=None, alias="parentId")
+
+
+class ConfigProps(ExtraBaseModel):
+    """Container for the @ConfigurationProperties beans of an application.
+
+    The contexts dictionary maps context names to ConfigPropsContext objects.
+    Listing prefixes and beans only reads the top level of the report; the
+    flattened index of every property key is built on the first search.
+    """
+
+    contexts: Dict[str, ConfigPropsContext] = Field(default_factory=dict)
+
+    _index: Optional[List[ConfigProperty]] = PrivateAttr(default=None)
+    _keys: Optional[List[str]] = PrivateAttr(default=None)
+
+    def get_prefixes(self) -> List[str]:
+        """Get the prefixes of every bean.
+
+        Returns:
+            A sorted list of distinct prefixes.
+        """
+        return sorted(
+            {
+                bean.prefix
+                for context in self.contexts.values()
+                for bean in context.beans.values()
+            }
+        )
+
+    def get_beans(self, prefix: Optional[str] = None) -> Dict[str, ConfigPropsBean]:
+        """Get the beans, optionally only those bound under a prefix.
+
+        Args:
+            prefix: A prefix such as "spring.datasource"; beans whose prefix
+                equals it or is nested under it match
+
+        Returns:
+            A dictionary mapping bean names to ConfigPropsBean objects.
+        """
+        beans = {}
+        for context in self.contexts.values():
+            for name, bean in context.beans.items():
+                if (
+                    prefix is None
+                    or bean.prefix == prefix
+                    or bean.prefix.startswith(prefix + ".")
+                ):
+                    beans[name] = bean
+        return beans
+
+    def get_index(self) -> List[ConfigProperty]:
+        """Get every property leaf, building the index on first use.
+
+        Returns:
+            A list of ConfigProperty objects sorted by key.
+        """
+        if self._index is None:
+            index = [
+                ConfigProperty(key, value, bean_name, context_name)
+                for context_name, context in self.contexts.items()
+                for bean_name, bean in context.beans.items()
+                for key, value in bean.get_flattened().items()
+            ]
+            index.sort(key=lambda entry: entry.key)
+            self._keys = [entry.key for entry in index]
+            self._index = index
+        return self._index
+
+    def find_by_prefix(self, prefix: str) -> List[ConfigProperty]:
+        """Get the properties whose key starts with some text.
+
+        Args:
+            prefix: The start of the keys, e.g. "spring.datasource.hik"
+
+        Returns:
+            A list of ConfigProperty objects sorted by key.
+        """
+        index = self.get_index()
+        position = bisect_left(self._keys, prefix)
+        matches = []
+        while position < len(index) and self._keys[position].startswith(prefix):
+            matches.append(index[position])
+            position += 1
+        return matches
+
+    def search(self, text: str) -> List[ConfigProperty]:
+        """Find the properties whose key contains some text.
+
+        Args:
+            text: Case-insensitive text, e.g. "poolsize"
+
+        Returns:
+            A list of ConfigProperty objects sorted by key.
+        """
+        lower_text = text.lower()
+        return [entry for entry in self.get_index() if lower_text in entry.key.lower()]
+
+    def get_value(self, key: str) -> Any:
+        """Get the value of a property by its full key.
+
+        Args:
+            key: The key, e.g. "spring.datasource.url"
+
+        Returns:
+            The value, or None if not found.
+        """
+        for entry in self.find_by_prefix(key):
+            if entry.key == key:
+                return entry.value
+        return None
@@ -1,3 +1,19 @@
 from .models import Env, PropertySource, PropertyValue
+from .resolver import (
+    PropertyOrigin,
+    ResolvedProperty,
+    canonical_property_name,
+    is_environment_source,
+    resolve_properties,
+)
 
-__all__ = ["Env", "PropertySource", "PropertyValue"]
+__all__ = [
+    "Env",
+    "PropertySource",
+    "PropertyValue",
+    "PropertyOrigin",
+    "ResolvedProperty",
+    "canonical_property_name",
+    "is_environment_source",
+    "resolve_properties",
+]
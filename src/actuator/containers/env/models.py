@@ -1,8 +1,14 @@
 from typing import Dict, List, Any, Optional
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from ..common.extra_base_model import ExtraBaseModel
+from .resolver import (
+    ResolvedProperty,
+    canonical_property_name,
+    is_environment_source,
+    resolve_properties,
+)
 
 
 class PropertyValue(ExtraBaseModel):
@@ -59,6 +65,8 @@ class Env(ExtraBaseModel):
         default_factory=list, alias="propertySources"
     )
 
+    _resolved: Optional[Dict[str, ResolvedProperty]] = PrivateAttr(default=None)
+
     def get_property_source_names(self) -> List[str]:
         """Get the names of all property sources.
 
@@ -97,3 +105,70 @@ class Env(ExtraBaseModel):
             if property_value:
                 results.append((source.name, property_value))
         return results
+
+    def get_resolved_properties(self) -> Dict[str, ResolvedProperty]:
+        """Get the effective value of every property.
+
+        The map is built once per snapshot: the first property source defining
+        a property wins, and values from later sources are kept as shadowed.
+        Keys are canonical relaxed-binding names (see canonical_property_name).
+
+        Returns:
+            A dictionary mapping canonical property names to ResolvedProperty objects.
+        """
+        if self._resolved is None:
+            self._resolved = resolve_properties(self.property_sources)
+        return self._resolved
+
+    def get_effective_property(self, property_name: str) -> ResolvedProperty | None:
+        """Get the effective definition of a property.
+
+        The name is matched using relaxed binding, so "server.port" also finds
+        SERVER_PORT from the system environment. A name written as an
+        environment variable, such as SERVER_PORT, only finds properties that
+        the system environment defines.
+
+        Args:
+            property_name: The name of the property
+
+        Returns:
+            The ResolvedProperty object, or None if no source defines the property.
+        """
+        resolved = self.get_resolved_properties()
+        result = resolved.get(canonical_property_name(property_name))
+        if result is None:
+            # Underscores only separate elements in environment variables
+            result = resolved.get(canonical_property_name(property_name, True))
+            if result is not None and not any(
+                is_environment_source(origin.source) for origin in result.get_origins()
+            ):
+                result = None
+        return result
+
+    def get_effective_value(self, property_name: str) -> Any:
+        """Get the effective value of a property.
+
+        Args:
+            property_name: The name of the property
+
+        Returns:
+            The property value, or None if no source defines the property.
+        """
+        resolved = self.get_effective_property(property_name)
+        return resolved.value.value if resolved else None
+
+    def get_source_overrides(self) -> Dict[str, Dict[str, List[str]]]:
+        """Get which property sources override which.
+
+        Returns:
+            A dictionary mapping each overriding source name to a dictionary that
+            maps each overridden source name to the names of the properties it
+            loses, as named in the overridden source.
+        """
+        overrides: Dict[str, Dict[str, List[str]]] = {}
+        for resolved in self.get_resolved_properties().values():
+            for shadowed in resolved.shadowed:
+                overrides.setdefault(resolved.source, {}).setdefault(
+                    shadowed.source, []
+                ).append(shadowed.name)
+        return overrides
@@ -0,0 +1,106 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+if TYPE_CHECKING:
+    from .models import PropertySource, PropertyValue
+
+SYSTEM_ENVIRONMENT = "systemEnvironment"
+
+
+def is_environment_source(source_name: str) -> bool:
+    """Check whether a property source holds system environment variables.
+
+    Args:
+        source_name: The name of the property source
+
+    Returns:
+        True for "systemEnvironment" and its variants (e.g. the
+        "systemEnvironment" sources of a Spring Cloud bootstrap context).
+    """
+    return source_name.startswith(SYSTEM_ENVIRONMENT)
+
+
+def canonical_property_name(name: str, from_environment: bool = False) -> str:
+    """Normalize a property name following Spring Boot relaxed binding.
+
+    Names are lowercased and dashes are dropped, so "server.max-http-header-size",
+    "server.maxHttpHeaderSize" and "SERVER_MAXHTTPHEADERSIZE" all share one
+    canonical form. Underscores separate elements only in environment variables.
+
+    Args:
+        name: The property name as it appears in its property source
+        from_environment: Whether the name comes from the system environment
+
+    Returns:
+        The canonical property name.
+    """
+    canonical = name.lower().replace("-", "")
+    if from_environment:
+        canonical = canonical.replace("_", ".")
+    return canonical
+
+
+@dataclass
+class PropertyOrigin:
+    """A property as defined by a single property source."""
+
+    source: str
+    name: str
+    value: "PropertyValue"
+
+
+@dataclass
+class ResolvedProperty:
+    """The effective value of a property and the values it shadows."""
+
+    effective: PropertyOrigin
+    shadowed: List[PropertyOrigin] = field(default_factory=list)
+
+    def get_origins(self) -> List[PropertyOrigin]:
+        """Get every definition of the property.
+
+        Returns:
+            The effective definition followed by the shadowed ones.
+        """
+        return [self.effective, *self.shadowed]
+
+    @property
+    def name(self) -> str:
+        return self.effective.name
+
+    @property
+    def source(self) -> str:
+        return self.effective.source
+
+    @property
+    def value(self) -> "PropertyValue":
+        return self.effective.value
+
+
+def resolve_properties(
+    property_sources: Iterable["PropertySource"],
+) -> Dict[str, ResolvedProperty]:
+    """Resolve the effective value of every property by source precedence.
+
+    Property sources are expected in precedence order, as returned by
+    /actuator/env: the first source defining a property wins, and the values
+    from later sources are kept as shadowed.
+
+    Args:
+        property_sources: The property sources, highest precedence first
+
+    Returns:
+        A dictionary mapping canonical property names to ResolvedProperty objects.
+    """
+    resolved: Dict[str, ResolvedProperty] = {}
+    for source in property_sources:
+        from_environment = is_environment_source(source.name)
+        for name, value in source.properties.items():
+            origin = PropertyOrigin(source.name, name, value)
+            key = canonical_property_name(name, from_environment)
+            existing = resolved.get(key)
+            if existing is None:
+                resolved[key] = ResolvedProperty(origin)
+            else:
+                existing.shadowed.append(origin)
+    return resolved
@@ -1,17 +1,29 @@
 from .health_check import HealthCheck
+from .composite_component import (
+    CompositeComponent,
+    parse_component,
+    register_component_type,
+)
 from .components import Component
 from .ping_component import PingComponent
 from .disk_space_component import DiskSpaceComponent
 from .disk_space_details import DiskSpaceDetails
 from .ssl_component import SslComponent
 from .ssl_details import SslDetails
+from .certificate_chain import CertificateChain, CertificateInfo, CertificateValidity
 
 __all__ = [
     "HealthCheck",
+    "CompositeComponent",
+    "parse_component",
+    "register_component_type",
     "Component",
     "PingComponent",
     "DiskSpaceComponent",
     "DiskSpaceDetails",
     "SslComponent",
     "SslDetails",
+    "CertificateChain",
+    "CertificateInfo",
+    "CertificateValidity",
 ]
@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common.extra_base_model import ExtraBaseModel
+
+
+class CertificateValidity(ExtraBaseModel):
+    status: str
+    message: Optional[str] = None
+
+
+class CertificateInfo(ExtraBaseModel):
+    subject: Optional[str] = None
+    issuer: Optional[str] = None
+    serial_number: Optional[str] = Field(default=None, alias="serialNumber")
+    version: Optional[str] = None
+    signature_algorithm_name: Optional[str] = Field(
+        default=None, alias="signatureAlgorithmName"
+    )
+    validity_starts: Optional[datetime] = Field(default=None, alias="validityStarts")
+    validity_ends: Optional[datetime] = Field(default=None, alias="validityEnds")
+    validity: Optional[CertificateValidity] = None
+
+    def get_days_to_expiry(self, now: Optional[datetime] = None) -> Optional[float]:
+        """Get the number of days until the certificate expires.
+
+        Args:
+            now: The reference time (default: now, in UTC)
+
+        Returns:
+            The number of days, negative if the certificate has expired, or
+            None if the end of validity is unknown.
+        """
+        if self.validity_ends is None:
+            return None
+        now = now or datetime.now(timezone.utc)
+        return (self.validity_ends - now).total_seconds() / 86400
+
+
+class CertificateChain(ExtraBaseModel):
+    alias: Optional[str] = None
+    certificates: List[CertificateInfo] = Field(default_factory=list)
+
+    def get_expiry(self) -> Optional[datetime]:
+        """Get when the chain stops being valid.
+
+        Returns:
+            The earliest end of validity of its certificates, or None if none
+            is known.
+        """
+        ends = [
+            certificate.validity_ends
+            for certificate in self.certificates
+            if certificate.validity_ends is not None
+        ]
+        return min(ends) if ends else None
@@ -0,0 +1,104 @@
+from typing import Any, Dict, List, Optional, Type
+
+from pydantic import Field, PrivateAttr
+
+from .components import Component
+from .ping_component import PingComponent
+from .disk_space_component import DiskSpaceComponent
+from .ssl_component import SslComponent
+
+# Component types by component key
+_COMPONENT_TYPES: Dict[str, Type[Component]] = {
+    "ping": PingComponent,
+    "diskSpace": DiskSpaceComponent,
+    "ssl": SslComponent,
+}
+
+
+def register_component_type(key: str, component_type: Type[Component]) -> None:
+    """Register the model used to parse health components with a key.
+
+    Args:
+        key: The component key, e.g. "db"
+        component_type: The Component subclass to parse it with
+    """
+    _COMPONENT_TYPES[key] = component_type
+
+
+def parse_component(key: str, data: Any) -> Any:
+    """Parse a health component with the type matching its key and shape.
+
+    Components that contain components of their own (e.g. "db" with several
+    datasources) are parsed as CompositeComponent, other components with the
+    type registered for their key, or as a generic Component.
+
+    Args:
+        key: The component key
+        data: The component, as parsed from JSON
+
+    Returns:
+        The component model, or the data unchanged if it is not a dictionary.
+    """
+    if not isinstance(data, dict):
+        return data
+    if "components" in data:
+        return CompositeComponent.model_validate(data)
+    return _COMPONENT_TYPES.get(key, Component).model_validate(data)
+
+
+class CompositeComponent(Component[None]):
+    """A health component made of nested components.
+
+    Nested components are kept as parsed from JSON and only turned into
+    models when accessed, so polling the health of many servers only pays for
+    the top-level statuses.
+    """
+
+    components: Dict[str, Any] = Field(default_factory=dict)
+    _parsed: Dict[str, Component] = PrivateAttr(default_factory=dict)
+
+    def get_names(self) -> List[str]:
+        """Get the names of the nested components.
+
+        Returns:
+            A list of component names.
+        """
+        return list(self.components)
+
+    def get_component(self, name: str) -> Optional[Component]:
+        """Get a nested component, parsing it on first access.
+
+        Args:
+            name: The name of the nested component, e.g. "primary"
+
+        Returns:
+            The component, or None if there is no component with that name.
+        """
+        component = self._parsed.get(name)
+        if component is None and name in self.components:
+            component = parse_component(name, self.components[name])
+            self._parsed[name] = component
+        return component
+
+    def get_components(self) -> Dict[str, Component]:
+        """Get every nested component, parsing those not accessed yet.
+
+        Returns:
+            A dictionary mapping names to components.
+        """
+        return {name: self.get_component(name) for name in self.components}
+
+    def get_status(self, name: str) -> Optional[str]:
+        """Get the status of a nested component without parsing it.
+
+        Args:
+            name: The name of the nested component
+
+        Returns:
+            The status, or None if there is no component with that name.
+        """
+        component = self._parsed.get(name)
+        if component is not None:
+            return component.status
+        data = self.components.get(name)
+        return data.get("status") if isinstance(data, dict) else None
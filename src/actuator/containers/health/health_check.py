@@ -1,28 +1,46 @@
-from typing import Dict, Any, Type
-from pydantic import Field
+from typing import Any, Dict, List, Optional
+
+from pydantic import Field, SerializeAsAny, field_validator
 
 from ..common.extra_base_model import ExtraBaseModel
 from .components import Component
-from .ping_component import PingComponent
-from .disk_space_component import DiskSpaceComponent
-from .ssl_component import SslComponent
+from .composite_component import CompositeComponent, parse_component
 
 
 class HealthCheck(ExtraBaseModel):
+    """The response of /actuator/health or of a health group."""
+
     status: str
-    components: Dict[str, Component] = Field(default_factory=dict)
-
-    def model_post_init(self, __context: Any) -> None:
-        # Map component types based on their keys
-        component_mapping: Dict[str, Type[Component]] = {
-            "ping": PingComponent,
-            "diskSpace": DiskSpaceComponent,
-            "ssl": SslComponent,
+    # Dumped with the fields of their actual type, not only those of Component
+    components: Dict[str, SerializeAsAny[Component]] = Field(default_factory=dict)
+    groups: List[str] = Field(default_factory=list)
+
+    @field_validator("components", mode="before")
+    @classmethod
+    def _parse_components(cls, components: Any) -> Any:
+        # Parse each component directly with the type registered for its key,
+        # so it is validated once instead of being parsed as a generic
+        # Component and converted afterwards
+        if not isinstance(components, dict):
+            return components
+        return {
+            key: parse_component(key, component)
+            for key, component in components.items()
         }
 
-        # Convert generic components to their specific types
-        for key, component in list(self.components.items()):
-            if key in component_mapping:
-                model_cls = component_mapping[key]
-                specific_component = model_cls(**component.model_dump())
-                self.components[key] = specific_component
+    def get_component(self, path: str) -> Optional[Component]:
+        """Get a component by path, expanding composite components on the way.
+
+        Args:
+            path: Component names separated by "/", e.g. "db/primary"
+
+        Returns:
+            The component, or None if the path does not exist.
+        """
+        names = path.split("/")
+        component = self.components.get(names[0])
+        for name in names[1:]:
+            if not isinstance(component, CompositeComponent):
+                return None
+            component = component.get_component(name)
+        return component
@@ -1,8 +1,34 @@
-from typing import List
+from typing import Any, List
 from ..common.extra_base_model import ExtraBaseModel
-from pydantic import Field
+from pydantic import Field, field_validator
+
+from .certificate_chain import CertificateChain
 
 
 class SslDetails(ExtraBaseModel):
-    valid_chains: List[str] = Field(default_factory=list, alias="validChains")
-    invalid_chains: List[str] = Field(default_factory=list, alias="invalidChains")
+    valid_chains: List[CertificateChain] = Field(
+        default_factory=list, alias="validChains"
+    )
+    invalid_chains: List[CertificateChain] = Field(
+        default_factory=list, alias="invalidChains"
+    )
+    expiring_chains: List[CertificateChain] = Field(
+        default_factory=list, alias="expiringChains"
+    )
+
+    @field_validator("valid_chains", "invalid_chains", "expiring_chains", mode="before")
+    @classmethod
+    def _skip_unparsed_chains(cls, chains: Any) -> Any:
+        # Older servers report chains as plain strings, which carry no
+        # certificate to inspect: skip them instead of failing the health check
+        if not isinstance(chains, list):
+            return chains
+        return [chain for chain in chains if not isinstance(chain, str)]
+
+    def get_chains(self) -> List[CertificateChain]:
+        """Get every reported chain, whatever its validity.
+
+        Returns:
+            The valid, expiring and invalid chains.
+        """
+        return self.valid_chains + self.expiring_chains + self.invalid_chains
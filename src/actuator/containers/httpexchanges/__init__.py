@@ -1,3 +1,13 @@
-from .models import HttpExchanges, HttpExchange, HttpRequest, HttpResponse
+from .models import HttpExchanges, HttpExchange, HttpMessage, HttpRequest, HttpResponse
+from .uri_normalizer import UriNormalizer
+from ..common.path_templates import get_predicate_patterns
 
-__all__ = ["HttpExchanges", "HttpExchange", "HttpRequest", "HttpResponse"]
+__all__ = [
+    "HttpExchanges",
+    "HttpExchange",
+    "HttpMessage",
+    "HttpRequest",
+    "HttpResponse",
+    "UriNormalizer",
+    "get_predicate_patterns",
+]
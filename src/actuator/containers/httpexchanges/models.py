@@ -1,17 +1,52 @@
 from datetime import datetime
-from typing import Dict, List, Optional
-from pydantic import Field
+from typing import Dict, Iterable, List, Literal, Optional
+from pydantic import Field, PrivateAttr
 
+from ..common.duration import parse_duration
 from ..common.extra_base_model import ExtraBaseModel
 
 
-class HttpRequest(ExtraBaseModel):
-    """Represents an HTTP request."""
+class HttpMessage(ExtraBaseModel):
+    """Base class for HTTP requests and responses carrying headers.
+
+    Header lookups go through a lowercase header map that is built lazily on
+    first use and cached on the instance, since headers are case-insensitive.
+    The map is rebuilt when headers is replaced or gains or loses a header;
+    to change the values of a header, assign a new headers dictionary.
+    """
 
-    uri: str
-    method: str
     headers: Dict[str, List[str]] = Field(default_factory=dict)
 
+    _header_index: Optional[Dict[str, List[str]]] = PrivateAttr(default=None)
+    _indexed_headers: Optional[Dict[str, List[str]]] = PrivateAttr(default=None)
+    _indexed_size: int = PrivateAttr(default=0)
+
+    def get_header_index(self) -> Dict[str, List[str]]:
+        """Get the headers keyed by lowercase header name.
+
+        Values of headers whose names only differ in case are merged. The
+        dictionary is shared by every lookup and must not be modified.
+
+        Returns:
+            A dictionary mapping lowercase header names to their values.
+        """
+        if (
+            self._header_index is None
+            or self._indexed_headers is not self.headers
+            or self._indexed_size != len(self.headers)
+        ):
+            index: Dict[str, List[str]] = {}
+            for key, values in self.headers.items():
+                lower_key = key.lower()
+                if lower_key in index:
+                    index[lower_key] = index[lower_key] + values
+                else:
+                    index[lower_key] = values
+            self._header_index = index
+            self._indexed_headers = self.headers
+            self._indexed_size = len(self.headers)
+        return self._header_index
+
     def get_header(self, name: str) -> Optional[str]:
         """Get the first value of a header (case-insensitive).
 
@@ -21,35 +56,32 @@ class HttpRequest(ExtraBaseModel):
         Returns:
             The first value of the header, or None if not found
         """
-        # Headers in HTTP are case-insensitive
-        lower_name = name.lower()
-        for key, values in self.headers.items():
-            if key.lower() == lower_name and values:
-                return values[0]
-        return None
-
-
-class HttpResponse(ExtraBaseModel):
-    """Represents an HTTP response."""
+        values = self.get_header_index().get(name.lower())
+        return values[0] if values else None
 
-    status: int
-    headers: Dict[str, List[str]] = Field(default_factory=dict)
-
-    def get_header(self, name: str) -> Optional[str]:
-        """Get the first value of a header (case-insensitive).
+    def get_header_values(self, name: str) -> List[str]:
+        """Get all values of a header (case-insensitive).
 
         Args:
             name: The header name
 
         Returns:
-            The first value of the header, or None if not found
+            A new list of the values of the header, empty if not found
         """
-        # Headers in HTTP are case-insensitive
-        lower_name = name.lower()
-        for key, values in self.headers.items():
-            if key.lower() == lower_name and values:
-                return values[0]
-        return None
+        return list(self.get_header_index().get(name.lower(), ()))
+
+
+class HttpRequest(HttpMessage):
+    """Represents an HTTP request."""
+
+    uri: str
+    method: str
+
+
+class HttpResponse(HttpMessage):
+    """Represents an HTTP response."""
+
+    status: int
 
 
 class HttpExchange(ExtraBaseModel):
@@ -60,8 +92,92 @@ class HttpExchange(ExtraBaseModel):
     response: HttpResponse
     time_taken: str = Field(alias="timeTaken")
 
+    def get_time_taken_seconds(self) -> float:
+        """Get the time taken by the exchange in seconds.
+
+        Returns:
+            The parsed ISO-8601 time_taken duration in seconds.
+        """
+        return parse_duration(self.time_taken)
+
+
+def _get_message(
+    exchange: HttpExchange, source: Literal["request", "response"]
+) -> HttpMessage:
+    return exchange.request if source == "request" else exchange.response
+
 
 class HttpExchanges(ExtraBaseModel):
     """Container for a list of HTTP exchanges."""
 
     exchanges: List[HttpExchange] = Field(default_factory=list)
+
+    def extract_headers(
+        self,
+        names: Iterable[str],
+        source: Literal["request", "response"] = "request",
+    ) -> Dict[str, List[Optional[str]]]:
+        """Extract the first value of several headers into columns.
+
+        Args:
+            names: The header names to extract (case-insensitive)
+            source: Whether to read request or response headers
+
+        Returns:
+            A dictionary mapping each header name to a list with one value per
+            exchange, in exchange order, using None where the header is absent.
+        """
+        lower_names = {name: name.lower() for name in names}
+        columns: Dict[str, List[Optional[str]]] = {name: [] for name in lower_names}
+        for exchange in self.exchanges:
+            index = _get_message(exchange, source).get_header_index()
+            for name, lower_name in lower_names.items():
+                values = index.get(lower_name)
+                columns[name].append(values[0] if values else None)
+        return columns
+
+    def group_by_header(
+        self,
+        name: str,
+        source: Literal["request", "response"] = "request",
+    ) -> Dict[Optional[str], List[HttpExchange]]:
+        """Group exchanges by the first value of a header.
+
+        Args:
+            name: The header name (case-insensitive)
+            source: Whether to read request or response headers
+
+        Returns:
+            A dictionary mapping header values (None when absent) to the
+            exchanges carrying that value.
+        """
+        groups: Dict[Optional[str], List[HttpExchange]] = {}
+        for exchange, value in zip(
+            self.exchanges, self.extract_headers([name], source)[name]
+        ):
+            groups.setdefault(value, []).append(exchange)
+        return groups
+
+    def filter_by_header(
+        self,
+        name: str,
+        value: str,
+        source: Literal["request", "response"] = "request",
+    ) -> List[HttpExchange]:
+        """Get the exchanges whose header has a specific first value.
+
+        Args:
+            name: The header name (case-insensitive)
+            value: The header value to match
+            source: Whether to read request or response headers
+
+        Returns:
+            A list of matching HttpExchange objects.
+        """
+        lower_name = name.lower()
+        result = []
+        for exchange in self.exchanges:
+            values = _get_message(exchange, source).get_header_index().get(lower_name)
+            if values and values[0] == value:
+                result.append(exchange)
+        return result
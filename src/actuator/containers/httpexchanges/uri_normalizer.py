@@ -0,0 +1,99 @@
+import re
+from typing import Any, Dict, Iterable, Union
+from urllib.parse import urlsplit
+
+from ..common.path_templates import PathTemplateTrie, split_path
+from ..mappings import Mappings
+from ..metrics import Metric
+
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|[0-9a-fA-F]{16,})$"
+)
+ID_PLACEHOLDER = "{id}"
+
+
+class UriNormalizer:
+    """Maps raw request URIs to route templates for low-cardinality grouping.
+
+    Templates are learned from /actuator/mappings and from the uri tag values of
+    the http.server.requests metric, and compiled into a PathTemplateTrie so
+    each URI is normalized in O(path segments). URIs matching no template
+    keep their path, with ID-like segments (numbers, UUIDs, long hex strings)
+    replaced by "{id}".
+
+    A normalizer can be passed as the uri_mapper of HttpLatencyAnalytics.
+    """
+
+    def __init__(self, templates: Iterable[str] = ()):
+        """Initialize the normalizer.
+
+        Args:
+            templates: Initial route templates
+        """
+        self._trie: PathTemplateTrie[str] = PathTemplateTrie()
+        for template in templates:
+            self.add_template(template)
+
+    def __len__(self) -> int:
+        return len(self._trie)
+
+    def add_template(self, template: str) -> None:
+        """Add a route template.
+
+        Args:
+            template: A path pattern, e.g. "/actuator/metrics/{requiredMetricName}"
+        """
+        if template.startswith("/"):
+            self._trie.add(template, template)
+
+    def learn_from_mappings(self, mappings: Union[Mappings, Dict[str, Any]]) -> int:
+        """Learn route templates from an /actuator/mappings response.
+
+        Args:
+            mappings: The Mappings object, or the parsed JSON of the
+                /actuator/mappings endpoint
+
+        Returns:
+            The number of templates known after learning.
+        """
+        if not isinstance(mappings, Mappings):
+            mappings = Mappings.model_validate(mappings)
+        for pattern in mappings.get_route_index().get_patterns():
+            self.add_template(pattern)
+        return len(self)
+
+    def learn_from_metric(self, metric: Metric, tag: str = "uri") -> int:
+        """Learn route templates from the uri tag of a metric.
+
+        Values that are not paths, such as "UNKNOWN" or "NOT_FOUND", are ignored.
+
+        Args:
+            metric: A metric such as http.server.requests
+            tag: The name of the tag holding templated URIs
+
+        Returns:
+            The number of templates known after learning.
+        """
+        for value in metric.get_tag_values(tag):
+            self.add_template(value)
+        return len(self)
+
+    def normalize(self, uri: str) -> str:
+        """Map a request URI to its route template.
+
+        Args:
+            uri: The raw URI, with or without scheme, host and query string
+
+        Returns:
+            The matching route template, or the masked path if none matches.
+        """
+        path = urlsplit(uri).path or "/"
+        match = self._trie.match(path)
+        if match is not None:
+            return match[1]
+        segments = [
+            ID_PLACEHOLDER if _ID_SEGMENT.match(segment) else segment
+            for segment in split_path(path)
+        ]
+        return "/" + "/".join(segments)
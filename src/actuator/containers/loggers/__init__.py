@@ -1,3 +1,4 @@
 from .models import Loggers, Logger, LoggerGroup
+from .tree import LoggerNode, LoggerTree
 
-__all__ = ["Loggers", "Logger", "LoggerGroup"]
+__all__ = ["Loggers", "Logger", "LoggerGroup", "LoggerNode", "LoggerTree"]
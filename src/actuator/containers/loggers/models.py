@@ -1,8 +1,9 @@
 from typing import Dict, List, Optional
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from ..common.extra_base_model import ExtraBaseModel
+from .tree import LoggerTree
 
 
 class Logger(ExtraBaseModel):
@@ -24,6 +25,7 @@ class Loggers(ExtraBaseModel):
     levels: List[str] = Field(default_factory=list)
     loggers: Dict[str, Logger] = Field(default_factory=dict)
     groups: Dict[str, LoggerGroup] = Field(default_factory=dict)
+    _tree: Optional[LoggerTree] = PrivateAttr(default=None)
 
     def get_logger_names(self) -> List[str]:
         """Get all logger names.
@@ -44,6 +46,18 @@ class Loggers(ExtraBaseModel):
         """
         return self.loggers.get(logger_name)
 
+    def get_tree(self) -> LoggerTree:
+        """Get the hierarchy of the loggers.
+
+        The tree is built on first access and cached for this snapshot.
+
+        Returns:
+            The LoggerTree object.
+        """
+        if self._tree is None:
+            self._tree = LoggerTree(self.loggers)
+        return self._tree
+
     def get_group_names(self) -> List[str]:
         """Get all logger group names.
 
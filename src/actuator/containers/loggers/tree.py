@@ -0,0 +1,186 @@
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional
+
+if TYPE_CHECKING:
+    from .models import Logger
+
+ROOT_LOGGER = "ROOT"
+
+
+class LoggerNode:
+    """A package or class in the logger hierarchy."""
+
+    __slots__ = ("name", "logger", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.logger: Optional["Logger"] = None
+        self.children: Dict[str, "LoggerNode"] = {}
+
+
+class LoggerTree:
+    """Dot-separated hierarchy of the loggers of an application.
+
+    Each segment of a logger name is a level of the tree, so listing the
+    loggers under a package only visits that package's subtree, and levels
+    are inherited from the nearest configured ancestor as in Logback and
+    Log4j2.
+    """
+
+    def __init__(self, loggers: Mapping[str, "Logger"]):
+        """Build the tree.
+
+        Args:
+            loggers: A dictionary mapping logger names to Logger objects
+        """
+        self.root = LoggerNode(ROOT_LOGGER)
+        self.root.logger = loggers.get(ROOT_LOGGER)
+        for name, logger in loggers.items():
+            if name == ROOT_LOGGER:
+                continue
+            node = self.root
+            path: List[str] = []
+            for segment in name.split("."):
+                path.append(segment)
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = LoggerNode(".".join(path))
+                node = child
+            node.logger = logger
+
+    def get_node(self, name: str) -> Optional[LoggerNode]:
+        """Get the node of a logger or package.
+
+        Args:
+            name: The logger name, e.g. "org.springframework.web"
+
+        Returns:
+            The LoggerNode, or None if no logger has this name or prefix.
+        """
+        if name in ("", ROOT_LOGGER):
+            return self.root
+        node = self.root
+        for segment in name.split("."):
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def _collect(self, node: LoggerNode, names: List[str]) -> None:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.logger is not None:
+                names.append(current.name)
+            stack.extend(current.children.values())
+
+    def get_subtree(self, name: str, include_self: bool = True) -> List[str]:
+        """Get the loggers under a package.
+
+        Args:
+            name: The package or logger name, e.g. "org.springframework"
+            include_self: Whether to include the logger with that exact name
+
+        Returns:
+            A sorted list of logger names.
+        """
+        node = self.get_node(name)
+        if node is None:
+            return []
+        names: List[str] = []
+        self._collect(node, names)
+        if not include_self and node.logger is not None:
+            names.remove(node.name)
+        return sorted(names)
+
+    def find_by_prefix(self, prefix: str) -> List[str]:
+        """Get the loggers whose name starts with some text.
+
+        Unlike get_subtree, the last segment may be partial, so
+        "org.springframework.we" matches "org.springframework.web" and
+        "org.springframework.webmvc".
+
+        Args:
+            prefix: The start of the logger names
+
+        Returns:
+            A sorted list of logger names.
+        """
+        package, _, partial = prefix.rpartition(".")
+        node = self.get_node(package) if package else self.root
+        if node is None:
+            return []
+        names: List[str] = []
+        for segment, child in node.children.items():
+            if segment.startswith(partial):
+                self._collect(child, names)
+        return sorted(names)
+
+    def get_level_source(self, name: str) -> Optional[str]:
+        """Get the logger whose configured level applies to a logger.
+
+        Args:
+            name: The logger name (it does not need to exist yet)
+
+        Returns:
+            The name of the nearest logger, the logger itself or an ancestor,
+            with a configured level, or None if none is configured.
+        """
+        source = ROOT_LOGGER if self._is_configured(self.root) else None
+        if name in ("", ROOT_LOGGER):
+            return source
+        node = self.root
+        for segment in name.split("."):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if self._is_configured(node):
+                source = node.name
+        return source
+
+    @staticmethod
+    def _is_configured(node: LoggerNode) -> bool:
+        return node.logger is not None and node.logger.configured_level is not None
+
+    def get_effective_level(self, name: str) -> Optional[str]:
+        """Get the level a logger has or would have.
+
+        For loggers in the snapshot this is their reported effective level;
+        for others it is inherited from the nearest configured ancestor.
+
+        Args:
+            name: The logger name
+
+        Returns:
+            The level, or None if it cannot be determined.
+        """
+        node = self.get_node(name)
+        if node is not None and node.logger is not None:
+            return node.logger.effective_level
+        source = self.get_level_source(name)
+        if source is None:
+            return None
+        return self.get_node(source).logger.configured_level
+
+    def get_configured_descendants(self, name: str) -> List[str]:
+        """Get the loggers under a package that have their own configured level.
+
+        Such loggers do not inherit a level set on the package.
+
+        Args:
+            name: The package name
+
+        Returns:
+            A sorted list of logger names.
+        """
+        node = self.get_node(name)
+        if node is None:
+            return []
+        names: List[str] = []
+        for child in node.children.values():
+            stack = [child]
+            while stack:
+                current = stack.pop()
+                if self._is_configured(current):
+                    names.append(current.name)
+                stack.extend(current.children.values())
+        return sorted(names)
@@ -0,0 +1,30 @@
+from .models import (
+    Mappings,
+    MappingsContext,
+    ContextMappings,
+    DispatcherMapping,
+    MappingDetails,
+    HandlerMethod,
+    RequestMappingConditions,
+    MediaTypeExpression,
+    NameValueExpression,
+    ServletFilterMapping,
+    ServletMapping,
+)
+from .route_index import Route, RouteIndex
+
+__all__ = [
+    "Mappings",
+    "MappingsContext",
+    "ContextMappings",
+    "DispatcherMapping",
+    "MappingDetails",
+    "HandlerMethod",
+    "RequestMappingConditions",
+    "MediaTypeExpression",
+    "NameValueExpression",
+    "ServletFilterMapping",
+    "ServletMapping",
+    "Route",
+    "RouteIndex",
+]
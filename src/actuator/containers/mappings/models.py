@@ -0,0 +1,229 @@
+from typing import Dict, List, Optional
+
+from pydantic import Field, PrivateAttr
+
+from ..common.extra_base_model import ExtraBaseModel
+from ..common.path_templates import get_predicate_patterns
+from .route_index import Route, RouteIndex
+
+
+class HandlerMethod(ExtraBaseModel):
+    """The Java method handling a request mapping."""
+
+    class_name: str = Field(alias="className")
+    name: str
+    descriptor: Optional[str] = None
+
+    def get_signature(self) -> str:
+        """Get the class and method name.
+
+        Returns:
+            A string such as "com.example.UserController#getUser".
+        """
+        return f"{self.class_name}#{self.name}"
+
+
+class MediaTypeExpression(ExtraBaseModel):
+    """A consumes or produces condition of a request mapping."""
+
+    media_type: str = Field(alias="mediaType")
+    negated: bool = False
+
+
+class NameValueExpression(ExtraBaseModel):
+    """A header or parameter condition of a request mapping."""
+
+    name: str
+    value: Optional[str] = None
+    negated: bool = False
+
+
+class RequestMappingConditions(ExtraBaseModel):
+    """The conditions a request must meet to be handled by a mapping."""
+
+    consumes: List[MediaTypeExpression] = Field(default_factory=list)
+    headers: List[NameValueExpression] = Field(default_factory=list)
+    methods: List[str] = Field(default_factory=list)
+    params: List[NameValueExpression] = Field(default_factory=list)
+    patterns: List[str] = Field(default_factory=list)
+    produces: List[MediaTypeExpression] = Field(default_factory=list)
+
+
+class MappingDetails(ExtraBaseModel):
+    """The handler method and conditions of a request mapping."""
+
+    handler_method: Optional[HandlerMethod] = Field(default=None, alias="handlerMethod")
+    request_mapping_conditions: Optional[RequestMappingConditions] = Field(
+        default=None, alias="requestMappingConditions"
+    )
+
+
+class DispatcherMapping(ExtraBaseModel):
+    """A request mapping of a DispatcherServlet or DispatcherHandler.
+
+    Mappings of handler methods carry details; resource handlers and other
+    handlers only have a predicate, e.g. "/webjars/**".
+    """
+
+    predicate: str
+    handler: str
+    details: Optional[MappingDetails] = None
+
+    def get_patterns(self) -> List[str]:
+        """Get the path patterns of the mapping.
+
+        Returns:
+            A list of distinct path patterns; an empty pattern is reported as "/".
+        """
+        conditions = self.details and self.details.request_mapping_conditions
+        patterns = (
+            conditions.patterns
+            if conditions and conditions.patterns
+            else get_predicate_patterns(self.predicate)
+        )
+        return list(dict.fromkeys(pattern or "/" for pattern in patterns))
+
+    def get_methods(self) -> List[str]:
+        """Get the HTTP methods of the mapping.
+
+        Returns:
+            A list of methods, empty if the mapping accepts any method.
+        """
+        conditions = self.details and self.details.request_mapping_conditions
+        return list(conditions.methods) if conditions else []
+
+    def get_handler_method(self) -> Optional[HandlerMethod]:
+        """Get the Java method handling the mapping.
+
+        Returns:
+            The HandlerMethod, or None if the handler is not a method.
+        """
+        return self.details.handler_method if self.details else None
+
+
+class ServletFilterMapping(ExtraBaseModel):
+    """A servlet filter registration."""
+
+    name: str
+    class_name: str = Field(alias="className")
+    url_pattern_mappings: List[str] = Field(
+        default_factory=list, alias="urlPatternMappings"
+    )
+    servlet_name_mappings: List[str] = Field(
+        default_factory=list, alias="servletNameMappings"
+    )
+
+
+class ServletMapping(ExtraBaseModel):
+    """A servlet registration."""
+
+    name: str
+    class_name: str = Field(alias="className")
+    mappings: List[str] = Field(default_factory=list)
+
+
+class ContextMappings(ExtraBaseModel):
+    """The request mappings of an application context.
+
+    Servlet applications report dispatcherServlets, servletFilters and
+    servlets; reactive applications report dispatcherHandlers. Both
+    dispatcher dictionaries map servlet or handler names to their mappings.
+    """
+
+    dispatcher_servlets: Dict[str, List[DispatcherMapping]] = Field(
+        default_factory=dict, alias="dispatcherServlets"
+    )
+    dispatcher_handlers: Dict[str, List[DispatcherMapping]] = Field(
+        default_factory=dict, alias="dispatcherHandlers"
+    )
+    servlet_filters: List[ServletFilterMapping] = Field(
+        default_factory=list, alias="servletFilters"
+    )
+    servlets: List[ServletMapping] = Field(default_factory=list)
+
+
+class MappingsContext(ExtraBaseModel):
+    """An application context in the /actuator/mappings response."""
+
+    mappings: ContextMappings = Field(default_factory=ContextMappings)
+    parent_id: Optional[str] = Field(default=None, alias="parentId")
+
+
+class Mappings(ExtraBaseModel):
+    """Container for the request mappings of a Spring Boot application.
+
+    The contexts dictionary maps application context names to MappingsContext
+    objects.
+    """
+
+    contexts: Dict[str, MappingsContext] = Field(default_factory=dict)
+
+    _route_index: Optional[RouteIndex] = PrivateAttr(default=None)
+
+    def get_routes(self) -> List[Route]:
+        """Get a route for every pattern of every dispatcher mapping.
+
+        Returns:
+            A list of Route objects, in the order of the mappings.
+        """
+        routes = []
+        for context_name, context in self.contexts.items():
+            for dispatchers in (
+                context.mappings.dispatcher_servlets,
+                context.mappings.dispatcher_handlers,
+            ):
+                for dispatcher, mappings in dispatchers.items():
+                    for mapping in mappings:
+                        handler_method = mapping.get_handler_method()
+                        methods = tuple(mapping.get_methods())
+                        for pattern in mapping.get_patterns():
+                            routes.append(
+                                Route(
+                                    pattern=pattern,
+                                    methods=methods,
+                                    handler=mapping.handler,
+                                    handler_method=(
+                                        handler_method.get_signature()
+                                        if handler_method
+                                        else None
+                                    ),
+                                    dispatcher=dispatcher,
+                                    context=context_name,
+                                )
+                            )
+        return routes
+
+    def get_route_index(self) -> RouteIndex:
+        """Get the route index, building it on first use.
+
+        Returns:
+            The RouteIndex of every dispatcher mapping.
+        """
+        if self._route_index is None:
+            self._route_index = RouteIndex(self.get_routes())
+        return self._route_index
+
+    def find_handler(self, path: str, method: Optional[str] = None) -> Optional[Route]:
+        """Find the route serving a request.
+
+        Args:
+            path: The request path or a route template, e.g. "/api/users/42"
+            method: The HTTP method (default: any)
+
+        Returns:
+            The first matching Route, or None if no mapping matches.
+        """
+        routes = self.get_route_index().match(path, method)
+        return routes[0] if routes else None
+
+    def get_servlet_filters(self) -> List[ServletFilterMapping]:
+        """Get the servlet filters of every context.
+
+        Returns:
+            A list of ServletFilterMapping objects.
+        """
+        return [
+            servlet_filter
+            for context in self.contexts.values()
+            for servlet_filter in context.mappings.servlet_filters
+        ]
@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from ..common.path_templates import PathTemplateTrie, template_key
+
+HTTP_METHODS = ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE")
+
+# Precedence of the routes sharing a method and pattern, lowest first
+_EXPLICIT = 0
+_IMPLICIT_HEAD = 1
+_ANY_METHOD = 2
+
+
+@dataclass(frozen=True)
+class Route:
+    """A path pattern of a request mapping and its handler."""
+
+    pattern: str
+    methods: Tuple[str, ...]
+    handler: str
+    handler_method: Optional[str]
+    dispatcher: str
+    context: str
+
+    def accepts(self, method: str) -> bool:
+        """Check whether the route serves an HTTP method.
+
+        Args:
+            method: The HTTP method, e.g. "GET"
+
+        Returns:
+            True if the route has no method condition or lists the method;
+            GET routes also serve HEAD, as in Spring MVC.
+        """
+        method = method.upper()
+        return (
+            not self.methods
+            or method in self.methods
+            or (method == "HEAD" and "GET" in self.methods)
+        )
+
+
+class RouteIndex:
+    """Method and path-pattern index over request mappings.
+
+    Routes are compiled into one PathTemplateTrie per HTTP method, plus one
+    for requests of any method, so finding the handler of a URI costs
+    O(path segments) instead of matching every mapping. Routes without a
+    method condition are indexed under every method; a route that names the
+    method takes precedence over them for the same pattern, and GET routes
+    also serve HEAD unless a HEAD route exists. Patterns that only differ in
+    variable names, e.g. "/users/{id}" and "/users/{userId}", are treated as
+    one pattern, so their routes are all returned.
+    """
+
+    def __init__(self, routes: Iterable[Route]):
+        """Build the index.
+
+        Args:
+            routes: The routes, in the order of the mappings
+        """
+        self.routes: List[Route] = list(routes)
+        candidates: Dict[
+            Tuple[Optional[str], Tuple[str, ...]], List[Tuple[int, int, Route]]
+        ] = {}
+        for order, route in enumerate(self.routes):
+            key = template_key(route.pattern)
+            candidates.setdefault((None, key), []).append((_EXPLICIT, order, route))
+            if not route.methods:
+                for method in HTTP_METHODS:
+                    candidates.setdefault((method, key), []).append(
+                        (_ANY_METHOD, order, route)
+                    )
+                continue
+            for method in route.methods:
+                candidates.setdefault((method, key), []).append(
+                    (_EXPLICIT, order, route)
+                )
+            if "GET" in route.methods and "HEAD" not in route.methods:
+                candidates.setdefault(("HEAD", key), []).append(
+                    (_IMPLICIT_HEAD, order, route)
+                )
+
+        self._tries: Dict[Optional[str], PathTemplateTrie[List[Route]]] = {}
+        for (method, _), entries in candidates.items():
+            trie = self._tries.get(method)
+            if trie is None:
+                trie = self._tries[method] = PathTemplateTrie()
+            entries.sort(key=lambda entry: (entry[0], entry[1]))
+            best = entries[0][0]
+            routes = [route for rank, _, route in entries if rank == best]
+            trie.add(routes[0].pattern, routes)
+
+    def __len__(self) -> int:
+        return len(self.routes)
+
+    def match(self, path: str, method: Optional[str] = None) -> List[Route]:
+        """Find the routes serving a request.
+
+        Args:
+            path: The request path, or a full URI, or a route template such
+                as a metric uri tag value
+            method: The HTTP method (default: any)
+
+        Returns:
+            The routes of the most specific matching pattern, in mapping
+            order; several routes share a pattern when they differ in
+            produces, consumes, params or headers conditions, or only in the
+            names of their path variables.
+        """
+        trie = self._tries.get(method.upper() if method is not None else None)
+        if trie is None:
+            return []
+        found = trie.match(urlsplit(path).path or "/")
+        return list(found[1]) if found is not None else []
+
+    def get_methods(self, path: str) -> List[str]:
+        """Get the HTTP methods served at a path.
+
+        Args:
+            path: The request path
+
+        Returns:
+            A sorted list of the explicit methods of the matching routes, or
+            every method if a matching route has no method condition.
+        """
+        methods = set()
+        for route in self.match(path):
+            if not route.methods:
+                return list(HTTP_METHODS)
+            methods.update(route.methods)
+        return sorted(methods)
+
+    def get_patterns(self) -> List[str]:
+        """Get the distinct path patterns of the routes.
+
+        Returns:
+            A list of patterns, in mapping order.
+        """
+        return list(dict.fromkeys(route.pattern for route in self.routes))
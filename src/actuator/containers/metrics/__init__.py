@@ -1,4 +1,25 @@
 from .models import Metrics
-from .metric_models import Metric, Measurement, Tag, format_bytes, format_time
+from .metric_models import Metric, Measurement, Tag
+from .formatters import (
+    format_bytes,
+    format_time,
+    format_seconds,
+    format_nanoseconds,
+    format_values,
+    get_formatter,
+    register_formatter,
+)
 
-__all__ = ["Metrics", "Metric", "Measurement", "Tag", "format_bytes", "format_time"]
+__all__ = [
+    "Metrics",
+    "Metric",
+    "Measurement",
+    "Tag",
+    "format_bytes",
+    "format_time",
+    "format_seconds",
+    "format_nanoseconds",
+    "format_values",
+    "get_formatter",
+    "register_formatter",
+]
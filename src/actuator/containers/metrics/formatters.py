@@ -0,0 +1,162 @@
+from typing import Callable, Dict, Iterable, List, Optional
+
+Formatter = Callable[[float], str]
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+# Dividing by powers of two is exact, so one division per value gives the same
+# result as dividing by 1024 repeatedly
+_BYTE_THRESHOLDS = tuple(1024.0**power for power in range(1, len(_BYTE_UNITS)))
+
+
+def _trim_2(value: float) -> str:
+    """Format with up to 2 decimal places, without trailing zeros."""
+    text = f"{value:.2f}"
+    if text.endswith("00"):
+        return text[:-3]
+    if text.endswith("0"):
+        return text[:-1]
+    return text
+
+
+def _format_1(value: float) -> str:
+    """Format whole values as integers, others with 1 decimal place."""
+    return f"{value:.1f}" if value % 1 != 0 else f"{int(value)}"
+
+
+def format_bytes(bytes_value: float) -> str:
+    """Format a byte value into a human-readable string.
+
+    Args:
+        bytes_value: The value in bytes
+
+    Returns:
+        A formatted string with appropriate units (B, KB, MB, GB, TB).
+    """
+    unit_index = 0
+    for threshold in _BYTE_THRESHOLDS:
+        if bytes_value < threshold:
+            break
+        unit_index += 1
+    if unit_index:
+        bytes_value /= _BYTE_THRESHOLDS[unit_index - 1]
+    return f"{_trim_2(bytes_value)} {_BYTE_UNITS[unit_index]}"
+
+
+def format_time(ms_value: float) -> str:
+    """Format a time value in milliseconds into a human-readable string.
+
+    Args:
+        ms_value: The value in milliseconds
+
+    Returns:
+        A formatted string with appropriate units (ms, s, m, h).
+    """
+    if ms_value < 1000:
+        return f"{_format_1(ms_value)} ms"
+    seconds = ms_value / 1000
+    if seconds < 60:
+        return f"{_format_1(seconds)} s"
+    minutes = seconds / 60
+    if minutes < 60:
+        return f"{_format_1(minutes)} m"
+    return f"{_format_1(minutes / 60)} h"
+
+
+def format_seconds(seconds_value: float) -> str:
+    """Format a time value in seconds into a human-readable string.
+
+    Args:
+        seconds_value: The value in seconds
+
+    Returns:
+        A formatted string with appropriate units (ms, s, m, h).
+    """
+    return format_time(seconds_value * 1000)
+
+
+def format_nanoseconds(ns_value: float) -> str:
+    """Format a time value in nanoseconds into a human-readable string.
+
+    Args:
+        ns_value: The value in nanoseconds
+
+    Returns:
+        A formatted string with appropriate units (ms, s, m, h).
+    """
+    return format_time(ns_value / 1_000_000)
+
+
+def format_percent(value: float) -> str:
+    """Format a percentage value.
+
+    Args:
+        value: The value, already in percent
+
+    Returns:
+        The value with one decimal place and a "%" sign.
+    """
+    return f"{value:.1f}%"
+
+
+def format_number(value: float) -> str:
+    """Format a unitless value.
+
+    Args:
+        value: The value
+
+    Returns:
+        The value as an integer if it has no fractional part, otherwise
+        rounded to 2 decimal places.
+    """
+    return f"{value:.2f}" if value % 1 != 0 else f"{int(value)}"
+
+
+_FORMATTERS: Dict[str, Formatter] = {
+    "bytes": format_bytes,
+    "milliseconds": format_time,
+    "ms": format_time,
+    "seconds": format_seconds,
+    "nanoseconds": format_nanoseconds,
+    "ns": format_nanoseconds,
+    "percent": format_percent,
+}
+
+
+def register_formatter(base_unit: str, formatter: Formatter) -> None:
+    """Register the formatter used for metrics with a base unit.
+
+    Args:
+        base_unit: The base unit, as reported in the metric's baseUnit
+        formatter: Function formatting a value in that unit
+    """
+    _FORMATTERS[base_unit] = formatter
+
+
+def get_formatter(base_unit: Optional[str]) -> Formatter:
+    """Get the formatter for a base unit.
+
+    Args:
+        base_unit: The base unit, or None
+
+    Returns:
+        The registered formatter, or format_number for unknown units.
+    """
+    if base_unit is None:
+        return format_number
+    return _FORMATTERS.get(base_unit, format_number)
+
+
+def format_values(values: Iterable[float], base_unit: Optional[str]) -> List[str]:
+    """Format many values of the same unit at once.
+
+    The formatter is resolved once for the whole batch.
+
+    Args:
+        values: The values to format
+        base_unit: The base unit of the values
+
+    Returns:
+        A list of formatted strings, in the order of the values.
+    """
+    formatter = get_formatter(base_unit)
+    return [formatter(value) for value in values]
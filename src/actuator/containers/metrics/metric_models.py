@@ -1,7 +1,8 @@
-from typing import List, Dict, Any, Optional
-from pydantic import Field
+from typing import List, Optional
+from pydantic import Field, PrivateAttr
 
 from ..common.extra_base_model import ExtraBaseModel
+from .formatters import Formatter, get_formatter
 
 
 class Measurement(ExtraBaseModel):
@@ -22,11 +23,13 @@ class Metric(ExtraBaseModel):
     """Represents a detailed metric from Spring Boot Actuator."""
 
     name: str
-    description: str
+    description: Optional[str] = None
     base_unit: Optional[str] = Field(None, alias="baseUnit")
     measurements: List[Measurement] = Field(default_factory=list)
     available_tags: List[Tag] = Field(default_factory=list, alias="availableTags")
 
+    _formatter: Optional[Formatter] = PrivateAttr(default=None)
+
     def get_value(self, statistic: str = "VALUE") -> Optional[float]:
         """Get the value of a specific statistic.
 
@@ -75,79 +78,17 @@ class Metric(ExtraBaseModel):
         value = self.get_value()
         if value is None:
             return "N/A"
+        return self.get_formatter()(value)
+
+    def get_formatter(self) -> Formatter:
+        """Get the formatter for values of this metric, based on its base unit.
+
+        The formatter is resolved once per metric and can be used to format
+        many values, e.g. a whole history series.
 
-        # Format the value based on its magnitude and base unit
-        if self.base_unit == "bytes":
-            return format_bytes(value)
-        elif self.base_unit == "milliseconds" or self.base_unit == "ms":
-            return format_time(value)
-        elif self.base_unit == "percent":
-            return f"{value:.1f}%"
-        else:
-            # For most metrics, just round to 2 decimal places if needed
-            return f"{value:.2f}" if value % 1 != 0 else f"{int(value)}"
-
-
-def format_bytes(bytes_value: float) -> str:
-    """Format a byte value into a human-readable string.
-
-    Args:
-        bytes_value: The value in bytes
-
-    Returns:
-        A formatted string with appropriate units (B, KB, MB, GB, TB).
-    """
-    units = ["B", "KB", "MB", "GB", "TB"]
-    unit_index = 0
-
-    while bytes_value >= 1024 and unit_index < len(units) - 1:
-        bytes_value /= 1024
-        unit_index += 1
-
-    # Format with up to 2 decimal places, but remove trailing zeros
-    formatted = (
-        f"{bytes_value:.2f}".rstrip("0").rstrip(".")
-        if bytes_value % 1 != 0
-        else f"{int(bytes_value)}"
-    )
-    return f"{formatted} {units[unit_index]}"
-
-
-def format_time(ms_value: float) -> str:
-    """Format a time value in milliseconds into a human-readable string.
-
-    Args:
-        ms_value: The value in milliseconds
-
-    Returns:
-        A formatted string with appropriate units (ms, s, m, h).
-    """
-    if ms_value < 1000:
-        return (
-            f"{ms_value:.1f} ms".rstrip("0").rstrip(".")
-            if ms_value % 1 != 0
-            else f"{int(ms_value)} ms"
-        )
-
-    seconds = ms_value / 1000
-    if seconds < 60:
-        return (
-            f"{seconds:.1f} s".rstrip("0").rstrip(".")
-            if seconds % 1 != 0
-            else f"{int(seconds)} s"
-        )
-
-    minutes = seconds / 60
-    if minutes < 60:
-        return (
-            f"{minutes:.1f} m".rstrip("0").rstrip(".")
-            if minutes % 1 != 0
-            else f"{int(minutes)} m"
-        )
-
-    hours = minutes / 60
-    return (
-        f"{hours:.1f} h".rstrip("0").rstrip(".")
-        if hours % 1 != 0
-        else f"{int(hours)} h"
-    )
+        Returns:
+            A function formatting a value into a string.
+        """
+        if self._formatter is None:
+            self._formatter = get_formatter(self.base_unit)
+        return self._formatter
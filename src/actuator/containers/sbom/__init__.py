@@ -9,6 +9,7 @@ from .models import (
     Property,
     Dependency,
 )
+from .index import SbomIndex, component_key, version_key
 
 __all__ = [
     "SBOM",
@@ -20,4 +21,7 @@ __all__ = [
     "ExternalReference",
     "Property",
     "Dependency",
+    "SbomIndex",
+    "component_key",
+    "version_key",
 ]
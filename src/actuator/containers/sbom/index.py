@@ -0,0 +1,204 @@
+import re
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .models import SBOM, Component
+
+_VERSION_SEPARATORS = re.compile(r"[.\-+_]")
+_QUALIFIER_TOKENS = re.compile(r"\d+|\D+")
+
+# Qualifiers that mark a final release rather than a pre-release
+_RELEASE_QUALIFIERS = frozenset({"", "final", "release", "ga"})
+
+
+def version_key(version: str) -> Tuple:
+    """Get a sort key for a Maven-style version string.
+
+    The leading numeric parts are compared as numbers, ignoring trailing
+    zeros, so "2.17" equals "2.17.0" and "2.9" is less than "2.17". A version
+    with a qualifier such as "-rc1" or "-M2" sorts before the release without
+    it, except for release qualifiers (Final, RELEASE, GA).
+
+    Args:
+        version: The version, e.g. "2.17.1" or "6.4.4.Final"
+
+    Returns:
+        A tuple suitable for comparisons.
+    """
+    numbers: List[int] = []
+    parts = _VERSION_SEPARATORS.split(version)
+    position = 0
+    while position < len(parts) and parts[position].isdigit():
+        numbers.append(int(parts[position]))
+        position += 1
+    while numbers and numbers[-1] == 0:
+        numbers.pop()
+    qualifier = "-".join(parts[position:]).lower()
+    if qualifier in _RELEASE_QUALIFIERS:
+        return tuple(numbers), (1, ())
+    # Tag each part so that numbers and text never compare with each other
+    tokens = tuple(
+        (1, int(token), "") if token.isdecimal() else (0, 0, token)
+        for part in parts[position:]
+        for token in _QUALIFIER_TOKENS.findall(part.lower())
+    )
+    return tuple(numbers), (0, tokens)
+
+
+def component_key(component: "Component") -> str:
+    """Get the group:name of a component.
+
+    Args:
+        component: The component
+
+    Returns:
+        "group:name", or the name alone for components without a group.
+    """
+    if component.group:
+        return f"{component.group}:{component.name}"
+    return component.name
+
+
+class SbomIndex:
+    """Lookup index over the components and dependencies of an SBOM.
+
+    Components are indexed by bom-ref, purl, group:name and name, and the
+    dependency graph is stored as forward and reverse adjacency lists, so
+    lookups do not scan the component and dependency lists.
+    """
+
+    def __init__(self, sbom: "SBOM"):
+        """Build the index.
+
+        Args:
+            sbom: The SBOM
+        """
+        self._by_ref: Dict[str, "Component"] = {}
+        self._by_purl: Dict[str, "Component"] = {}
+        self._by_key: Dict[str, List["Component"]] = {}
+        self._by_name: Dict[str, List["Component"]] = {}
+        # Same precedence as a lookup in the metadata component, then the
+        # components, then the tools
+        for component in [
+            sbom.metadata.component,
+            *sbom.components,
+            *sbom.metadata.tools.components,
+        ]:
+            if component.bom_ref:
+                self._by_ref.setdefault(component.bom_ref, component)
+            if component.purl:
+                self._by_purl.setdefault(component.purl, component)
+        for component in sbom.components:
+            self._by_key.setdefault(component_key(component), []).append(component)
+            self._by_name.setdefault(component.name, []).append(component)
+
+        self._dependencies: Dict[str, List[str]] = {}
+        self._dependents: Dict[str, List[str]] = {}
+        for dependency in sbom.dependencies:
+            self._dependencies.setdefault(dependency.ref, dependency.depends_on)
+            for target in dependency.depends_on:
+                self._dependents.setdefault(target, []).append(dependency.ref)
+
+    def get_component(self, bom_ref: str) -> Optional["Component"]:
+        """Get a component by its BOM reference.
+
+        Args:
+            bom_ref: The BOM reference
+
+        Returns:
+            The Component object, or None if not found.
+        """
+        return self._by_ref.get(bom_ref)
+
+    def get_component_by_purl(self, purl: str) -> Optional["Component"]:
+        """Get a component by its package URL.
+
+        Args:
+            purl: The package URL, e.g. "pkg:maven/org.slf4j/slf4j-api@2.0.17"
+
+        Returns:
+            The Component object, or None if not found.
+        """
+        return self._by_purl.get(purl)
+
+    def get_components_by_name(
+        self, name: str, group: Optional[str] = None
+    ) -> List["Component"]:
+        """Get the components with a name.
+
+        Args:
+            name: The component name, e.g. "log4j-core"
+            group: The component group, e.g. "org.apache.logging.log4j"
+                (default: any group)
+
+        Returns:
+            A list of Component objects, in SBOM order.
+        """
+        if group:
+            return list(self._by_key.get(f"{group}:{name}", []))
+        return list(self._by_name.get(name, []))
+
+    def get_dependencies(self, bom_ref: str) -> List[str]:
+        """Get the direct dependencies of a component.
+
+        Args:
+            bom_ref: The BOM reference of the component
+
+        Returns:
+            A list of BOM references.
+        """
+        return list(self._dependencies.get(bom_ref, []))
+
+    def get_dependents(self, bom_ref: str) -> List[str]:
+        """Get the components that depend directly on a component.
+
+        Args:
+            bom_ref: The BOM reference of the component
+
+        Returns:
+            A list of BOM references.
+        """
+        return list(self._dependents.get(bom_ref, []))
+
+    def _traverse(self, start: str, adjacency: Dict[str, List[str]]) -> List[str]:
+        seen: Set[str] = {start}
+        order: List[str] = []
+        queue = deque([start])
+        while queue:
+            for target in adjacency.get(queue.popleft(), ()):
+                if target not in seen:
+                    seen.add(target)
+                    order.append(target)
+                    queue.append(target)
+        return order
+
+    def get_transitive_dependencies(self, bom_ref: str) -> List[str]:
+        """Get every component a component depends on, directly or not.
+
+        Args:
+            bom_ref: The BOM reference of the component
+
+        Returns:
+            A list of BOM references, nearest first.
+        """
+        return self._traverse(bom_ref, self._dependencies)
+
+    def get_transitive_dependents(self, bom_ref: str) -> List[str]:
+        """Get every component that pulls in a component, directly or not.
+
+        Args:
+            bom_ref: The BOM reference of the component
+
+        Returns:
+            A list of BOM references, nearest first.
+        """
+        return self._traverse(bom_ref, self._dependents)
+
+    def get_keys(self) -> Iterable[str]:
+        """Get the group:name of every component.
+
+        Returns:
+            The component keys.
+        """
+        return self._by_key.keys()
@@ -1,9 +1,10 @@
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from ..common.extra_base_model import ExtraBaseModel
+from .index import SbomIndex
 
 
 class License(ExtraBaseModel):
@@ -87,33 +88,33 @@ class SBOM(ExtraBaseModel):
     components: List[Component] = Field(default_factory=list)
     dependencies: List[Dependency] = Field(default_factory=list)
 
+    _index: Optional[SbomIndex] = PrivateAttr(default=None)
+
+    def get_index(self) -> SbomIndex:
+        """Get the lookup index of the components and dependencies.
+
+        The index is built on first access and cached for this snapshot.
+
+        Returns:
+            The SbomIndex object.
+        """
+        if self._index is None:
+            self._index = SbomIndex(self)
+        return self._index
+
     def get_component_by_ref(self, bom_ref: str) -> Optional[Component]:
         """Get a component by its BOM reference.
 
+        The metadata component is checked first, then the components, then the
+        tool components.
+
         Args:
             bom_ref: The BOM reference of the component
 
         Returns:
             The Component object, or None if not found.
         """
-        # First check the main component in metadata
-        if (
-            self.metadata.component.bom_ref
-            and self.metadata.component.bom_ref == bom_ref
-        ):
-            return self.metadata.component
-
-        # Then check the components list
-        for component in self.components:
-            if component.bom_ref and component.bom_ref == bom_ref:
-                return component
-
-        # Then check tools components
-        for tool_component in self.metadata.tools.components:
-            if tool_component.bom_ref and tool_component.bom_ref == bom_ref:
-                return tool_component
-
-        return None
+        return self.get_index().get_component(bom_ref)
 
     def get_dependencies_for(self, bom_ref: str) -> List[str]:
         """Get the dependencies for a component.
@@ -124,7 +125,4 @@ class SBOM(ExtraBaseModel):
         Returns:
             A list of BOM references for the dependencies, or an empty list if none found.
         """
-        for dependency in self.dependencies:
-            if dependency.ref == bom_ref:
-                return dependency.depends_on
-        return []
+        return self.get_index().get_dependencies(bom_ref)
@@ -1,3 +1,12 @@
 from .models import Startup, Timeline, Event, StartupStep, Tag
+from .analyzer import StartupAnalysis, StepNode
 
-__all__ = ["Startup", "Timeline", "Event", "StartupStep", "Tag"]
+__all__ = [
+    "Startup",
+    "Timeline",
+    "Event",
+    "StartupStep",
+    "Tag",
+    "StartupAnalysis",
+    "StepNode",
+]
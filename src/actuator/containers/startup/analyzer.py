@@ -0,0 +1,183 @@
+import heapq
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from .models import Event
+
+BEAN_INSTANTIATION_STEP = "spring.beans.instantiate"
+
+
+class StepNode:
+    """A startup step with its children in the step tree."""
+
+    __slots__ = ("event", "children", "total_time", "self_time")
+
+    def __init__(self, event: "Event"):
+        self.event = event
+        self.children: List["StepNode"] = []
+        self.total_time = event.get_duration_seconds()
+        self.self_time = self.total_time
+
+    @property
+    def id(self) -> int:
+        return self.event.startup_step.id
+
+    @property
+    def name(self) -> str:
+        return self.event.startup_step.name
+
+    @property
+    def parent_id(self) -> Optional[int]:
+        return self.event.startup_step.parent_id
+
+    def get_tag(self, key: str) -> Optional[str]:
+        """Get the value of a tag of the step.
+
+        Args:
+            key: The tag key, e.g. "beanName"
+
+        Returns:
+            The tag value, or None if the step has no such tag.
+        """
+        for tag in self.event.startup_step.tags:
+            if tag.key == key:
+                return tag.value
+        return None
+
+    def __repr__(self) -> str:
+        return f"StepNode({self.id}, {self.name!r}, total={self.total_time:.6f})"
+
+
+class StartupAnalysis:
+    """Tree of the startup steps of an application, with timing analysis.
+
+    The tree is built from parentId in a single pass over the events, and
+    every duration is parsed once. The total time of a step is its duration;
+    its self time is its duration minus the durations of its children, i.e.
+    the time spent in the step itself.
+
+    Steps whose parent is not in the timeline (the buffer may have dropped
+    it) are treated as roots.
+    """
+
+    def __init__(self, events: Sequence["Event"]):
+        """Build the tree.
+
+        Args:
+            events: The events of the startup timeline
+        """
+        # The first event wins for a duplicate step ID, as in Startup
+        self._nodes: Dict[int, StepNode] = {}
+        for event in events:
+            if event.startup_step.id not in self._nodes:
+                self._nodes[event.startup_step.id] = StepNode(event)
+        self.roots: List[StepNode] = []
+        for node in self._nodes.values():
+            parent = self._nodes.get(node.parent_id)
+            if parent is None:
+                self.roots.append(node)
+            else:
+                parent.children.append(node)
+                parent.self_time -= node.total_time
+        for node in self._nodes.values():
+            node.self_time = max(node.self_time, 0.0)
+            node.children.sort(key=lambda child: child.event.start_time)
+        self.roots.sort(key=lambda root: root.event.start_time)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def get_node(self, step_id: int) -> Optional[StepNode]:
+        """Get a step by ID.
+
+        Args:
+            step_id: The startup step ID
+
+        Returns:
+            The StepNode, or None if not found.
+        """
+        return self._nodes.get(step_id)
+
+    def get_nodes(self, step_name: Optional[str] = None) -> List[StepNode]:
+        """Get the steps, optionally only those with a name.
+
+        Args:
+            step_name: The step name, e.g. "spring.beans.instantiate"
+
+        Returns:
+            A list of StepNode objects.
+        """
+        if step_name is None:
+            return list(self._nodes.values())
+        return [node for node in self._nodes.values() if node.name == step_name]
+
+    def get_critical_path(self) -> List[StepNode]:
+        """Get the chain of steps that dominates startup time.
+
+        Starting from the longest root step, the longest child is followed
+        down to a leaf.
+
+        Returns:
+            The steps of the critical path, outermost first.
+        """
+        path: List[StepNode] = []
+        candidates = self.roots
+        while candidates:
+            node = max(candidates, key=lambda candidate: candidate.total_time)
+            path.append(node)
+            candidates = node.children
+        return path
+
+    def get_slowest_steps(
+        self,
+        limit: int = 10,
+        step_name: Optional[str] = None,
+        by_self_time: bool = False,
+    ) -> List[StepNode]:
+        """Get the slowest steps.
+
+        Args:
+            limit: Maximum number of steps
+            step_name: Only consider steps with this name
+            by_self_time: Rank by self time instead of total time
+
+        Returns:
+            A list of StepNode objects, slowest first.
+        """
+        if by_self_time:
+            return heapq.nlargest(
+                limit, self.get_nodes(step_name), key=lambda node: node.self_time
+            )
+        return heapq.nlargest(
+            limit, self.get_nodes(step_name), key=lambda node: node.total_time
+        )
+
+    def get_slowest_beans(
+        self, limit: int = 10, by_self_time: bool = False
+    ) -> List[StepNode]:
+        """Get the slowest bean instantiations.
+
+        The bean name is in the "beanName" tag of the returned steps.
+        Instantiating a bean includes instantiating the beans it depends on,
+        so by_self_time isolates the cost of the bean itself.
+
+        Args:
+            limit: Maximum number of beans
+            by_self_time: Rank by self time instead of total time
+
+        Returns:
+            A list of StepNode objects, slowest first.
+        """
+        return self.get_slowest_steps(limit, BEAN_INSTANTIATION_STEP, by_self_time)
+
+    def get_time_by_name(self) -> Dict[str, float]:
+        """Get the self time spent in each kind of step.
+
+        Returns:
+            A dictionary mapping step names to summed self times in seconds,
+            largest first.
+        """
+        times: Dict[str, float] = {}
+        for node in self._nodes.values():
+            times[node.name] = times.get(node.name, 0.0) + node.self_time
+        return dict(sorted(times.items(), key=lambda item: item[1], reverse=True))
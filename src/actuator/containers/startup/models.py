@@ -1,9 +1,11 @@
 from datetime import datetime
 from typing import List, Optional, Dict
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
+from ..common.duration import parse_duration
 from ..common.extra_base_model import ExtraBaseModel
+from .analyzer import StartupAnalysis
 
 
 class Tag(ExtraBaseModel):
@@ -29,6 +31,22 @@ class Event(ExtraBaseModel):
     duration: str
     start_time: datetime = Field(alias="startTime")
     startup_step: StartupStep = Field(alias="startupStep")
+    _duration_seconds: Optional[float] = PrivateAttr(default=None)
+
+    def get_duration_seconds(self) -> float:
+        """Get the duration of the step in seconds.
+
+        The duration string is parsed on first access and cached.
+
+        Returns:
+            The duration in seconds, or 0.0 if the duration is invalid.
+        """
+        if self._duration_seconds is None:
+            try:
+                self._duration_seconds = parse_duration(self.duration)
+            except ValueError:
+                self._duration_seconds = 0.0
+        return self._duration_seconds
 
 
 class Timeline(ExtraBaseModel):
@@ -43,6 +61,18 @@ class Startup(ExtraBaseModel):
 
     timeline: Timeline
     spring_boot_version: str = Field(alias="springBootVersion")
+    _events_by_name: Optional[Dict[str, List[Event]]] = PrivateAttr(default=None)
+    _events_by_id: Optional[Dict[int, Event]] = PrivateAttr(default=None)
+    _analysis: Optional[StartupAnalysis] = PrivateAttr(default=None)
+
+    def _index_events(self) -> None:
+        events_by_name: Dict[str, List[Event]] = {}
+        events_by_id: Dict[int, Event] = {}
+        for event in self.timeline.events:
+            events_by_name.setdefault(event.startup_step.name, []).append(event)
+            events_by_id.setdefault(event.startup_step.id, event)
+        self._events_by_name = events_by_name
+        self._events_by_id = events_by_id
 
     def get_total_startup_time(self) -> float:
         """Calculate the total startup time in seconds.
@@ -73,11 +103,9 @@ class Startup(ExtraBaseModel):
         Returns:
             A list of matching Event objects.
         """
-        return [
-            event
-            for event in self.timeline.events
-            if event.startup_step.name == step_name
-        ]
+        if self._events_by_name is None:
+            self._index_events()
+        return list(self._events_by_name.get(step_name, []))
 
     def get_step_by_id(self, step_id: int) -> Optional[Event]:
         """Get an event with a specific startup step ID.
@@ -88,10 +116,9 @@ class Startup(ExtraBaseModel):
         Returns:
             The matching Event object, or None if not found.
         """
-        for event in self.timeline.events:
-            if event.startup_step.id == step_id:
-                return event
-        return None
+        if self._events_by_id is None:
+            self._index_events()
+        return self._events_by_id.get(step_id)
 
     def get_startup_phases(self) -> Dict[str, float]:
         """Get the main startup phases and their durations.
@@ -116,17 +143,18 @@ class Startup(ExtraBaseModel):
         for phase_name in main_phases:
             events = self.get_steps_by_name(phase_name)
             if events:
-                # Extract the duration string and convert to seconds
-                # Format is typically "PT0.1234S" where 0.1234 is seconds
-                duration_str = events[0].duration
-                # Remove "PT" prefix and "S" suffix, then convert to float
-                if duration_str.startswith("PT") and duration_str.endswith("S"):
-                    try:
-                        seconds = float(duration_str[2:-1])
-                        phases[phase_name] = seconds
-                    except ValueError:
-                        phases[phase_name] = 0.0
-                else:
-                    phases[phase_name] = 0.0
+                phases[phase_name] = events[0].get_duration_seconds()
 
         return phases
+
+    def get_analysis(self) -> StartupAnalysis:
+        """Get the step tree and timing analysis of the startup.
+
+        The analysis is built on first access and cached for this snapshot.
+
+        Returns:
+            The StartupAnalysis object.
+        """
+        if self._analysis is None:
+            self._analysis = StartupAnalysis(self.timeline.events)
+        return self._analysis
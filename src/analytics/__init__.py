@@ -0,0 +1,107 @@
+from .alerts import (
+    Alert,
+    AlertEngine,
+    AlertRule,
+    LimitRule,
+    RateOfChangeRule,
+    ThresholdRule,
+    ZScoreRule,
+    disk_space_values,
+    metric_values,
+)
+from .audit import AuditEventStream, TimeBucketCounter, event_key
+from .caches import CacheMonitor, CacheRates, CacheSample, get_cache_manager_tag
+from .certificates import (
+    CertificateExpiry,
+    CertificateExpiryIndex,
+    get_certificate_expiries,
+)
+from .dependencies import DependencyUsage, FleetDependencyIndex
+from .drilldown import LabelledSample, MetricDrillDown, series_key
+from .drift import DriftEngine, DriftReport, Fingerprint, fingerprint_snapshot
+from .health_rollup import FleetHealth, get_worst_status
+from .latency import (
+    HttpLatencyAnalytics,
+    LatencyHistogram,
+    LatencyKey,
+    LatencySummary,
+)
+from .logger_levels import FleetLoggerLevels, LevelChange
+from .rates import DerivedSample, RateDeriver
+from .scheduled import (
+    ExecutionRecord,
+    ScheduledTaskMonitor,
+    TaskAlert,
+    TaskSummary,
+    execution_counts,
+)
+from .search import (
+    BackgroundSearchIndex,
+    SearchDocument,
+    SearchIndex,
+    build_search_index,
+)
+from .startup_compare import (
+    StartupComparison,
+    StartupHistory,
+    StartupSnapshot,
+    StepComparison,
+    compare_snapshots,
+    compare_startups,
+)
+
+__all__ = [
+    "Alert",
+    "AlertEngine",
+    "AlertRule",
+    "LimitRule",
+    "RateOfChangeRule",
+    "ThresholdRule",
+    "ZScoreRule",
+    "disk_space_values",
+    "metric_values",
+    "AuditEventStream",
+    "TimeBucketCounter",
+    "event_key",
+    "CacheMonitor",
+    "CacheRates",
+    "CacheSample",
+    "get_cache_manager_tag",
+    "CertificateExpiry",
+    "CertificateExpiryIndex",
+    "get_certificate_expiries",
+    "DependencyUsage",
+    "FleetDependencyIndex",
+    "LabelledSample",
+    "MetricDrillDown",
+    "series_key",
+    "DriftEngine",
+    "DriftReport",
+    "Fingerprint",
+    "fingerprint_snapshot",
+    "FleetHealth",
+    "get_worst_status",
+    "HttpLatencyAnalytics",
+    "LatencyHistogram",
+    "LatencyKey",
+    "LatencySummary",
+    "FleetLoggerLevels",
+    "LevelChange",
+    "DerivedSample",
+    "RateDeriver",
+    "ExecutionRecord",
+    "ScheduledTaskMonitor",
+    "TaskAlert",
+    "TaskSummary",
+    "execution_counts",
+    "BackgroundSearchIndex",
+    "SearchDocument",
+    "SearchIndex",
+    "build_search_index",
+    "StartupComparison",
+    "StartupHistory",
+    "StartupSnapshot",
+    "StepComparison",
+    "compare_snapshots",
+    "compare_startups",
+]
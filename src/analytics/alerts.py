@@ -0,0 +1,788 @@
+import math
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..actuator.containers.common.extra_base_model import ExtraBaseModel
+from ..actuator.containers.health import DiskSpaceDetails
+from ..actuator.containers.metrics import Metric
+from ..tinydb.tiny_repo import TinyRepo
+
+DISK_FREE_SERIES = "diskSpace.free"
+DISK_THRESHOLD_SERIES = "diskSpace.threshold"
+DISK_TOTAL_SERIES = "diskSpace.total"
+
+
+class Alert(ExtraBaseModel):
+    """A rule starting or ceasing to fire for a server."""
+
+    rule: str
+    server_id: str
+    series: str
+    severity: str
+    value: float
+    message: str
+    timestamp: datetime
+    resolved: bool = False
+
+
+class _RuleState:
+    __slots__ = ("firing",)
+
+    def __init__(self) -> None:
+        self.firing = False
+
+
+class AlertRule(ABC):
+    """Base class of alert rules.
+
+    A rule watches one series (optionally divided by a reference series) and
+    keeps a small fixed-size state per server, so evaluating a sample costs
+    O(1) whatever the length of the history.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        series: str,
+        reference: Optional[str] = None,
+        severity: str = "warning",
+    ):
+        """Initialize the rule.
+
+        Args:
+            name: Unique name of the rule
+            series: The series watched, e.g. "jvm.memory.used"
+            reference: Optional series the value is divided by, e.g.
+                "jvm.memory.max"
+            severity: Severity of the alerts raised by the rule
+        """
+        self.name = name
+        self.series = series
+        self.reference = reference
+        self.severity = severity
+
+    def get_label(self) -> str:
+        """Get the label of the watched value, used in alert messages.
+
+        Returns:
+            The series name, or "series/reference" for ratios.
+        """
+        if self.reference is None:
+            return self.series
+        return f"{self.series}/{self.reference}"
+
+    def get_value(self, values: Dict[str, float]) -> Optional[float]:
+        """Get the watched value from a sample.
+
+        Args:
+            values: The sampled values of a server, by series name
+
+        Returns:
+            The value, or None if the sample does not contain it (or the
+            reference is zero).
+        """
+        value = values.get(self.series)
+        if value is None or self.reference is None:
+            return value
+        reference = values.get(self.reference)
+        if not reference:
+            return None
+        return value / reference
+
+    def new_state(self) -> _RuleState:
+        """Create the state of the rule for a new server.
+
+        Returns:
+            An empty state.
+        """
+        return _RuleState()
+
+    @abstractmethod
+    def check(
+        self, state: _RuleState, value: float, timestamp: datetime
+    ) -> Optional[str]:
+        """Check a new value, updating the state.
+
+        Args:
+            state: The state of the rule for the server
+            value: The new value
+            timestamp: When the value was sampled
+
+        Returns:
+            A message describing the violation, or None if the value is fine.
+        """
+
+
+class _ScoreState(_RuleState):
+    __slots__ = ("score", "sequence", "low", "high")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.score: Optional[float] = None
+        # The engine's rule sequence when the score was computed
+        self.sequence = 0
+        # No limit lies between low and high, so the rules firing do not
+        # change while the score stays strictly inside (empty until a score)
+        self.low = math.inf
+        self.high = -math.inf
+
+
+class LimitRule(AlertRule):
+    """Base class of rules firing while a score is outside static limits.
+
+    The score is computed from the watched value by get_score(), and only
+    depends on the parameters in get_group_key(). The engine therefore keeps
+    one state per server for all the rules with the same group key, computes
+    the score once per sample and finds the rules whose limits it crossed by
+    binary search, so a sample costs O(log n) in the number of such rules
+    plus the alerts it raises.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        series: str,
+        above: Optional[float] = None,
+        below: Optional[float] = None,
+        reference: Optional[str] = None,
+        severity: str = "warning",
+    ):
+        """Initialize the rule.
+
+        Args:
+            name: Unique name of the rule
+            series: The series watched
+            above: Fire when the score is greater than this
+            below: Fire when the score is less than this
+            reference: Optional series the value is divided by
+            severity: Severity of the alerts raised by the rule
+        """
+        super().__init__(name, series, reference, severity)
+        self.above = above
+        self.below = below
+
+    def get_group_key(self) -> Tuple[Any, ...]:
+        """Get the key of the rules computing the same score.
+
+        Subclasses must add every parameter get_score() depends on.
+
+        Returns:
+            A hashable key, by default the rule type, series and reference.
+        """
+        return (type(self), self.series, self.reference)
+
+    def new_state(self) -> _ScoreState:
+        return _ScoreState()
+
+    def is_firing(self, score: Optional[float]) -> bool:
+        """Check whether a score is outside the limits.
+
+        Args:
+            score: The score, or None if there is none yet
+
+        Returns:
+            True if the rule fires for the score.
+        """
+        if score is None:
+            return False
+        return (self.above is not None and score > self.above) or (
+            self.below is not None and score < self.below
+        )
+
+    @abstractmethod
+    def get_score(
+        self, state: _ScoreState, value: float, timestamp: datetime
+    ) -> Optional[float]:
+        """Compute the score of a new value, updating the state.
+
+        Args:
+            state: The state of the rule group for the server
+            value: The new value
+            timestamp: When the value was sampled
+
+        Returns:
+            The score, or None if it cannot be computed yet.
+        """
+
+    @abstractmethod
+    def describe(self, state: _ScoreState, value: float) -> str:
+        """Describe the violation of a firing rule.
+
+        Args:
+            state: The state of the rule group, updated with the value
+            value: The value that made the rule fire
+
+        Returns:
+            The alert message.
+        """
+
+    def check(
+        self, state: _ScoreState, value: float, timestamp: datetime
+    ) -> Optional[str]:
+        state.score = self.get_score(state, value, timestamp)
+        return self.describe(state, value) if self.is_firing(state.score) else None
+
+
+class ThresholdRule(LimitRule):
+    """Fires while a value is above or below static limits.
+
+    With a reference series the limits apply to the ratio, e.g.
+    ThresholdRule("heap", "jvm.memory.used", above=0.9,
+    reference="jvm.memory.max") fires when the heap is more than 90% full.
+    """
+
+    def get_score(
+        self, state: _ScoreState, value: float, timestamp: datetime
+    ) -> Optional[float]:
+        return value
+
+    def describe(self, state: _ScoreState, value: float) -> str:
+        if self.above is not None and value > self.above:
+            return f"{self.get_label()} is {value:.4g}, above {self.above:.4g}"
+        return f"{self.get_label()} is {value:.4g}, below {self.below:.4g}"
+
+
+class _RateState(_ScoreState):
+    __slots__ = ("last_value", "last_time")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.last_value: Optional[float] = None
+        self.last_time: Optional[datetime] = None
+
+
+class RateOfChangeRule(LimitRule):
+    """Fires when a value changes faster than a per-second rate."""
+
+    def __init__(
+        self,
+        name: str,
+        series: str,
+        max_rate: float,
+        reference: Optional[str] = None,
+        severity: str = "warning",
+    ):
+        """Initialize the rule.
+
+        Args:
+            name: Unique name of the rule
+            series: The series watched
+            max_rate: Maximum absolute change per second
+            reference: Optional series the value is divided by
+            severity: Severity of the alerts raised by the rule
+        """
+        super().__init__(name, series, max_rate, -max_rate, reference, severity)
+        self.max_rate = max_rate
+
+    def new_state(self) -> _RateState:
+        return _RateState()
+
+    def get_score(
+        self, state: _RateState, value: float, timestamp: datetime
+    ) -> Optional[float]:
+        last_value, last_time = state.last_value, state.last_time
+        state.last_value, state.last_time = value, timestamp
+        if last_time is None:
+            return None
+        interval = (timestamp - last_time).total_seconds()
+        if interval <= 0:
+            return None
+        return (value - last_value) / interval
+
+    def describe(self, state: _RateState, value: float) -> str:
+        return f"{self.get_label()} changing by {state.score:.4g}/s"
+
+
+class _EwmaState(_ScoreState):
+    __slots__ = ("mean", "variance", "count", "baseline")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.mean = 0.0
+        self.variance = 0.0
+        self.count = 0
+        # The mean the last value was compared to
+        self.baseline = 0.0
+
+
+class ZScoreRule(LimitRule):
+    """Fires when a value deviates from its rolling baseline.
+
+    The baseline is an exponentially weighted moving mean and variance, so
+    the state is three numbers instead of a window of samples. Each value is
+    compared to the baseline built from the previous values, then folded in.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        series: str,
+        threshold: float = 3.0,
+        alpha: float = 0.1,
+        warmup: int = 10,
+        reference: Optional[str] = None,
+        severity: str = "warning",
+    ):
+        """Initialize the rule.
+
+        Args:
+            name: Unique name of the rule
+            series: The series watched
+            threshold: Fire when the value is more than this many standard
+                deviations away from the mean
+            alpha: Weight of the newest value in the moving averages
+            warmup: Number of values to learn from before firing
+            reference: Optional series the value is divided by
+            severity: Severity of the alerts raised by the rule
+        """
+        super().__init__(name, series, threshold, -threshold, reference, severity)
+        self.threshold = threshold
+        self.alpha = alpha
+        self.warmup = warmup
+
+    def get_group_key(self) -> Tuple[Any, ...]:
+        return super().get_group_key() + (self.alpha, self.warmup)
+
+    def new_state(self) -> _EwmaState:
+        return _EwmaState()
+
+    def get_score(
+        self, state: _EwmaState, value: float, timestamp: datetime
+    ) -> Optional[float]:
+        score = None
+        if state.count == 0:
+            state.mean = value
+        else:
+            deviation = value - state.mean
+            if state.count >= self.warmup and state.variance > 0:
+                score = deviation / math.sqrt(state.variance)
+            state.baseline = state.mean
+            increment = self.alpha * deviation
+            state.mean += increment
+            state.variance = (1 - self.alpha) * (state.variance + deviation * increment)
+        state.count += 1
+        return score
+
+    def describe(self, state: _EwmaState, value: float) -> str:
+        return (
+            f"{self.get_label()} is {value:.4g}, {state.score:+.1f} "
+            f"standard deviations from {state.baseline:.4g}"
+        )
+
+
+def metric_values(
+    metrics: Iterable[Metric], statistic: str = "VALUE"
+) -> Dict[str, float]:
+    """Get the values of metrics, by metric name.
+
+    Args:
+        metrics: The metric samples
+        statistic: The statistic to read (default: "VALUE")
+
+    Returns:
+        A dictionary mapping metric names to values, for the metrics that have
+        the statistic.
+    """
+    values = {}
+    for metric in metrics:
+        value = metric.get_value(statistic)
+        if value is not None:
+            values[metric.name] = value
+    return values
+
+
+def disk_space_values(details: DiskSpaceDetails) -> Dict[str, float]:
+    """Get the values of the diskSpace health component.
+
+    Args:
+        details: The details of the diskSpace component
+
+    Returns:
+        The free, threshold and total disk space, keyed by DISK_FREE_SERIES,
+        DISK_THRESHOLD_SERIES and DISK_TOTAL_SERIES.
+    """
+    return {
+        DISK_FREE_SERIES: details.free,
+        DISK_THRESHOLD_SERIES: details.threshold,
+        DISK_TOTAL_SERIES: details.total,
+    }
+
+
+class _Limits:
+    """The limits of the rules of a group, sorted for binary search.
+
+    Instances are never modified: adding or removing a rule builds new lists,
+    so samples evaluated concurrently keep a consistent view.
+    """
+
+    __slots__ = ("upper", "upper_rules", "lower", "lower_rules", "sequence")
+
+    def __init__(
+        self,
+        upper: List[float],
+        upper_rules: List[Tuple[LimitRule, int]],
+        lower: List[float],
+        lower_rules: List[Tuple[LimitRule, int]],
+        sequence: int,
+    ):
+        self.upper = upper
+        self.upper_rules = upper_rules
+        self.lower = lower
+        self.lower_rules = lower_rules
+        # The sequence number of the last rule added
+        self.sequence = sequence
+
+    def add(self, rule: LimitRule, sequence: int) -> "_Limits":
+        upper, upper_rules = self.upper, self.upper_rules
+        if rule.above is not None:
+            position = bisect_right(upper, rule.above)
+            upper = upper[:position] + [rule.above] + upper[position:]
+            upper_rules = (
+                upper_rules[:position] + [(rule, sequence)] + upper_rules[position:]
+            )
+        lower, lower_rules = self.lower, self.lower_rules
+        if rule.below is not None:
+            position = bisect_right(lower, rule.below)
+            lower = lower[:position] + [rule.below] + lower[position:]
+            lower_rules = (
+                lower_rules[:position] + [(rule, sequence)] + lower_rules[position:]
+            )
+        return _Limits(upper, upper_rules, lower, lower_rules, sequence)
+
+    def remove(self, rule: LimitRule) -> "_Limits":
+        upper = [entry for entry in self.upper_rules if entry[0] is not rule]
+        lower = [entry for entry in self.lower_rules if entry[0] is not rule]
+        return _Limits(
+            [entry[0].above for entry in upper],
+            upper,
+            [entry[0].below for entry in lower],
+            lower,
+            self.sequence,
+        )
+
+    def get_firing(self, score: Optional[float]) -> List[Tuple[LimitRule, int]]:
+        """Get the rules firing for a score (a rule may be listed twice)."""
+        if score is None:
+            return []
+        return (
+            self.upper_rules[: bisect_left(self.upper, score)]
+            + self.lower_rules[bisect_right(self.lower, score) :]
+        )
+
+    def get_bounds(self, score: float) -> Tuple[float, float]:
+        """Get the closest limits below and above a score."""
+        upper, lower = self.upper, self.lower
+        upper_index = bisect_left(upper, score)
+        lower_index = bisect_right(lower, score)
+        low = max(
+            upper[upper_index - 1] if upper_index else -math.inf,
+            lower[lower_index - 1] if lower_index else -math.inf,
+        )
+        high = min(
+            upper[upper_index] if upper_index < len(upper) else math.inf,
+            lower[lower_index] if lower_index < len(lower) else math.inf,
+        )
+        return low, high
+
+
+class _RuleGroup:
+    """The rules sharing a score, and the score state of each server."""
+
+    __slots__ = ("rule", "rules", "limits", "states")
+
+    def __init__(self, rule: LimitRule):
+        # Any rule of the group, used to compute the score
+        self.rule = rule
+        self.rules: Dict[str, LimitRule] = {}
+        self.limits = _Limits([], [], [], [], 0)
+        self.states: Dict[str, _ScoreState] = {}
+
+
+class AlertEngine:
+    """Evaluates alert rules incrementally as samples arrive.
+
+    Rules are indexed by the series they watch, so a sample only evaluates the
+    rules of the series it contains. Limit rules (threshold, rate of change
+    and z-score rules) computing the same score are grouped: the score is
+    computed once per sample and group, and the rules whose limits it crossed
+    are found by binary search, so thousands of rules on a series cost about
+    as much as one. Alerts are raised when a rule starts firing for a server
+    and resolved when it stops, not on every sample.
+
+    The index is replaced rather than modified when rules change, and the
+    lock is only held while the states are updated; alerts are built and
+    stored outside of it.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[AlertRule] = (),
+        repo: Optional[TinyRepo[Alert]] = None,
+    ):
+        """Initialize the engine.
+
+        Args:
+            rules: The initial rules
+            repo: Optional history repository where alerts are stored
+        """
+        self.repo = repo
+        self._rules: Dict[str, AlertRule] = {}
+        self._groups: Dict[Tuple[Any, ...], _RuleGroup] = {}
+        # Groups and other rules by series, replaced when the rules change
+        self._groups_by_series: Dict[str, List[_RuleGroup]] = {}
+        self._rules_by_series: Dict[str, List[AlertRule]] = {}
+        self._sequence = 0
+        self._states: Dict[Tuple[str, str], _RuleState] = {}
+        self._rules_lock = threading.Lock()
+        self._lock = threading.Lock()
+        for rule in rules:
+            self.add_rule(rule)
+
+    def add_rule(self, rule: AlertRule) -> None:
+        """Add a rule, replacing any rule with the same name.
+
+        Args:
+            rule: The rule
+        """
+        with self._rules_lock:
+            self._remove_rule(rule.name)
+            self._rules[rule.name] = rule
+            if not isinstance(rule, LimitRule):
+                self._rules_by_series = _with_list(
+                    self._rules_by_series,
+                    rule.series,
+                    self._rules_by_series.get(rule.series, []) + [rule],
+                )
+                return
+            self._sequence += 1
+            key = rule.get_group_key()
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = _RuleGroup(rule)
+                self._groups_by_series = _with_list(
+                    self._groups_by_series,
+                    rule.series,
+                    self._groups_by_series.get(rule.series, []) + [group],
+                )
+            group.rules[rule.name] = rule
+            group.limits = group.limits.add(rule, self._sequence)
+
+    def remove_rule(self, name: str) -> None:
+        """Remove a rule and its state.
+
+        Args:
+            name: The name of the rule
+        """
+        with self._rules_lock:
+            self._remove_rule(name)
+
+    def _remove_rule(self, name: str) -> None:
+        rule = self._rules.pop(name, None)
+        if rule is None:
+            return
+        if not isinstance(rule, LimitRule):
+            self._rules_by_series = _with_list(
+                self._rules_by_series,
+                rule.series,
+                [
+                    other
+                    for other in self._rules_by_series[rule.series]
+                    if other is not rule
+                ],
+            )
+            with self._lock:
+                for key in [key for key in self._states if key[1] == name]:
+                    del self._states[key]
+            return
+        key = rule.get_group_key()
+        group = self._groups[key]
+        del group.rules[name]
+        if group.rules:
+            group.limits = group.limits.remove(rule)
+            if group.rule is rule:
+                group.rule = next(iter(group.rules.values()))
+            return
+        # The states of the group go with it
+        del self._groups[key]
+        self._groups_by_series = _with_list(
+            self._groups_by_series,
+            rule.series,
+            [
+                other
+                for other in self._groups_by_series[rule.series]
+                if other is not group
+            ],
+        )
+
+    def remove_server(self, server_id: str) -> None:
+        """Forget the state of every rule for a server.
+
+        Args:
+            server_id: The ID of the server
+        """
+        with self._lock:
+            for groups in self._groups_by_series.values():
+                for group in groups:
+                    group.states.pop(server_id, None)
+            for key in [key for key in self._states if key[0] == server_id]:
+                del self._states[key]
+
+    def get_firing(self, server_id: Optional[str] = None) -> Set[Tuple[str, str]]:
+        """Get the rules currently firing.
+
+        Args:
+            server_id: Only return rules firing for this server (default: all
+                servers)
+
+        Returns:
+            A set of (server ID, rule name) pairs.
+        """
+        with self._lock:
+            firing = {
+                key
+                for key, state in self._states.items()
+                if state.firing and (server_id is None or key[0] == server_id)
+            }
+            for groups in self._groups_by_series.values():
+                for group in groups:
+                    limits = group.limits
+                    for server, state in group.states.items():
+                        if server_id is not None and server != server_id:
+                            continue
+                        for rule, sequence in limits.get_firing(state.score):
+                            # Rules added since the last sample have not fired
+                            if sequence <= state.sequence:
+                                firing.add((server, rule.name))
+            return firing
+
+    def evaluate(
+        self, server_id: str, values: Dict[str, float], timestamp: datetime
+    ) -> List[Alert]:
+        """Evaluate the rules against a new sample of a server.
+
+        Args:
+            server_id: The ID of the server
+            values: The sampled values, by series name. A ratio rule is only
+                evaluated when the sample contains both of its series.
+            timestamp: When the values were sampled
+
+        Returns:
+            The alerts raised or resolved by this sample.
+        """
+        groups_by_series = self._groups_by_series
+        rules_by_series = self._rules_by_series
+        # (rule, value, message or None when resolved)
+        changes: List[Tuple[AlertRule, float, Optional[str]]] = []
+        with self._lock:
+            for series in values:
+                for group in groups_by_series.get(series, ()):
+                    rule = group.rule
+                    value = rule.get_value(values)
+                    if value is None:
+                        continue
+                    state = group.states.get(server_id)
+                    if state is None:
+                        state = group.states[server_id] = rule.new_state()
+                    old = state.score
+                    new = state.score = rule.get_score(state, value, timestamp)
+                    if (
+                        new is not None
+                        and state.low < new < state.high
+                        and state.sequence == group.limits.sequence
+                    ):
+                        # No limit crossed: the same rules are firing
+                        continue
+                    self._update_group(group, state, old, value, changes)
+                if not rules_by_series:
+                    continue
+                for rule in rules_by_series.get(series, ()):
+                    value = rule.get_value(values)
+                    if value is None:
+                        continue
+                    key = (server_id, rule.name)
+                    state = self._states.get(key)
+                    if state is None:
+                        state = self._states[key] = rule.new_state()
+                    message = rule.check(state, value, timestamp)
+                    if (message is not None) != state.firing:
+                        state.firing = message is not None
+                        changes.append((rule, value, message))
+
+        alerts = [
+            Alert(
+                rule=rule.name,
+                server_id=server_id,
+                series=rule.get_label(),
+                severity=rule.severity,
+                value=value,
+                message=message or f"{rule.get_label()} back to normal",
+                timestamp=timestamp,
+                resolved=message is None,
+            )
+            for rule, value, message in changes
+        ]
+        if self.repo is not None:
+            for alert in alerts:
+                self.repo.add(alert)
+        return alerts
+
+    @staticmethod
+    def _update_group(
+        group: _RuleGroup,
+        state: _ScoreState,
+        old: Optional[float],
+        value: float,
+        changes: List[Tuple[AlertRule, float, Optional[str]]],
+    ) -> None:
+        """Find the rules of a group that started or stopped firing."""
+        limits = group.limits
+        new, known = state.score, state.sequence
+        state.sequence = limits.sequence
+        if new is None:
+            state.low, state.high = math.inf, -math.inf
+        else:
+            state.low, state.high = limits.get_bounds(new)
+        if old is not None and new is not None and known == limits.sequence:
+            # Only the rules with a limit between the two scores change
+            low, high = (old, new) if old < new else (new, old)
+            candidates = []
+            if limits.upper:
+                start = bisect_left(limits.upper, low)
+                end = bisect_left(limits.upper, high)
+                if start < end:
+                    candidates = limits.upper_rules[start:end]
+            if limits.lower:
+                start = bisect_right(limits.lower, low)
+                end = bisect_right(limits.lower, high)
+                if start < end:
+                    candidates = candidates + limits.lower_rules[start:end]
+            if not candidates:
+                return
+        else:
+            # Rules added since the last sample have not fired yet, so check
+            # every rule firing before or after
+            candidates = limits.get_firing(old) + limits.get_firing(new)
+        seen = set()
+        for rule, sequence in candidates:
+            if rule.name in seen:
+                continue
+            seen.add(rule.name)
+            was_firing = sequence <= known and rule.is_firing(old)
+            if rule.is_firing(new) != was_firing:
+                message = None if was_firing else rule.describe(state, value)
+                changes.append((rule, value, message))
+
+
+def _with_list(
+    index: Dict[str, List[Any]], series: str, items: List[Any]
+) -> Dict[str, List[Any]]:
+    """Copy an index by series, replacing or dropping the items of a series."""
+    index = dict(index)
+    if items:
+        index[series] = items
+    else:
+        index.pop(series, None)
+    return index
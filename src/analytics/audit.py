@@ -0,0 +1,298 @@
+import threading
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Deque, Dict, FrozenSet, List, Optional, Tuple
+
+from ..actuator.client import ActuatorClient
+from ..actuator.containers.auditevents import AuditEvent, AuditEvents
+
+AUTHENTICATION_FAILURE = "AUTHENTICATION_FAILURE"
+
+CounterKey = Tuple[str, str]
+
+
+def event_key(event: AuditEvent) -> Tuple:
+    """Get a key identifying an audit event.
+
+    Args:
+        event: The AuditEvent
+
+    Returns:
+        A hashable tuple of the timestamp, principal, type and data.
+    """
+    data = event.data.model_dump()
+    return (
+        event.timestamp,
+        event.principal,
+        event.type,
+        tuple(sorted((key, repr(value)) for key, value in data.items())),
+    )
+
+
+class TimeBucketCounter:
+    """Event counts per key in fixed-width time buckets.
+
+    Each key keeps at most `retention` buckets, and at most `max_keys` keys
+    are tracked: the key updated least recently is dropped first, so memory
+    stays bounded even when every failed login uses a different principal.
+    """
+
+    def __init__(
+        self, bucket_seconds: int = 60, retention: int = 60, max_keys: int = 10000
+    ):
+        """Initialize the counter.
+
+        Args:
+            bucket_seconds: Width of a bucket in seconds
+            retention: Number of buckets kept per key
+            max_keys: Maximum number of keys tracked
+        """
+        self.bucket_seconds = bucket_seconds
+        self.retention = retention
+        self.max_keys = max_keys
+        self._series: "OrderedDict[CounterKey, Deque[List[int]]]" = OrderedDict()
+        self._latest: Optional[int] = None
+
+    def _bucket(self, timestamp: datetime) -> int:
+        return int(timestamp.timestamp() // self.bucket_seconds)
+
+    def add(self, key: CounterKey, timestamp: datetime, count: int = 1) -> None:
+        """Count an event.
+
+        Args:
+            key: The (type, principal) of the event
+            timestamp: When the event happened
+            count: The number of events
+        """
+        bucket = self._bucket(timestamp)
+        if self._latest is None or bucket > self._latest:
+            self._latest = bucket
+        oldest = self._latest - self.retention + 1
+        if bucket < oldest:
+            return
+
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = deque()
+            if len(self._series) > self.max_keys:
+                self._series.popitem(last=False)
+        else:
+            self._series.move_to_end(key)
+
+        if not series or series[-1][0] < bucket:
+            series.append([bucket, count])
+        else:
+            # Late event, find its bucket from the most recent one
+            for index in range(len(series) - 1, -1, -1):
+                if series[index][0] == bucket:
+                    series[index][1] += count
+                    break
+                if series[index][0] < bucket:
+                    series.insert(index + 1, [bucket, count])
+                    break
+            else:
+                series.appendleft([bucket, count])
+        while series[0][0] < oldest:
+            series.popleft()
+
+    def get_total(self, key: CounterKey, buckets: int = 1) -> int:
+        """Get the number of events of a key in the latest buckets.
+
+        Args:
+            key: The (type, principal)
+            buckets: The number of buckets, ending with the latest one
+
+        Returns:
+            The number of events.
+        """
+        series = self._series.get(key)
+        if series is None or self._latest is None:
+            return 0
+        oldest = self._latest - buckets + 1
+        return sum(count for bucket, count in series if bucket >= oldest)
+
+    def get_series(self, key: CounterKey) -> Dict[datetime, int]:
+        """Get the counts of a key per bucket.
+
+        Args:
+            key: The (type, principal)
+
+        Returns:
+            A dictionary mapping bucket start times to counts, oldest first.
+        """
+        series = self._series.get(key, ())
+        return {
+            datetime.fromtimestamp(bucket * self.bucket_seconds, timezone.utc): count
+            for bucket, count in series
+        }
+
+    def get_keys(self) -> List[CounterKey]:
+        """Get the tracked keys.
+
+        Returns:
+            A list of (type, principal) tuples.
+        """
+        return list(self._series)
+
+
+class _ServerState:
+    __slots__ = ("last_timestamp", "last_keys")
+
+    def __init__(self) -> None:
+        self.last_timestamp: Optional[datetime] = None
+        self.last_keys: FrozenSet[Tuple] = frozenset()
+
+
+class AuditEventStream:
+    """Incremental ingestion of the audit events of many servers.
+
+    /actuator/auditevents returns the whole audit repository unless `after`
+    is given. The stream remembers the timestamp of the last event seen from
+    each server and asks only for events from that time on; since `after` is
+    inclusive, the events at exactly that timestamp are remembered too and
+    skipped when they come back. New events are counted per type and
+    principal in time buckets, so bursts such as AUTHENTICATION_FAILURE per
+    minute can be checked without storing the events themselves.
+    """
+
+    def __init__(
+        self, bucket_seconds: int = 60, retention: int = 60, max_keys: int = 10000
+    ):
+        """Initialize the stream.
+
+        Args:
+            bucket_seconds: Width of a counter bucket in seconds
+            retention: Number of buckets kept per type and principal
+            max_keys: Maximum number of (type, principal) counters
+        """
+        self.counter = TimeBucketCounter(bucket_seconds, retention, max_keys)
+        self._servers: Dict[str, _ServerState] = {}
+        self._lock = threading.Lock()
+
+    def get_after(self, server_id: str) -> Optional[datetime]:
+        """Get the `after` parameter for the next poll of a server.
+
+        Args:
+            server_id: The ID of the server
+
+        Returns:
+            The timestamp of the last event seen, or None if none was seen.
+        """
+        with self._lock:
+            state = self._servers.get(server_id)
+            return state.last_timestamp if state is not None else None
+
+    def ingest(self, server_id: str, events: AuditEvents) -> List[AuditEvent]:
+        """Add the events of a poll, skipping those already seen.
+
+        Args:
+            server_id: The ID of the server
+            events: The /actuator/auditevents response
+
+        Returns:
+            The new events, oldest first.
+        """
+        with self._lock:
+            state = self._servers.setdefault(server_id, _ServerState())
+            new_events = []
+            seen = set()
+            for event in sorted(events.events, key=lambda event: event.timestamp):
+                if (
+                    state.last_timestamp is not None
+                    and event.timestamp < state.last_timestamp
+                ):
+                    continue
+                key = event_key(event)
+                if key in seen or (
+                    event.timestamp == state.last_timestamp and key in state.last_keys
+                ):
+                    continue
+                seen.add(key)
+                new_events.append(event)
+                self.counter.add((event.type, event.principal), event.timestamp)
+
+            if new_events:
+                last_timestamp = new_events[-1].timestamp
+                last_keys = {
+                    event_key(event)
+                    for event in new_events
+                    if event.timestamp == last_timestamp
+                }
+                if last_timestamp == state.last_timestamp:
+                    last_keys |= state.last_keys
+                state.last_timestamp = last_timestamp
+                state.last_keys = frozenset(last_keys)
+            return new_events
+
+    def poll(self, server_id: str, client: ActuatorClient) -> List[AuditEvent]:
+        """Fetch and ingest the events of a server since the last poll.
+
+        Args:
+            server_id: The ID of the server
+            client: The server's ActuatorClient
+
+        Returns:
+            The new events, oldest first.
+
+        Raises:
+            urllib.error.URLError: If the request fails.
+        """
+        events = client.get_audit_events(after=self.get_after(server_id))
+        return self.ingest(server_id, events)
+
+    def remove_server(self, server_id: str) -> None:
+        """Forget the last event seen from a server.
+
+        Args:
+            server_id: The ID of the server
+        """
+        with self._lock:
+            self._servers.pop(server_id, None)
+
+    def get_count(
+        self, type: str, principal: Optional[str] = None, buckets: int = 1
+    ) -> int:
+        """Get the number of events of a type in the latest buckets.
+
+        Args:
+            type: The event type, e.g. "AUTHENTICATION_FAILURE"
+            principal: Only count the events of this principal
+            buckets: The number of buckets, ending with the latest one
+
+        Returns:
+            The number of events.
+        """
+        with self._lock:
+            if principal is not None:
+                return self.counter.get_total((type, principal), buckets)
+            return sum(
+                self.counter.get_total(key, buckets)
+                for key in self.counter.get_keys()
+                if key[0] == type
+            )
+
+    def find_bursts(
+        self, threshold: int, type: str = AUTHENTICATION_FAILURE, buckets: int = 1
+    ) -> Dict[str, int]:
+        """Find the principals with many events of a type, e.g. brute force.
+
+        Args:
+            threshold: Minimum number of events
+            type: The event type
+            buckets: The number of buckets, ending with the latest one
+
+        Returns:
+            A dictionary mapping principals to their event counts, highest first.
+        """
+        with self._lock:
+            counts = {
+                key[1]: self.counter.get_total(key, buckets)
+                for key in self.counter.get_keys()
+                if key[0] == type
+            }
+        bursts = {
+            principal: count
+            for principal, count in counts.items()
+            if count >= threshold
+        }
+        return dict(sorted(bursts.items(), key=lambda item: item[1], reverse=True))
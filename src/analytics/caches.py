@@ -0,0 +1,271 @@
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from ..actuator.client import ActuatorClient
+from ..actuator.containers.caches import Caches
+from ..actuator.containers.common.extra_base_model import ExtraBaseModel
+from ..tinydb.tiny_repo import TinyRepo
+from .drilldown import MetricDrillDown
+
+GETS_METRIC = "cache.gets"
+PUTS_METRIC = "cache.puts"
+EVICTIONS_METRIC = "cache.evictions"
+SIZE_METRIC = "cache.size"
+
+CACHE_MANAGER_TAG = "cache.manager"
+_CACHE_MANAGER_SUFFIX = "cachemanager"
+
+# (field, metric, extra tags, statistic) of every value sampled per cache
+_CACHE_SERIES = (
+    ("hits", GETS_METRIC, {"result": "hit"}, "COUNT"),
+    ("misses", GETS_METRIC, {"result": "miss"}, "COUNT"),
+    ("puts", PUTS_METRIC, {}, "COUNT"),
+    ("evictions", EVICTIONS_METRIC, {}, "COUNT"),
+    ("size", SIZE_METRIC, {}, "VALUE"),
+)
+
+
+class CacheSample(ExtraBaseModel):
+    """The cumulative metrics of one cache at one point in time."""
+
+    cache_manager: str
+    cache: str
+    timestamp: datetime
+    hits: Optional[float] = None
+    misses: Optional[float] = None
+    puts: Optional[float] = None
+    evictions: Optional[float] = None
+    size: Optional[float] = None
+
+
+class CacheRates(ExtraBaseModel):
+    """The activity of one cache between two samples."""
+
+    cache_manager: str
+    cache: str
+    timestamp: datetime
+    interval: float
+    gets_rate: Optional[float] = None
+    hit_ratio: Optional[float] = None
+    put_rate: Optional[float] = None
+    eviction_rate: Optional[float] = None
+    size: Optional[float] = None
+
+    def is_thrashing(self, min_eviction_rate: float, max_hit_ratio: float) -> bool:
+        """Check whether the cache evicts a lot while rarely being hit.
+
+        Args:
+            min_eviction_rate: Evictions per second from which a cache thrashes
+            max_hit_ratio: Hit ratio below which a cache thrashes
+
+        Returns:
+            True if both thresholds are crossed.
+        """
+        return (
+            self.eviction_rate is not None
+            and self.eviction_rate >= min_eviction_rate
+            and self.hit_ratio is not None
+            and self.hit_ratio <= max_hit_ratio
+        )
+
+
+def get_cache_manager_tag(bean_name: str) -> str:
+    """Get the cache.manager tag value Spring Boot uses for a cache manager.
+
+    Args:
+        bean_name: The bean name of the cache manager, as listed by
+            /actuator/caches
+
+    Returns:
+        The bean name without its "CacheManager" suffix (ignoring case), e.g.
+        "redis" for "redisCacheManager"; a name that is only the suffix, such
+        as the default "cacheManager", is kept as is.
+    """
+    if len(bean_name) > len(_CACHE_MANAGER_SUFFIX) and bean_name.lower().endswith(
+        _CACHE_MANAGER_SUFFIX
+    ):
+        return bean_name[: -len(_CACHE_MANAGER_SUFFIX)]
+    return bean_name
+
+
+def _delta(current: Optional[float], previous: Optional[float]) -> Optional[float]:
+    if current is None or previous is None:
+        return None
+    return current - previous
+
+
+class CacheMonitor:
+    """Samples the metrics of the caches of a server and derives their rates.
+
+    The caches listed by /actuator/caches are joined with the cache.gets
+    (result=hit|miss), cache.puts, cache.evictions and cache.size meters
+    using cache and cache.manager tag filters, fetched concurrently. Caches
+    whose implementation does not publish statistics are skipped. The hit
+    ratio and eviction rate are derived from the counter deltas between two
+    samples, so they describe recent traffic rather than the whole uptime.
+
+    One CacheMonitor is kept per server.
+    """
+
+    def __init__(
+        self,
+        client: ActuatorClient,
+        max_caches: int = 200,
+        max_workers: int = 8,
+        repo: Optional[TinyRepo[CacheRates]] = None,
+    ):
+        """Initialize the monitor.
+
+        Args:
+            client: The client of the server to query
+            max_caches: Maximum number of caches sampled
+            max_workers: Maximum number of concurrent requests
+            repo: Optional history repository where derived rates are stored
+        """
+        self.max_caches = max_caches
+        self.drill_down = MetricDrillDown(client, max_caches, max_workers)
+        self.repo = repo
+        self._previous: Dict[Tuple[str, str], CacheSample] = {}
+        self._lock = threading.Lock()
+
+    def sample(
+        self, caches: Caches, timestamp: Optional[datetime] = None
+    ) -> List[CacheSample]:
+        """Fetch the metrics of every cache.
+
+        Args:
+            caches: The /actuator/caches snapshot
+            timestamp: Timestamp of the samples (default: now, in UTC)
+
+        Returns:
+            A list of CacheSample objects, for the caches with metrics.
+        """
+        sampled_at = timestamp or datetime.now(timezone.utc)
+        names = [
+            (manager, cache)
+            for manager, cache_names in caches.get_all_cache_names().items()
+            for cache in cache_names
+        ][: self.max_caches]
+
+        managers = {get_cache_manager_tag(manager): manager for manager, _ in names}
+
+        values: Dict[Tuple[str, str], Dict[str, float]] = {}
+        for field, metric, extra_tags, statistic in _CACHE_SERIES:
+            combinations = [
+                {
+                    "cache": cache,
+                    CACHE_MANAGER_TAG: get_cache_manager_tag(manager),
+                    **extra_tags,
+                }
+                for manager, cache in names
+            ]
+            for labelled in self.drill_down.fetch(metric, combinations, sampled_at):
+                value = labelled.measurements.get(statistic)
+                if value is not None:
+                    manager = managers[labelled.tags[CACHE_MANAGER_TAG]]
+                    key = (manager, labelled.tags["cache"])
+                    values.setdefault(key, {})[field] = value
+
+        return [
+            CacheSample(
+                cache_manager=manager,
+                cache=cache,
+                timestamp=sampled_at,
+                **values[(manager, cache)],
+            )
+            for manager, cache in names
+            if (manager, cache) in values
+        ]
+
+    def update(self, samples: List[CacheSample]) -> List[CacheRates]:
+        """Derive the rates of the caches since their previous samples.
+
+        Args:
+            samples: New samples, see sample()
+
+        Returns:
+            A list of CacheRates objects, for the caches sampled before. A
+            counter going backwards (a restart) resets the cache's baseline.
+        """
+        rates = []
+        with self._lock:
+            for sample in samples:
+                key = (sample.cache_manager, sample.cache)
+                previous = self._previous.get(key)
+                self._previous[key] = sample
+                if previous is None:
+                    continue
+                interval = (sample.timestamp - previous.timestamp).total_seconds()
+                if interval <= 0:
+                    continue
+                hits = _delta(sample.hits, previous.hits)
+                misses = _delta(sample.misses, previous.misses)
+                puts = _delta(sample.puts, previous.puts)
+                evictions = _delta(sample.evictions, previous.evictions)
+                deltas = [hits, misses, puts, evictions]
+                if any(delta is not None and delta < 0 for delta in deltas):
+                    continue
+
+                gets = (
+                    hits + misses if hits is not None and misses is not None else None
+                )
+                rates.append(
+                    CacheRates(
+                        cache_manager=sample.cache_manager,
+                        cache=sample.cache,
+                        timestamp=sample.timestamp,
+                        interval=interval,
+                        gets_rate=gets / interval if gets is not None else None,
+                        hit_ratio=hits / gets if gets else None,
+                        put_rate=puts / interval if puts is not None else None,
+                        eviction_rate=(
+                            evictions / interval if evictions is not None else None
+                        ),
+                        size=sample.size,
+                    )
+                )
+
+        if self.repo is not None:
+            for cache_rates in rates:
+                self.repo.add(cache_rates)
+        return rates
+
+    def poll(
+        self, caches: Caches, timestamp: Optional[datetime] = None
+    ) -> List[CacheRates]:
+        """Sample every cache and derive its rates.
+
+        Args:
+            caches: The /actuator/caches snapshot
+            timestamp: Timestamp of the samples (default: now, in UTC)
+
+        Returns:
+            A list of CacheRates objects.
+        """
+        return self.update(self.sample(caches, timestamp))
+
+    @staticmethod
+    def find_thrashing(
+        rates: List[CacheRates],
+        min_eviction_rate: float = 1.0,
+        max_hit_ratio: float = 0.5,
+    ) -> List[CacheRates]:
+        """Find the caches that evict a lot while rarely being hit.
+
+        Args:
+            rates: The result of update() or poll()
+            min_eviction_rate: Evictions per second from which a cache thrashes
+            max_hit_ratio: Hit ratio below which a cache thrashes
+
+        Returns:
+            The thrashing caches, most evictions first.
+        """
+        thrashing = [
+            cache_rates
+            for cache_rates in rates
+            if cache_rates.is_thrashing(min_eviction_rate, max_hit_ratio)
+        ]
+        return sorted(
+            thrashing, key=lambda cache_rates: cache_rates.eviction_rate, reverse=True
+        )
@@ -0,0 +1,167 @@
+import threading
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from ..actuator.containers.health import HealthCheck, SslComponent, SslDetails
+
+
+@dataclass(frozen=True, order=True)
+class CertificateExpiry:
+    """A certificate served by a server, ordered by end of validity."""
+
+    validity_ends: datetime
+    server_id: str
+    alias: str
+    subject: str
+    serial_number: str
+    status: str
+
+    def get_days_to_expiry(self, now: Optional[datetime] = None) -> float:
+        """Get the number of days until the certificate expires.
+
+        Args:
+            now: The reference time (default: now, in UTC)
+
+        Returns:
+            The number of days, negative if the certificate has expired.
+        """
+        now = now or datetime.now(timezone.utc)
+        return (self.validity_ends - now).total_seconds() / 86400
+
+
+def get_certificate_expiries(
+    server_id: str, details: SslDetails
+) -> List[CertificateExpiry]:
+    """List the certificates of an ssl health component.
+
+    Args:
+        server_id: The ID of the server
+        details: The details of the ssl component
+
+    Returns:
+        A CertificateExpiry for every certificate whose end of validity is
+        known.
+    """
+    expiries = []
+    for chain in details.get_chains():
+        for certificate in chain.certificates:
+            if certificate.validity_ends is None:
+                continue
+            expiries.append(
+                CertificateExpiry(
+                    validity_ends=certificate.validity_ends,
+                    server_id=server_id,
+                    alias=chain.alias or "",
+                    subject=certificate.subject or "",
+                    serial_number=certificate.serial_number or "",
+                    status=certificate.validity.status
+                    if certificate.validity is not None
+                    else "",
+                )
+            )
+    return expiries
+
+
+class CertificateExpiryIndex:
+    """Certificates of a fleet ordered by soonest expiry.
+
+    The index is a sorted list updated per server: a health poll removes the
+    server's previous certificates and inserts the new ones by binary search,
+    so listing the soonest-expiring certificates is a slice of the list.
+    """
+
+    def __init__(self) -> None:
+        self._entries: List[CertificateExpiry] = []
+        self._by_server: Dict[str, List[CertificateExpiry]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, server_id: str) -> None:
+        for entry in self._by_server.pop(server_id, ()):
+            position = bisect_left(self._entries, entry)
+            if position < len(self._entries) and self._entries[position] == entry:
+                del self._entries[position]
+
+    def update_details(self, server_id: str, details: SslDetails) -> None:
+        """Replace the certificates of a server.
+
+        Args:
+            server_id: The ID of the server
+            details: The details of the server's ssl health component
+        """
+        expiries = get_certificate_expiries(server_id, details)
+        with self._lock:
+            if self._by_server.get(server_id) == expiries:
+                return
+            self._discard(server_id)
+            for entry in expiries:
+                insort(self._entries, entry)
+            self._by_server[server_id] = expiries
+
+    def update(self, server_id: str, health: HealthCheck) -> None:
+        """Replace the certificates of a server from its health.
+
+        Servers without an ssl component (or without details) keep no
+        certificates in the index.
+
+        Args:
+            server_id: The ID of the server
+            health: The server's /actuator/health response
+        """
+        component = health.get_component("ssl")
+        if isinstance(component, SslComponent) and component.details is not None:
+            self.update_details(server_id, component.details)
+        else:
+            self.remove(server_id)
+
+    def remove(self, server_id: str) -> None:
+        """Forget the certificates of a server.
+
+        Args:
+            server_id: The ID of the server
+        """
+        with self._lock:
+            self._discard(server_id)
+
+    def get_soonest(self, limit: int = 20) -> List[CertificateExpiry]:
+        """Get the certificates expiring first.
+
+        Args:
+            limit: Maximum number of certificates
+
+        Returns:
+            A list of certificates, soonest expiry first (expired ones first).
+        """
+        with self._lock:
+            return self._entries[:limit]
+
+    def get_expiring_before(self, deadline: datetime) -> List[CertificateExpiry]:
+        """Get the certificates that expire before a deadline.
+
+        Args:
+            deadline: The deadline
+
+        Returns:
+            A list of certificates, soonest expiry first.
+        """
+        with self._lock:
+            end = bisect_left(
+                self._entries, deadline, key=lambda entry: entry.validity_ends
+            )
+            return self._entries[:end]
+
+    def get_server_certificates(self, server_id: str) -> List[CertificateExpiry]:
+        """Get the certificates of a server.
+
+        Args:
+            server_id: The ID of the server
+
+        Returns:
+            A list of certificates, soonest expiry first.
+        """
+        with self._lock:
+            return sorted(self._by_server.get(server_id, ()))
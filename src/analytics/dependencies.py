@@ -0,0 +1,148 @@
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+from ..actuator.containers.sbom import SBOM, component_key, version_key
+
+
+def _get_name(key: str) -> str:
+    return key.rpartition(":")[2]
+
+
+@dataclass(frozen=True)
+class DependencyUsage:
+    """A component version shipped by a server."""
+
+    server_id: str
+    key: str
+    version: str
+
+
+class FleetDependencyIndex:
+    """Inverted index from group:name to the servers shipping a component.
+
+    Each server's SBOM is indexed when it is updated, so a query such as
+    "which servers ship log4j-core below 2.17" only looks at the versions of
+    that one component across the fleet.
+    """
+
+    def __init__(self) -> None:
+        self._versions: Dict[str, Dict[str, Set[str]]] = {}
+        self._keys_by_server: Dict[str, Set[str]] = {}
+        self._keys_by_name: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def _discard(self, server_id: str) -> None:
+        for key in self._keys_by_server.pop(server_id, ()):
+            servers = self._versions[key]
+            del servers[server_id]
+            if not servers:
+                del self._versions[key]
+                name = _get_name(key)
+                keys = self._keys_by_name[name]
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_name[name]
+
+    def update(self, server_id: str, sbom: SBOM) -> None:
+        """Replace the components of a server.
+
+        Args:
+            server_id: The ID of the server
+            sbom: The server's application SBOM
+        """
+        versions: Dict[str, Set[str]] = {}
+        for component in sbom.components:
+            versions.setdefault(component_key(component), set()).add(component.version)
+        with self._lock:
+            self._discard(server_id)
+            for key, component_versions in versions.items():
+                self._versions.setdefault(key, {})[server_id] = component_versions
+                self._keys_by_name.setdefault(_get_name(key), set()).add(key)
+            self._keys_by_server[server_id] = set(versions)
+
+    def remove(self, server_id: str) -> None:
+        """Forget the components of a server.
+
+        Args:
+            server_id: The ID of the server
+        """
+        with self._lock:
+            self._discard(server_id)
+
+    def find(
+        self,
+        name: str,
+        group: Optional[str] = None,
+        below: Optional[str] = None,
+        at_least: Optional[str] = None,
+    ) -> List[DependencyUsage]:
+        """Find the servers shipping a component, optionally in a version range.
+
+        Args:
+            name: The component name, e.g. "log4j-core"
+            group: The component group, e.g. "org.apache.logging.log4j"
+                (default: any group)
+            below: Only match versions lower than this, e.g. "2.17.0"
+            at_least: Only match versions equal to or higher than this
+
+        Returns:
+            A list of DependencyUsage objects, sorted by server ID, version
+            and key.
+        """
+        upper = version_key(below) if below is not None else None
+        lower = version_key(at_least) if at_least is not None else None
+        with self._lock:
+            if group:
+                keys = [f"{group}:{name}"]
+            else:
+                keys = list(self._keys_by_name.get(name, ()))
+            servers = [
+                (key, server_id, list(versions))
+                for key in keys
+                for server_id, versions in self._versions.get(key, {}).items()
+            ]
+
+        usages = []
+        for key, server_id, versions in servers:
+            for version in versions:
+                parsed = version_key(version)
+                if upper is not None and not parsed < upper:
+                    continue
+                if lower is not None and parsed < lower:
+                    continue
+                usages.append(DependencyUsage(server_id, key, version))
+        return sorted(
+            usages,
+            key=lambda usage: (usage.server_id, version_key(usage.version), usage.key),
+        )
+
+    def get_versions(
+        self, name: str, group: Optional[str] = None
+    ) -> Dict[str, List[str]]:
+        """Get the versions of a component in use across the fleet.
+
+        Args:
+            name: The component name
+            group: The component group (default: any group)
+
+        Returns:
+            A dictionary mapping versions, lowest first, to the sorted IDs of
+            the servers shipping them.
+        """
+        by_version: Dict[str, List[str]] = {}
+        for usage in self.find(name, group):
+            by_version.setdefault(usage.version, []).append(usage.server_id)
+        return {
+            version: sorted(by_version[version])
+            for version in sorted(by_version, key=version_key)
+        }
+
+    def get_keys(self) -> List[str]:
+        """Get the group:name of every component shipped by the fleet.
+
+        Returns:
+            A sorted list of component keys.
+        """
+        with self._lock:
+            return sorted(self._versions)
@@ -0,0 +1,177 @@
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+from ..actuator.containers.env import Env
+from ..actuator.containers.info import Info
+from ..actuator.containers.sbom import SBOM, component_key
+
+ENV_PREFIX = "env:"
+INFO_PREFIX = "info:"
+SBOM_PREFIX = "sbom:"
+ACTIVE_PROFILES_KEY = "profiles:active"
+
+# Properties that legitimately differ between instances of the same service
+DEFAULT_IGNORED_KEYS = frozenset(
+    {
+        "env:pid",
+        "env:local.server.port",
+        "env:hostname",
+        "env:computername",
+        "env:user.dir",
+        "env:java.io.tmpdir",
+        "env:spring.application.pid",
+    }
+)
+
+
+def _digest(value: str) -> str:
+    return hashlib.blake2b(value.encode(), digest_size=8).hexdigest()
+
+
+@dataclass
+class Fingerprint:
+    """Per-key hashes of a server's configuration snapshot."""
+
+    values: Dict[str, str] = field(default_factory=dict)
+    digests: Dict[str, str] = field(default_factory=dict)
+    digest: str = ""
+
+
+def fingerprint_snapshot(
+    env: Optional[Env] = None,
+    info: Optional[Info] = None,
+    sbom: Optional[SBOM] = None,
+    ignore: Optional[Callable[[str], bool]] = None,
+) -> Fingerprint:
+    """Compute the fingerprint of a server's configuration.
+
+    Keys are prefixed by their origin: "env:" plus the canonical name of each
+    effective property, "profiles:active", "info:build.version",
+    "info:git.commit.id", "info:java.version" and "sbom:" plus the
+    group:name of each SBOM component, whose value is its version.
+
+    Args:
+        env: The /actuator/env snapshot
+        info: The /actuator/info snapshot
+        sbom: The application SBOM snapshot
+        ignore: Predicate selecting keys to leave out (default: keys in
+            DEFAULT_IGNORED_KEYS)
+
+    Returns:
+        A Fingerprint with the value and hash of every key and an overall hash.
+    """
+    values: Dict[str, str] = {}
+    if env is not None:
+        values[ACTIVE_PROFILES_KEY] = ",".join(sorted(env.active_profiles))
+        for name, resolved in env.get_resolved_properties().items():
+            values[ENV_PREFIX + name] = str(resolved.value.value)
+    if info is not None:
+        if info.build is not None:
+            values[INFO_PREFIX + "build.version"] = info.build.version
+        if info.git is not None:
+            values[INFO_PREFIX + "git.commit.id"] = info.git.commit.id.full
+        if info.java is not None:
+            values[INFO_PREFIX + "java.version"] = info.java.version
+    if sbom is not None:
+        for component in sbom.components:
+            values[SBOM_PREFIX + component_key(component)] = component.version
+
+    is_ignored = ignore or DEFAULT_IGNORED_KEYS.__contains__
+    values = {key: value for key, value in values.items() if not is_ignored(key)}
+    digests = {key: _digest(value) for key, value in values.items()}
+    overall = _digest("\n".join(f"{key}={digests[key]}" for key in sorted(digests)))
+    return Fingerprint(values, digests, overall)
+
+
+@dataclass
+class DriftReport:
+    """Result of comparing the fingerprints of a fleet."""
+
+    groups: List[List[str]]
+    differing_keys: Dict[str, Dict[Optional[str], List[str]]]
+
+    def is_consistent(self) -> bool:
+        """Check whether every server has the same configuration.
+
+        Returns:
+            True if there is at most one group of identical servers.
+        """
+        return len(self.groups) <= 1
+
+
+class DriftEngine:
+    """Detects configuration drift across servers running the same service.
+
+    Servers with identical fingerprints are grouped by their overall hash, so
+    comparing the fleet only compares one representative per group. For a
+    fleet of n servers in g groups with k keys, a report costs O(n + g * k)
+    instead of the O(n^2 * k) of pairwise diffing.
+    """
+
+    def __init__(self) -> None:
+        self._fingerprints: Dict[str, Fingerprint] = {}
+        self._lock = threading.Lock()
+
+    def update(self, server_id: str, fingerprint: Fingerprint) -> None:
+        """Record the latest fingerprint of a server.
+
+        Args:
+            server_id: The ID of the server
+            fingerprint: The server's fingerprint
+        """
+        with self._lock:
+            self._fingerprints[server_id] = fingerprint
+
+    def remove(self, server_id: str) -> None:
+        """Forget a server.
+
+        Args:
+            server_id: The ID of the server
+        """
+        with self._lock:
+            self._fingerprints.pop(server_id, None)
+
+    def get_report(self, server_ids: Optional[Iterable[str]] = None) -> DriftReport:
+        """Compare the fingerprints of the fleet.
+
+        Args:
+            server_ids: The servers to compare (default: every known server)
+
+        Returns:
+            A DriftReport with the groups of identical servers, largest first,
+            and for every key whose value differs, the servers having each
+            value (None for servers where the key is missing).
+        """
+        with self._lock:
+            if server_ids is None:
+                fingerprints = dict(self._fingerprints)
+            else:
+                fingerprints = {
+                    server_id: self._fingerprints[server_id]
+                    for server_id in server_ids
+                    if server_id in self._fingerprints
+                }
+
+        members: Dict[str, List[str]] = {}
+        for server_id, fingerprint in fingerprints.items():
+            members.setdefault(fingerprint.digest, []).append(server_id)
+        groups = sorted(members.values(), key=len, reverse=True)
+
+        representatives = [fingerprints[group[0]] for group in groups]
+        keys = set()
+        for representative in representatives:
+            keys.update(representative.digests)
+
+        differing: Dict[str, Dict[Optional[str], List[str]]] = {}
+        for key in sorted(keys):
+            first = representatives[0].digests.get(key)
+            if all(rep.digests.get(key) == first for rep in representatives):
+                continue
+            by_value: Dict[Optional[str], List[str]] = {}
+            for representative, group in zip(representatives, groups):
+                by_value.setdefault(representative.values.get(key), []).extend(group)
+            differing[key] = by_value
+
+        return DriftReport(groups, differing)
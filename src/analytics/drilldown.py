@@ -0,0 +1,161 @@
+import itertools
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+from ..actuator.client import ActuatorClient
+from ..actuator.containers.common.extra_base_model import ExtraBaseModel
+from ..actuator.containers.metrics import Metric
+from ..tinydb.tiny_repo import TinyRepo
+
+
+def series_key(metric_name: str, tags: Dict[str, str]) -> str:
+    """Build the key of a labelled series.
+
+    Args:
+        metric_name: The metric name
+        tags: The tag values of the series
+
+    Returns:
+        A key such as "http.server.requests{status=200,uri=/api/info}".
+    """
+    if not tags:
+        return metric_name
+    labels = ",".join(f"{key}={tags[key]}" for key in sorted(tags))
+    return f"{metric_name}{{{labels}}}"
+
+
+class LabelledSample(ExtraBaseModel):
+    """A metric sample restricted to one combination of tag values."""
+
+    metric: str
+    series: str
+    tags: Dict[str, str]
+    measurements: Dict[str, float]
+    timestamp: datetime
+
+
+class MetricDrillDown:
+    """Breaks a metric down by its tag values.
+
+    The metric is expanded into the combinations of the values of the chosen
+    tags (as listed in availableTags), and each combination is fetched with
+    ?tag=key:value filters, concurrently. Combinations beyond max_combinations
+    are not fetched, so a high-cardinality tag cannot flood the server.
+    """
+
+    def __init__(
+        self,
+        client: ActuatorClient,
+        max_combinations: int = 50,
+        max_workers: int = 8,
+        repo: Optional[TinyRepo[LabelledSample]] = None,
+    ):
+        """Initialize the drill-down engine.
+
+        Args:
+            client: The client of the server to query
+            max_combinations: Maximum number of tag combinations fetched per call
+            max_workers: Maximum number of concurrent requests
+            repo: Optional history repository where labelled samples are stored
+        """
+        self.client = client
+        self.max_combinations = max_combinations
+        self.max_workers = max_workers
+        self.repo = repo
+
+    def expand(self, metric: Metric, tags: Sequence[str]) -> List[Dict[str, str]]:
+        """Expand a metric into combinations of tag values.
+
+        Args:
+            metric: The metric, with its availableTags
+            tags: The names of the tags to break down by
+
+        Returns:
+            A list of tag filters, at most max_combinations long. Tags the metric
+            does not have are ignored.
+        """
+        names = [name for name in tags if metric.has_tag(name)]
+        if not names:
+            return []
+        value_lists = [metric.get_tag_values(name) for name in names]
+        combinations = itertools.islice(
+            itertools.product(*value_lists), self.max_combinations
+        )
+        return [dict(zip(names, values)) for values in combinations]
+
+    def _fetch(self, metric_name: str, tags: Dict[str, str]) -> Optional[Metric]:
+        try:
+            return self.client.get_metric(metric_name, tags)
+        except urllib.error.HTTPError as e:
+            # 404: no meter matches this combination of tag values
+            if e.code == 404:
+                return None
+            raise
+
+    def fetch(
+        self,
+        metric_name: str,
+        combinations: Sequence[Dict[str, str]],
+        timestamp: Optional[datetime] = None,
+    ) -> List[LabelledSample]:
+        """Fetch a metric for several tag combinations concurrently.
+
+        Args:
+            metric_name: The metric name
+            combinations: The tag filters to fetch
+            timestamp: Timestamp of the samples (default: now, in UTC)
+
+        Returns:
+            A list of LabelledSample objects, one per combination that matched
+            at least one meter, in the order of the combinations.
+        """
+        combinations = list(combinations)[: self.max_combinations]
+        if not combinations:
+            return []
+        sampled_at = timestamp or datetime.now(timezone.utc)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(combinations))
+        ) as executor:
+            metrics = list(
+                executor.map(lambda tags: self._fetch(metric_name, tags), combinations)
+            )
+
+        samples = [
+            LabelledSample(
+                metric=metric_name,
+                series=series_key(metric_name, tags),
+                tags=tags,
+                measurements={
+                    measurement.statistic: measurement.value
+                    for measurement in metric.measurements
+                },
+                timestamp=sampled_at,
+            )
+            for tags, metric in zip(combinations, metrics)
+            if metric is not None
+        ]
+        if self.repo is not None:
+            for sample in samples:
+                self.repo.add(sample)
+        return samples
+
+    def drill_down(
+        self,
+        metric: Metric,
+        tags: Sequence[str],
+        timestamp: Optional[datetime] = None,
+    ) -> List[LabelledSample]:
+        """Expand a metric by tags and fetch every combination.
+
+        Args:
+            metric: The metric, with its availableTags
+            tags: The names of the tags to break down by, e.g. ["uri"]
+            timestamp: Timestamp of the samples (default: now, in UTC)
+
+        Returns:
+            A list of LabelledSample objects.
+        """
+        return self.fetch(metric.name, self.expand(metric, tags), timestamp)
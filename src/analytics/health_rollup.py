@@ -0,0 +1,178 @@
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from ..actuator.containers.health import HealthCheck
+
+UNREACHABLE = "UNREACHABLE"
+
+# Most severe first, as in Spring Boot's SimpleStatusAggregator, with
+# unreachable servers ranked before any reported status
+STATUS_ORDER = (UNREACHABLE, "DOWN", "OUT_OF_SERVICE", "UP", "UNKNOWN")
+
+
+def get_worst_status(statuses: Set[str]) -> Optional[str]:
+    """Get the most severe of several statuses.
+
+    Args:
+        statuses: The statuses
+
+    Returns:
+        The first status in STATUS_ORDER, a custom status if there are only
+        custom statuses, or None if there are no statuses.
+    """
+    for status in STATUS_ORDER:
+        if status in statuses:
+            return status
+    return min(statuses) if statuses else None
+
+
+@dataclass
+class _ServerHealth:
+    status: str
+    components: Dict[str, str] = field(default_factory=dict)
+
+
+class FleetHealth:
+    """Health overview of a fleet, updated one server at a time.
+
+    The number of servers per status and per component status are counters
+    adjusted by the difference between a server's previous and new health, so
+    an update costs O(components of that server) whatever the fleet size.
+    """
+
+    def __init__(self) -> None:
+        self._servers: Dict[str, _ServerHealth] = {}
+        self._status_counts: Counter = Counter()
+        self._servers_by_status: Dict[str, Set[str]] = {}
+        self._component_counts: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    def _add(self, server_id: str, health: _ServerHealth) -> None:
+        self._servers[server_id] = health
+        self._status_counts[health.status] += 1
+        self._servers_by_status.setdefault(health.status, set()).add(server_id)
+        for name, status in health.components.items():
+            self._component_counts.setdefault(name, Counter())[status] += 1
+
+    def _discard(self, server_id: str) -> Optional[_ServerHealth]:
+        health = self._servers.pop(server_id, None)
+        if health is None:
+            return None
+        self._status_counts[health.status] -= 1
+        if not self._status_counts[health.status]:
+            del self._status_counts[health.status]
+        servers = self._servers_by_status[health.status]
+        servers.discard(server_id)
+        if not servers:
+            del self._servers_by_status[health.status]
+        for name, status in health.components.items():
+            counts = self._component_counts[name]
+            counts[status] -= 1
+            if not counts[status]:
+                del counts[status]
+            if not counts:
+                del self._component_counts[name]
+        return health
+
+    def update(self, server_id: str, health: HealthCheck) -> bool:
+        """Record the latest health of a server.
+
+        Args:
+            server_id: The ID of the server
+            health: The server's /actuator/health response
+
+        Returns:
+            True if the status of the server or of one of its components
+            changed, False otherwise.
+        """
+        new_health = _ServerHealth(
+            health.status,
+            {name: component.status for name, component in health.components.items()},
+        )
+        return self._replace(server_id, new_health)
+
+    def mark_unreachable(self, server_id: str) -> bool:
+        """Record that a server did not respond.
+
+        Args:
+            server_id: The ID of the server
+
+        Returns:
+            True if the server was not already unreachable, False otherwise.
+        """
+        return self._replace(server_id, _ServerHealth(UNREACHABLE))
+
+    def _replace(self, server_id: str, new_health: _ServerHealth) -> bool:
+        with self._lock:
+            old_health = self._servers.get(server_id)
+            if old_health == new_health:
+                return False
+            self._discard(server_id)
+            self._add(server_id, new_health)
+            return True
+
+    def remove(self, server_id: str) -> None:
+        """Forget a server.
+
+        Args:
+            server_id: The ID of the server
+        """
+        with self._lock:
+            self._discard(server_id)
+
+    def get_status(self, server_id: str) -> Optional[str]:
+        """Get the last known status of a server.
+
+        Args:
+            server_id: The ID of the server
+
+        Returns:
+            The status, or None if the server is unknown.
+        """
+        with self._lock:
+            health = self._servers.get(server_id)
+            return health.status if health is not None else None
+
+    def get_overall_status(self) -> Optional[str]:
+        """Get the status of the fleet, i.e. the worst server status.
+
+        Returns:
+            The most severe status of any server, or None if the fleet is empty.
+        """
+        with self._lock:
+            return get_worst_status(set(self._status_counts))
+
+    def get_status_counts(self) -> Dict[str, int]:
+        """Get the number of servers per status.
+
+        Returns:
+            A dictionary mapping statuses to numbers of servers.
+        """
+        with self._lock:
+            return dict(self._status_counts)
+
+    def get_component_status_counts(self) -> Dict[str, Dict[str, int]]:
+        """Get the number of servers per status of each component.
+
+        Returns:
+            A dictionary mapping component names to dictionaries mapping
+            statuses to numbers of servers.
+        """
+        with self._lock:
+            return {
+                name: dict(counts) for name, counts in self._component_counts.items()
+            }
+
+    def get_servers(self, status: str) -> List[str]:
+        """Get the servers with a status.
+
+        Args:
+            status: The status, e.g. "DOWN"
+
+        Returns:
+            A sorted list of server IDs.
+        """
+        with self._lock:
+            return sorted(self._servers_by_status.get(status, ()))
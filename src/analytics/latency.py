@@ -0,0 +1,332 @@
+import math
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set
+from urllib.parse import urlsplit
+
+from ..actuator.containers.httpexchanges import HttpExchange
+
+OTHER_URI = "OTHER"
+
+
+class LatencyHistogram:
+    """Streaming latency histogram with logarithmic buckets.
+
+    Values are stored in buckets whose width grows geometrically, so every
+    quantile estimate is within ``relative_accuracy`` of the true value while
+    the number of buckets stays bounded by the value range. Recording a value
+    is O(1) and memory does not grow with the number of samples.
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.01,
+        min_value: float = 1e-6,
+        max_value: float = 3600.0,
+    ):
+        """Initialize an empty histogram.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates
+            min_value: Smallest distinguishable value in seconds
+            max_value: Largest distinguishable value in seconds
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.max_value = max_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._max_index = int(
+            math.ceil(math.log(max_value / min_value) / self._log_gamma)
+        )
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def _index(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        index = int(math.ceil(math.log(value / self.min_value) / self._log_gamma))
+        return index if index < self._max_index else self._max_index
+
+    def _bucket_value(self, index: int) -> float:
+        if index == 0:
+            return self.min_value
+        return self.min_value * 2 * self._gamma**index / (self._gamma + 1)
+
+    def add(self, value: float) -> None:
+        """Record a single value.
+
+        Args:
+            value: The value to record, in seconds
+        """
+        index = self._index(value)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Merge another histogram with the same bucket layout into this one.
+
+        Args:
+            other: The histogram to merge
+        """
+        if (
+            other.relative_accuracy != self.relative_accuracy
+            or other.min_value != self.min_value
+            or other.max_value != self.max_value
+        ):
+            raise ValueError("Cannot merge histograms with different bucket layouts")
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def get_mean(self) -> Optional[float]:
+        """Get the mean of all recorded values.
+
+        Returns:
+            The mean in seconds, or None if the histogram is empty.
+        """
+        return self.total / self.count if self.count else None
+
+    def get_quantile(self, quantile: float) -> Optional[float]:
+        """Estimate a quantile of the recorded values.
+
+        Args:
+            quantile: The quantile to estimate, between 0 and 1
+
+        Returns:
+            The estimated value in seconds, or None if the histogram is empty.
+        """
+        if not 0 <= quantile <= 1:
+            raise ValueError("quantile must be between 0 and 1")
+        if not self.count:
+            return None
+        if quantile == 0:
+            return self.min
+        if quantile == 1:
+            return self.max
+
+        rank = quantile * (self.count - 1)
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen > rank:
+                estimate = self._bucket_value(index)
+                # Never report a value outside what was actually observed
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+
+class LatencyKey(NamedTuple):
+    """Identifies a latency series by endpoint, method and response status."""
+
+    uri: str
+    method: str
+    status: int
+
+
+@dataclass
+class LatencySummary:
+    """Summary statistics for a latency series, in seconds.
+
+    The statistics are None when the series has no values.
+    """
+
+    count: int
+    mean: Optional[float]
+    p50: Optional[float]
+    p95: Optional[float]
+    p99: Optional[float]
+    max: Optional[float]
+
+
+def strip_uri(uri: str) -> str:
+    """Reduce a request URI to its path, dropping scheme, host and query.
+
+    Args:
+        uri: The request URI as reported by /actuator/httpexchanges
+
+    Returns:
+        The path component of the URI ("/" if empty).
+    """
+    return urlsplit(uri).path or "/"
+
+
+class HttpLatencyAnalytics:
+    """Maintains per-endpoint latency histograms from HTTP exchanges.
+
+    Exchanges are ingested incrementally: /actuator/httpexchanges returns the
+    server's whole exchange buffer on every poll, so only exchanges newer than
+    the last ingested timestamp are recorded.
+    """
+
+    def __init__(
+        self,
+        uri_mapper: Optional[Callable[[str], str]] = None,
+        max_series: int = 1000,
+        relative_accuracy: float = 0.01,
+    ):
+        """Initialize the analytics stage.
+
+        Args:
+            uri_mapper: Function mapping a raw request URI to the URI used for
+                grouping (default: the URI path without query string)
+            max_series: Maximum number of distinct URI series; exchanges for
+                new URIs beyond this limit are grouped under OTHER_URI, in one
+                series per method and status. These overflow series are not
+                counted against the limit, so there can be up to max_series
+                plus one per method and status combination seen
+            relative_accuracy: Relative accuracy of the percentile estimates
+        """
+        self.uri_mapper = uri_mapper or strip_uri
+        self.max_series = max_series
+        self.relative_accuracy = relative_accuracy
+        self._series: Dict[LatencyKey, LatencyHistogram] = {}
+        self._last_timestamp: Optional[datetime] = None
+        self._seen_at_last_timestamp: Set[tuple] = set()
+        self._lock = threading.Lock()
+
+    def _get_histogram(self, key: LatencyKey) -> LatencyHistogram:
+        histogram = self._series.get(key)
+        if histogram is None:
+            if len(self._series) >= self.max_series:
+                # The overflow series are created past the limit
+                key = LatencyKey(OTHER_URI, key.method, key.status)
+                histogram = self._series.get(key)
+            if histogram is None:
+                histogram = LatencyHistogram(self.relative_accuracy)
+                self._series[key] = histogram
+        return histogram
+
+    def record(self, uri: str, method: str, status: int, seconds: float) -> None:
+        """Record a single latency value.
+
+        Args:
+            uri: The (already mapped) URI
+            method: The HTTP method
+            status: The HTTP response status
+            seconds: The time taken in seconds
+        """
+        with self._lock:
+            self._get_histogram(LatencyKey(uri, method, status)).add(seconds)
+
+    def ingest(self, exchanges: Iterable[HttpExchange]) -> int:
+        """Ingest exchanges, skipping any that were already ingested.
+
+        Args:
+            exchanges: The exchanges from an /actuator/httpexchanges response
+
+        Returns:
+            The number of exchanges that were recorded.
+        """
+        recorded = 0
+        with self._lock:
+            watermark = self._last_timestamp
+            new_watermark = watermark
+            seen_at_new_watermark = set(self._seen_at_last_timestamp)
+
+            for exchange in exchanges:
+                timestamp = exchange.timestamp
+                identity = (
+                    exchange.request.uri,
+                    exchange.request.method,
+                    exchange.time_taken,
+                )
+                if watermark is not None:
+                    if timestamp < watermark:
+                        continue
+                    if (
+                        timestamp == watermark
+                        and identity in self._seen_at_last_timestamp
+                    ):
+                        continue
+
+                # Durations are parsed exactly once, here
+                seconds = exchange.get_time_taken_seconds()
+                key = LatencyKey(
+                    self.uri_mapper(exchange.request.uri),
+                    exchange.request.method,
+                    exchange.response.status,
+                )
+                self._get_histogram(key).add(seconds)
+                recorded += 1
+
+                if new_watermark is None or timestamp > new_watermark:
+                    new_watermark = timestamp
+                    seen_at_new_watermark = {identity}
+                elif timestamp == new_watermark:
+                    seen_at_new_watermark.add(identity)
+
+            self._last_timestamp = new_watermark
+            self._seen_at_last_timestamp = seen_at_new_watermark
+        return recorded
+
+    def get_keys(self) -> List[LatencyKey]:
+        """Get the keys of all latency series.
+
+        Returns:
+            A list of LatencyKey objects.
+        """
+        with self._lock:
+            return list(self._series.keys())
+
+    def get_percentiles(
+        self, key: LatencyKey, percentiles: Sequence[float] = (50, 95, 99)
+    ) -> Dict[float, Optional[float]]:
+        """Get percentile estimates for a latency series.
+
+        Args:
+            key: The series key
+            percentiles: The percentiles to estimate, between 0 and 100
+
+        Returns:
+            A dictionary mapping each percentile to its estimate in seconds,
+            or an empty dictionary if the series doesn't exist.
+        """
+        with self._lock:
+            histogram = self._series.get(key)
+            if histogram is None or not histogram.count:
+                return {}
+            return {p: histogram.get_quantile(p / 100) for p in percentiles}
+
+    def get_summaries(self) -> Dict[LatencyKey, LatencySummary]:
+        """Get summary statistics for every latency series.
+
+        Returns:
+            A dictionary mapping series keys to LatencySummary objects.
+        """
+        with self._lock:
+            return {
+                key: LatencySummary(
+                    count=histogram.count,
+                    mean=histogram.get_mean(),
+                    p50=histogram.get_quantile(0.5),
+                    p95=histogram.get_quantile(0.95),
+                    p99=histogram.get_quantile(0.99),
+                    max=histogram.max,
+                )
+                for key, histogram in self._series.items()
+                if histogram.count
+            }
+
+    def reset(self) -> None:
+        """Discard all recorded latencies and the ingestion watermark."""
+        with self._lock:
+            self._series.clear()
+            self._last_timestamp = None
+            self._seen_at_last_timestamp = set()
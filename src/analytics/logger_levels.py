@@ -0,0 +1,185 @@
+import http.client
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ..actuator.client import ActuatorClient
+from ..actuator.containers.loggers import Loggers
+
+# (server ID, client, logger, level, previous level, previous level known)
+_Request = Tuple[str, ActuatorClient, str, Optional[str], Optional[str], bool]
+
+
+@dataclass(frozen=True)
+class LevelChange:
+    """The outcome of setting a logger level on one server.
+
+    previous_level is the configured level the logger had in the server's
+    loggers snapshot (None if it had none), and previous_known tells whether
+    a snapshot was available to read it from.
+    """
+
+    server_id: str
+    logger: str
+    level: Optional[str]
+    error: Optional[str] = None
+    previous_level: Optional[str] = None
+    previous_known: bool = False
+
+    def is_successful(self) -> bool:
+        """Check whether the level was set.
+
+        Returns:
+            True if the request succeeded.
+        """
+        return self.error is None
+
+
+class FleetLoggerLevels:
+    """Sets logger levels on many servers at once.
+
+    Requests are sent concurrently, one per server and logger, and failures
+    are reported per server instead of aborting the whole operation, so an
+    unreachable instance does not prevent enabling DEBUG on the rest of the
+    fleet.
+    """
+
+    def __init__(self, max_workers: int = 16):
+        """Initialize the bulk updater.
+
+        Args:
+            max_workers: Maximum number of concurrent requests
+        """
+        self.max_workers = max_workers
+
+    def _set(
+        self,
+        server_id: str,
+        client: ActuatorClient,
+        logger: str,
+        level: Optional[str],
+        previous_level: Optional[str],
+        previous_known: bool,
+    ) -> LevelChange:
+        error = None
+        try:
+            client.set_logger_level(logger, level)
+        except (OSError, http.client.HTTPException, json.JSONDecodeError) as e:
+            # URLError, HTTPError and socket timeouts, truncated or malformed
+            # responses (e.g. IncompleteRead) and bodies that are not JSON
+            error = str(e) or type(e).__name__
+        return LevelChange(
+            server_id,
+            logger,
+            level,
+            error,
+            previous_level=previous_level,
+            previous_known=previous_known,
+        )
+
+    def _run(self, requests: Sequence[_Request]) -> List[LevelChange]:
+        if not requests:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(requests))
+        ) as executor:
+            return list(executor.map(lambda request: self._set(*request), requests))
+
+    def set_level(
+        self,
+        clients: Mapping[str, ActuatorClient],
+        name: str,
+        level: Optional[str],
+        snapshots: Optional[Mapping[str, Loggers]] = None,
+        cascade: bool = False,
+    ) -> List[LevelChange]:
+        """Set the level of a logger on every server.
+
+        Loggers below name inherit the new level, except those with their own
+        configured level. With cascade, those loggers are set to the same
+        level too (they are found in the servers' snapshots), so the whole
+        subtree really logs at that level; this overwrites their configured
+        levels, which can be put back with restore().
+
+        Args:
+            clients: Clients of the servers, by server ID
+            name: The logger or package name, e.g. "com.example.orders"
+            level: The level, e.g. "DEBUG", or None to reset to the inherited
+                level
+            snapshots: Optional latest loggers snapshot of each server, used to
+                record the previous levels and to find the loggers to cascade to
+            cascade: Also set the configured descendants of the logger
+
+        Returns:
+            A LevelChange for every request, in server order.
+        """
+        requests: List[_Request] = []
+        for server_id, client in clients.items():
+            snapshot = snapshots.get(server_id) if snapshots is not None else None
+            loggers = [name]
+            if snapshot is not None and cascade:
+                loggers.extend(snapshot.get_tree().get_configured_descendants(name))
+            for logger in loggers:
+                previous_level = None
+                if snapshot is not None:
+                    current = snapshot.get_logger(logger)
+                    previous_level = current.configured_level if current else None
+                requests.append(
+                    (
+                        server_id,
+                        client,
+                        logger,
+                        level,
+                        previous_level,
+                        snapshot is not None,
+                    )
+                )
+        return self._run(requests)
+
+    def restore(
+        self, clients: Mapping[str, ActuatorClient], changes: List[LevelChange]
+    ) -> List[LevelChange]:
+        """Put back the levels that set_level changed.
+
+        Only the successful changes whose previous level is known are undone;
+        a logger that had no configured level is reset to the inherited one.
+
+        Args:
+            clients: Clients of the servers, by server ID
+            changes: The result of set_level
+
+        Returns:
+            A LevelChange for every request, in the order of the changes.
+        """
+        return self._run(
+            [
+                (
+                    change.server_id,
+                    clients[change.server_id],
+                    change.logger,
+                    change.previous_level,
+                    change.level,
+                    True,
+                )
+                for change in changes
+                if change.is_successful()
+                and change.previous_known
+                and change.server_id in clients
+            ]
+        )
+
+    def get_failures(self, changes: List[LevelChange]) -> Dict[str, List[LevelChange]]:
+        """Group the failed changes by server.
+
+        Args:
+            changes: The result of set_level
+
+        Returns:
+            A dictionary mapping server IDs to their failed changes.
+        """
+        failures: Dict[str, List[LevelChange]] = {}
+        for change in changes:
+            if not change.is_successful():
+                failures.setdefault(change.server_id, []).append(change)
+        return failures
@@ -0,0 +1,176 @@
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from ..actuator.containers.common.extra_base_model import ExtraBaseModel
+from ..actuator.containers.metrics import Metric
+from ..tinydb.tiny_repo import TinyRepo
+
+# Statistics reported by Micrometer counters, timers and distribution summaries
+# that only ever grow while the JVM is running
+CUMULATIVE_STATISTICS = frozenset({"COUNT", "TOTAL_TIME", "TOTAL"})
+
+MEAN_SERIES = "mean"
+
+
+def rate_series_name(statistic: str) -> str:
+    """Get the name of the derived per-second rate series of a statistic.
+
+    Args:
+        statistic: The cumulative statistic, e.g. "COUNT"
+
+    Returns:
+        The derived series name, e.g. "count_rate".
+    """
+    return f"{statistic.lower()}_rate"
+
+
+class DerivedSample(ExtraBaseModel):
+    """A value derived from two successive samples of a cumulative metric."""
+
+    metric: str
+    series: str
+    value: float
+    timestamp: datetime
+    interval: float
+
+
+@dataclass
+class _Baseline:
+    timestamp: datetime
+    values: Dict[str, float] = field(default_factory=dict)
+
+
+class RateDeriver:
+    """Turns cumulative metric samples into rates and interval averages.
+
+    For every cumulative statistic (COUNT, TOTAL_TIME, TOTAL) the per-second
+    rate between two successive samples is derived, e.g. requests per second
+    from http.server.requests COUNT. When a metric has both COUNT and
+    TOTAL_TIME, the interval mean (TOTAL_TIME delta / COUNT delta) is derived
+    too, i.e. the mean latency of the requests made since the last sample.
+
+    Counters restart from zero when the JVM restarts. A change of
+    process.start.time, or a cumulative value going down, resets the
+    baseline instead of producing negative rates.
+
+    One RateDeriver is kept per server.
+    """
+
+    def __init__(self, repo: Optional[TinyRepo[DerivedSample]] = None):
+        """Initialize the deriver.
+
+        Args:
+            repo: Optional history repository where derived samples are stored,
+                typically sharing its database with the raw metric history
+        """
+        self.repo = repo
+        self._baselines: Dict[str, _Baseline] = {}
+        self._process_start_time: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def update_process_start_time(self, start_time: float) -> bool:
+        """Record the JVM start time, resetting every baseline if it changed.
+
+        Args:
+            start_time: The value of the process.start.time metric
+
+        Returns:
+            True if a restart was detected, False otherwise.
+        """
+        with self._lock:
+            restarted = (
+                self._process_start_time is not None
+                and start_time != self._process_start_time
+            )
+            if restarted:
+                self._baselines.clear()
+            self._process_start_time = start_time
+            return restarted
+
+    def reset(self, series_key: Optional[str] = None) -> None:
+        """Discard baselines so the next samples start new series.
+
+        Args:
+            series_key: The series to reset (default: every series)
+        """
+        with self._lock:
+            if series_key is None:
+                self._baselines.clear()
+            else:
+                self._baselines.pop(series_key, None)
+
+    def update(
+        self,
+        metric: Metric,
+        timestamp: datetime,
+        series_key: Optional[str] = None,
+    ) -> List[DerivedSample]:
+        """Derive rates from a new sample of a metric.
+
+        Args:
+            metric: The metric sample
+            timestamp: When the sample was taken
+            series_key: Key identifying the series, for instance the metric name
+                plus its tag filter (default: the metric name)
+
+        Returns:
+            The derived samples, or an empty list if this is the first sample of
+            the series or a counter reset was detected.
+        """
+        key = series_key or metric.name
+        values = {
+            measurement.statistic: measurement.value
+            for measurement in metric.measurements
+            if measurement.statistic in CUMULATIVE_STATISTICS
+        }
+        if not values:
+            return []
+
+        with self._lock:
+            baseline = self._baselines.get(key)
+            self._baselines[key] = _Baseline(timestamp, values)
+
+        if baseline is None:
+            return []
+        interval = (timestamp - baseline.timestamp).total_seconds()
+        if interval <= 0:
+            return []
+
+        deltas = {
+            statistic: value - baseline.values[statistic]
+            for statistic, value in values.items()
+            if statistic in baseline.values
+        }
+        if any(delta < 0 for delta in deltas.values()):
+            # The counter went backwards: the application restarted between
+            # samples, so the new values become the baseline
+            return []
+
+        derived = [
+            DerivedSample(
+                metric=key,
+                series=rate_series_name(statistic),
+                value=delta / interval,
+                timestamp=timestamp,
+                interval=interval,
+            )
+            for statistic, delta in deltas.items()
+        ]
+        count_delta = deltas.get("COUNT")
+        if count_delta and "TOTAL_TIME" in deltas:
+            derived.append(
+                DerivedSample(
+                    metric=key,
+                    series=MEAN_SERIES,
+                    value=deltas["TOTAL_TIME"] / count_delta,
+                    timestamp=timestamp,
+                    interval=interval,
+                )
+            )
+
+        if self.repo is not None:
+            for sample in derived:
+                self.repo.add(sample)
+        return derived
@@ -0,0 +1,353 @@
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..actuator.containers.scheduledtasks import (
+    CronTask,
+    FixedDelayTask,
+    FixedRateTask,
+    ScheduledTasks,
+)
+from .drilldown import LabelledSample
+
+EXECUTION_METRIC = "tasks.scheduled.execution"
+
+# The task types that report their last and next executions
+_TimedTask = Union[CronTask, FixedDelayTask, FixedRateTask]
+
+MISSED = "missed"
+LATE = "late"
+OVERRUN = "overrun"
+FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ExecutionRecord:
+    """An execution of a scheduled task seen by a poll."""
+
+    time: datetime
+    status: Optional[str]
+    delay: Optional[float]
+
+
+@dataclass(frozen=True)
+class TaskAlert:
+    """A scheduled task not running as scheduled."""
+
+    server_id: str
+    target: str
+    kind: str
+    expected: Optional[datetime]
+    detail: str
+
+
+@dataclass(frozen=True)
+class TaskSummary:
+    """Execution statistics of a scheduled task."""
+
+    server_id: str
+    target: str
+    task_type: str
+    runs: int
+    missed: int
+    late: int
+    failed: int
+    last_execution: Optional[datetime]
+    next_execution: Optional[datetime]
+
+
+class _TaskState:
+    __slots__ = (
+        "task_type",
+        "last_time",
+        "next_time",
+        "count",
+        "alerted_for",
+        "history",
+        "runs",
+        "missed",
+        "late",
+        "failed",
+    )
+
+    def __init__(self, task_type: str, history_size: int):
+        self.task_type = task_type
+        self.last_time: Optional[datetime] = None
+        self.next_time: Optional[datetime] = None
+        self.count: Optional[float] = None
+        self.alerted_for: Optional[datetime] = None
+        self.history: Deque[ExecutionRecord] = deque(maxlen=history_size)
+        self.runs = 0
+        self.missed = 0
+        self.late = 0
+        self.failed = 0
+
+
+def _iter_tasks(tasks: ScheduledTasks) -> Iterator[Tuple[str, _TimedTask]]:
+    for task_type, task_list in (
+        ("cron", tasks.cron),
+        ("fixedDelay", tasks.fixed_delay),
+        ("fixedRate", tasks.fixed_rate),
+    ):
+        for task in task_list:
+            yield task_type, task
+
+
+def _get_period(
+    task: _TimedTask, expected: Optional[datetime], next_time: Optional[datetime]
+) -> Optional[float]:
+    """Get the time in seconds between two scheduled runs of a task.
+
+    Fixed-rate and fixed-delay tasks declare their interval; for a fixed-delay
+    task it is the shortest time between two starts. A cron task announces
+    its runs on the schedule even after a late run, so its period is the gap
+    between the run expected by the previous poll and the one announced now.
+    The time between the last and the next execution is not used: it shrinks
+    by the delay of a late run.
+    """
+    if isinstance(task, (FixedRateTask, FixedDelayTask)):
+        return task.interval / 1000
+    if expected is not None and next_time is not None and next_time > expected:
+        return (next_time - expected).total_seconds()
+    return None
+
+
+def execution_counts(samples: Iterable[LabelledSample]) -> Dict[str, float]:
+    """Get the number of executions of each task from the execution metric.
+
+    Args:
+        samples: Samples of tasks.scheduled.execution broken down by the
+            code.namespace and code.function tags (and optionally outcome)
+
+    Returns:
+        A dictionary mapping task targets ("namespace.function") to their
+        cumulative execution counts, summed over the other tags.
+    """
+    counts: Dict[str, float] = {}
+    for sample in samples:
+        namespace = sample.tags.get("code.namespace")
+        function = sample.tags.get("code.function")
+        count = sample.measurements.get("COUNT")
+        if namespace is None or function is None or count is None:
+            continue
+        target = f"{namespace}.{function}"
+        counts[target] = counts.get(target, 0.0) + count
+    return counts
+
+
+class ScheduledTaskMonitor:
+    """Tracks the executions of scheduled tasks across successive polls.
+
+    Each poll of /actuator/scheduledtasks is compared with the previous one:
+    a new lastExecution is recorded in a bounded per-task history, and its
+    delay is measured against the nextExecution announced by the previous
+    poll. A task whose announced run has passed without a new execution is
+    reported as overrunning (the previous run is still going) or missed (the
+    scheduler moved on). When cumulative execution counts from the
+    tasks.scheduled.execution metric are given, runs that happened between
+    two polls are counted exactly, so skipped runs are detected even when
+    tasks run more often than they are polled.
+
+    The state per task is a few fields plus the ring buffer, so memory is
+    bounded by the number of tasks times history_size.
+    """
+
+    def __init__(self, history_size: int = 100, tolerance: float = 1.0):
+        """Initialize the monitor.
+
+        Args:
+            history_size: Number of executions kept per task
+            tolerance: Delay in seconds before an execution counts as late
+        """
+        self.history_size = history_size
+        self.tolerance = tolerance
+        self._states: Dict[Tuple[str, str], _TaskState] = {}
+        self._lock = threading.Lock()
+
+    def update(
+        self,
+        server_id: str,
+        tasks: ScheduledTasks,
+        timestamp: datetime,
+        counts: Optional[Dict[str, float]] = None,
+    ) -> List[TaskAlert]:
+        """Record a poll of the scheduled tasks of a server.
+
+        Args:
+            server_id: The ID of the server
+            tasks: The /actuator/scheduledtasks response
+            timestamp: When the poll was made
+            counts: Optional cumulative execution counts by target, see
+                execution_counts()
+
+        Returns:
+            The alerts raised by this poll.
+        """
+        alerts: List[TaskAlert] = []
+        with self._lock:
+            for task_type, task in _iter_tasks(tasks):
+                target = task.runnable.target
+                key = (server_id, target)
+                state = self._states.get(key)
+                if state is None:
+                    state = self._states[key] = _TaskState(task_type, self.history_size)
+                count = counts.get(target) if counts is not None else None
+                alerts.extend(
+                    self._update_task(server_id, target, state, task, timestamp, count)
+                )
+        return alerts
+
+    def _update_task(
+        self,
+        server_id: str,
+        target: str,
+        state: _TaskState,
+        task: _TimedTask,
+        timestamp: datetime,
+        count: Optional[float],
+    ) -> List[TaskAlert]:
+        alerts = []
+        last = task.last_execution
+        next_time = task.next_execution.time if task.next_execution else None
+        expected = state.next_time
+        period = _get_period(task, expected, next_time)
+
+        if last is not None and (
+            state.last_time is None or last.time > state.last_time
+        ):
+            delay = None
+            expected_runs = 1
+            if expected is not None:
+                offset = (last.time - expected).total_seconds()
+                delay = offset
+                if period and period > 0 and offset > 0:
+                    # Runs may have happened at every period since the expected
+                    # one; the delay is measured from the last slot before it
+                    slots = int(offset // period)
+                    expected_runs += slots
+                    delay = offset - slots * period
+            state.history.append(ExecutionRecord(last.time, last.status, delay))
+            state.runs += 1
+
+            if state.last_time is not None and delay is not None:
+                if delay > self.tolerance:
+                    state.late += 1
+                    alerts.append(
+                        TaskAlert(
+                            server_id,
+                            target,
+                            LATE,
+                            expected,
+                            f"started {delay:.1f}s late",
+                        )
+                    )
+                if count is not None and state.count is not None:
+                    skipped = expected_runs - int(count - state.count)
+                    if skipped > 0:
+                        state.missed += skipped
+                        alerts.append(
+                            TaskAlert(
+                                server_id,
+                                target,
+                                MISSED,
+                                expected,
+                                f"{skipped} run(s) skipped since the last poll",
+                            )
+                        )
+            if last.status is not None and last.status != "SUCCESS":
+                state.failed += 1
+                alerts.append(
+                    TaskAlert(
+                        server_id, target, FAILED, None, f"last run ended {last.status}"
+                    )
+                )
+            state.last_time = last.time
+        elif (
+            expected is not None
+            and (timestamp - expected).total_seconds() > self.tolerance
+            and state.alerted_for != expected
+        ):
+            state.alerted_for = expected
+            if next_time is not None and next_time > expected:
+                state.missed += 1
+                alerts.append(
+                    TaskAlert(
+                        server_id,
+                        target,
+                        MISSED,
+                        expected,
+                        "the scheduled run did not happen",
+                    )
+                )
+            else:
+                alerts.append(
+                    TaskAlert(
+                        server_id,
+                        target,
+                        OVERRUN,
+                        expected,
+                        "the scheduled run has not started, the previous run "
+                        "may still be running",
+                    )
+                )
+
+        if next_time is not None:
+            state.next_time = next_time
+        if count is not None:
+            state.count = count
+        return alerts
+
+    def get_history(self, server_id: str, target: str) -> List[ExecutionRecord]:
+        """Get the recorded executions of a task.
+
+        Args:
+            server_id: The ID of the server
+            target: The task target, e.g. "com.example.Jobs.cleanup"
+
+        Returns:
+            A list of ExecutionRecord objects, oldest first.
+        """
+        with self._lock:
+            state = self._states.get((server_id, target))
+            return list(state.history) if state is not None else []
+
+    def get_summaries(self, server_id: Optional[str] = None) -> List[TaskSummary]:
+        """Get the statistics of the monitored tasks.
+
+        Args:
+            server_id: Only return the tasks of this server (default: all)
+
+        Returns:
+            A list of TaskSummary objects, sorted by server and target.
+        """
+        with self._lock:
+            summaries = [
+                TaskSummary(
+                    key[0],
+                    key[1],
+                    state.task_type,
+                    state.runs,
+                    state.missed,
+                    state.late,
+                    state.failed,
+                    state.last_time,
+                    state.next_time,
+                )
+                for key, state in self._states.items()
+                if server_id is None or key[0] == server_id
+            ]
+        return sorted(
+            summaries, key=lambda summary: (summary.server_id, summary.target)
+        )
+
+    def remove_server(self, server_id: str) -> None:
+        """Forget the tasks of a server.
+
+        Args:
+            server_id: The ID of the server
+        """
+        with self._lock:
+            for key in [key for key in self._states if key[0] == server_id]:
+                del self._states[key]
@@ -0,0 +1,343 @@
+import re
+import threading
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union
+
+from ..actuator.containers.beans import Beans
+from ..actuator.containers.common.executor import get_shared_executor
+from ..actuator.containers.conditions import Conditions
+from ..actuator.containers.configprops import ConfigProps
+from ..actuator.containers.env import Env
+
+BEAN = "bean"
+CONDITION = "condition"
+PROPERTY = "property"
+CONFIGPROPS = "configprops"
+
+_WORD_PATTERN = re.compile(r"[A-Za-z0-9]+")
+_CAMEL_CASE_PATTERN = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+
+def tokenize(text: str) -> Set[str]:
+    """Split text into lowercase search tokens.
+
+    Words are split on punctuation (dots, dashes, "$", ...) and camel case
+    boundaries, and the whole words are kept too, so "DataSourceProperties"
+    yields "datasourceproperties", "data", "source" and "properties".
+
+    Args:
+        text: The text to tokenize
+
+    Returns:
+        A set of lowercase tokens.
+    """
+    tokens = set()
+    for word in _WORD_PATTERN.findall(text):
+        tokens.add(word.lower())
+        for part in _CAMEL_CASE_PATTERN.findall(word):
+            tokens.add(part.lower())
+    return tokens
+
+
+@dataclass(frozen=True)
+class SearchDocument:
+    """A searchable entry from one of the static Actuator endpoints."""
+
+    kind: str
+    key: str
+    context: str
+    detail: str = ""
+
+
+class SearchIndex:
+    """Inverted index with prefix lookups over Actuator documents.
+
+    Each token maps to the documents containing it, and the vocabulary is kept
+    sorted so that every token starting with a prefix is found by binary
+    search. A query matches the documents containing, for every query token,
+    some token starting with it. Searches that extend the previous query
+    (search-as-you-type) only filter the previous results.
+    """
+
+    def __init__(self, documents: Iterable[tuple[SearchDocument, str]] = ()):
+        """Build the index.
+
+        Args:
+            documents: Pairs of (document, text to index)
+        """
+        self._documents: List[SearchDocument] = []
+        self._postings: Dict[str, Set[int]] = {}
+        self._keys: List[str] = []
+        for document, text in documents:
+            self._add(document, text)
+        self._vocabulary = sorted(self._postings)
+        self._lock = threading.Lock()
+        self._last_query: Optional[List[str]] = None
+        self._last_matches: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def _add(self, document: SearchDocument, text: str) -> None:
+        doc_id = len(self._documents)
+        self._documents.append(document)
+        self._keys.append(document.key.lower())
+        for token in tokenize(text):
+            self._postings.setdefault(token, set()).add(doc_id)
+
+    def _prefix_matches(self, prefix: str) -> Set[int]:
+        matches: Set[int] = set()
+        position = bisect_left(self._vocabulary, prefix)
+        while position < len(self._vocabulary):
+            token = self._vocabulary[position]
+            if not token.startswith(prefix):
+                break
+            matches |= self._postings[token]
+            position += 1
+        return matches
+
+    def _matches(self, terms: List[str]) -> Set[int]:
+        with self._lock:
+            last_query, last_matches = self._last_query, self._last_matches
+
+        if (
+            last_query
+            and len(terms) >= len(last_query)
+            and terms[: len(last_query) - 1] == last_query[:-1]
+            and terms[len(last_query) - 1].startswith(last_query[-1])
+        ):
+            # The query only grew, so its results are a subset of the last ones
+            candidates = last_matches
+            terms_to_check = terms[len(last_query) - 1 :]
+        else:
+            candidates = None
+            terms_to_check = terms
+
+        for term in terms_to_check:
+            term_matches = self._prefix_matches(term)
+            candidates = (
+                term_matches if candidates is None else candidates & term_matches
+            )
+            if not candidates:
+                break
+
+        result = candidates or set()
+        with self._lock:
+            self._last_query, self._last_matches = terms, result
+        return result
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = 50,
+        kinds: Optional[Iterable[str]] = None,
+    ) -> List[SearchDocument]:
+        """Search the index.
+
+        Results whose key equals or starts with the query are ranked first,
+        then shorter keys before longer ones.
+
+        Args:
+            query: The search text, e.g. "datasource url" or "DataSourceAuto"
+            limit: Maximum number of results (None for no limit)
+            kinds: Only return documents of these kinds (default: all kinds)
+
+        Returns:
+            A list of matching SearchDocument objects.
+        """
+        terms = _WORD_PATTERN.findall(query.lower())
+        if not terms:
+            return []
+
+        matches = self._matches(terms)
+        allowed = set(kinds) if kinds is not None else None
+        lower_query = query.lower()
+
+        def rank(doc_id: int) -> tuple:
+            key = self._keys[doc_id]
+            return (
+                key != lower_query,
+                not key.startswith(lower_query),
+                lower_query not in key,
+                len(key),
+                key,
+            )
+
+        ranked = sorted(
+            (
+                doc_id
+                for doc_id in matches
+                if allowed is None or self._documents[doc_id].kind in allowed
+            ),
+            key=rank,
+        )
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [self._documents[doc_id] for doc_id in ranked]
+
+
+def _bean_documents(beans: Beans) -> Iterator[tuple[SearchDocument, str]]:
+    for context_name, context in beans.contexts.items():
+        for name, bean in context.beans.items():
+            text = " ".join([name, bean.type, *bean.aliases])
+            yield SearchDocument(BEAN, name, context_name, bean.type), text
+
+
+def _condition_documents(
+    conditions: Conditions,
+) -> Iterator[tuple[SearchDocument, str]]:
+    for context_name, context in conditions.contexts.items():
+        for detail, matches in (
+            ("positive", context.positive_matches),
+            ("negative", context.negative_matches),
+        ):
+            for configuration, evaluations in matches.items():
+                text = " ".join(
+                    [configuration]
+                    + [evaluation.condition for evaluation in evaluations]
+                    + [evaluation.message for evaluation in evaluations]
+                )
+                yield (
+                    SearchDocument(CONDITION, configuration, context_name, detail),
+                    text,
+                )
+        for class_name in context.unconditional_classes:
+            yield (
+                SearchDocument(CONDITION, class_name, context_name, "unconditional"),
+                class_name,
+            )
+
+
+def _property_documents(env: Env) -> Iterator[tuple[SearchDocument, str]]:
+    for source in env.property_sources:
+        for name, property_value in source.properties.items():
+            yield (
+                SearchDocument(PROPERTY, name, source.name, str(property_value.value)),
+                name,
+            )
+
+
+def _configprops_documents(
+    configprops: ConfigProps,
+) -> Iterator[tuple[SearchDocument, str]]:
+    for entry in configprops.get_index():
+        yield (
+            SearchDocument(CONFIGPROPS, entry.key, entry.bean, str(entry.value)),
+            entry.key,
+        )
+
+
+def build_search_index(
+    beans: Optional[Beans] = None,
+    conditions: Optional[Conditions] = None,
+    env: Optional[Env] = None,
+    configprops: Optional[Union[ConfigProps, Dict[str, Any]]] = None,
+) -> SearchIndex:
+    """Build a search index over the static endpoints of a server.
+
+    Args:
+        beans: The /actuator/beans snapshot
+        conditions: The /actuator/conditions snapshot
+        env: The /actuator/env snapshot
+        configprops: The /actuator/configprops snapshot, or its parsed JSON
+
+    Returns:
+        A SearchIndex over every given snapshot.
+    """
+    if configprops is not None and not isinstance(configprops, ConfigProps):
+        configprops = ConfigProps.model_validate(configprops)
+
+    def documents() -> Iterator[tuple[SearchDocument, str]]:
+        if beans is not None:
+            yield from _bean_documents(beans)
+        if conditions is not None:
+            yield from _condition_documents(conditions)
+        if env is not None:
+            yield from _property_documents(env)
+        if configprops is not None:
+            yield from _configprops_documents(configprops)
+
+    return SearchIndex(documents())
+
+
+class BackgroundSearchIndex:
+    """Per-server search index rebuilt in the background.
+
+    Call refresh() after the static endpoints of a server have been fetched;
+    the new index is built on a worker thread and swapped in when complete,
+    while searches keep using the previous index in the meantime.
+    """
+
+    def __init__(self, executor: Optional[ThreadPoolExecutor] = None):
+        """Initialize an empty index.
+
+        Args:
+            executor: Executor used to build indexes (default: a shared
+                executor for all servers)
+        """
+        self._executor = executor
+        self._index = SearchIndex()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def refresh(
+        self,
+        beans: Optional[Beans] = None,
+        conditions: Optional[Conditions] = None,
+        env: Optional[Env] = None,
+        configprops: Optional[Union[ConfigProps, Dict[str, Any]]] = None,
+    ) -> "Future[SearchIndex]":
+        """Rebuild the index from fresh snapshots in the background.
+
+        If several refreshes overlap, only the most recent one is kept.
+
+        Args:
+            beans: The /actuator/beans snapshot
+            conditions: The /actuator/conditions snapshot
+            env: The /actuator/env snapshot
+            configprops: The /actuator/configprops snapshot, or its parsed JSON
+
+        Returns:
+            A Future resolving to the newly built index.
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+
+        def build() -> SearchIndex:
+            index = build_search_index(beans, conditions, env, configprops)
+            with self._lock:
+                if generation == self._generation:
+                    self._index = index
+            return index
+
+        return (self._executor or get_shared_executor()).submit(build)
+
+    def get_index(self) -> SearchIndex:
+        """Get the most recently built index.
+
+        Returns:
+            The current SearchIndex (empty until the first refresh completes).
+        """
+        with self._lock:
+            return self._index
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = 50,
+        kinds: Optional[Iterable[str]] = None,
+    ) -> List[SearchDocument]:
+        """Search the most recently built index.
+
+        Args:
+            query: The search text
+            limit: Maximum number of results (None for no limit)
+            kinds: Only return documents of these kinds (default: all kinds)
+
+        Returns:
+            A list of matching SearchDocument objects.
+        """
+        return self.get_index().search(query, limit, kinds)
@@ -0,0 +1,286 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..actuator.containers.common.extra_base_model import ExtraBaseModel
+from ..actuator.containers.info import Info
+from ..actuator.containers.startup import Startup, StepNode
+from ..tinydb.tiny_repo import TinyRepo
+
+# Identity hash codes in tag values (e.g. "...BeanPostProcessor@6fe1b4") change
+# on every run and would prevent steps from being aligned
+_IDENTITY_HASH_PATTERN = re.compile(r"@[0-9a-f]+$")
+
+StepSignature = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class StartupSnapshot(ExtraBaseModel):
+    """The startup timeline of a server for one deploy."""
+
+    server_id: str
+    build_version: Optional[str] = None
+    timestamp: datetime
+    startup: Dict[str, Any]
+
+    @classmethod
+    def from_startup(
+        cls,
+        server_id: str,
+        startup: Startup,
+        info: Optional[Info] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> "StartupSnapshot":
+        """Create a snapshot of a startup timeline.
+
+        Args:
+            server_id: The ID of the server
+            startup: The /actuator/startup response
+            info: The /actuator/info response, for the build version
+            timestamp: When the server started (default: the timeline start)
+
+        Returns:
+            A StartupSnapshot object.
+        """
+        build_version = (
+            info.build.version if info is not None and info.build is not None else None
+        )
+        return cls(
+            server_id=server_id,
+            build_version=build_version,
+            timestamp=timestamp or startup.timeline.start_time,
+            startup=startup.model_dump(mode="json", by_alias=True),
+        )
+
+    def get_startup(self) -> Startup:
+        """Parse the stored startup timeline.
+
+        Returns:
+            The Startup object.
+        """
+        return Startup.model_validate(self.startup)
+
+
+class StartupHistory:
+    """Startup snapshots of servers, by build version."""
+
+    def __init__(self, repo: TinyRepo[StartupSnapshot]):
+        """Initialize the history.
+
+        Args:
+            repo: The repository where snapshots are stored
+        """
+        self.repo = repo
+
+    def record(
+        self,
+        server_id: str,
+        startup: Startup,
+        info: Optional[Info] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> StartupSnapshot:
+        """Store the startup timeline of a server, once per start.
+
+        Args:
+            server_id: The ID of the server
+            startup: The /actuator/startup response
+            info: The /actuator/info response, for the build version
+            timestamp: When the server started (default: the timeline start)
+
+        Returns:
+            The stored snapshot, or the existing one if this start was already
+            recorded.
+        """
+        snapshot = StartupSnapshot.from_startup(server_id, startup, info, timestamp)
+        existing = self.repo.filter_by_fields(
+            server_id=server_id, timestamp=snapshot.timestamp
+        )
+        if existing:
+            return existing[0]
+        self.repo.add(snapshot)
+        return snapshot
+
+    def get_snapshots(self, server_id: str) -> List[StartupSnapshot]:
+        """Get the snapshots of a server.
+
+        Args:
+            server_id: The ID of the server
+
+        Returns:
+            A list of snapshots, oldest first.
+        """
+        snapshots = self.repo.filter(lambda snapshot: snapshot.server_id == server_id)
+        return sorted(snapshots, key=lambda snapshot: snapshot.timestamp)
+
+    def get_latest(
+        self, server_id: str, build_version: Optional[str] = None
+    ) -> Optional[StartupSnapshot]:
+        """Get the most recent snapshot of a server.
+
+        Args:
+            server_id: The ID of the server
+            build_version: Only consider snapshots of this build version
+
+        Returns:
+            The snapshot, or None if there is none.
+        """
+        snapshots = [
+            snapshot
+            for snapshot in self.get_snapshots(server_id)
+            if build_version is None or snapshot.build_version == build_version
+        ]
+        return snapshots[-1] if snapshots else None
+
+
+def step_signature(node: StepNode) -> StepSignature:
+    """Get the key identifying a startup step across runs.
+
+    Args:
+        node: The step
+
+    Returns:
+        The step name and its sorted tags, with identity hash codes removed.
+    """
+    tags = tuple(
+        sorted(
+            (tag.key, _IDENTITY_HASH_PATTERN.sub("", tag.value))
+            for tag in node.event.startup_step.tags
+        )
+    )
+    return node.name, tags
+
+
+@dataclass
+class StepComparison:
+    """Timings of one startup step in two runs."""
+
+    name: str
+    tags: Dict[str, str]
+    baseline_self_time: Optional[float]
+    current_self_time: Optional[float]
+    baseline_total_time: Optional[float]
+    current_total_time: Optional[float]
+
+    def get_self_time_delta(self) -> float:
+        """Get the change of self time, counting a missing step as 0.
+
+        Returns:
+            The current minus the baseline self time, in seconds.
+        """
+        return (self.current_self_time or 0.0) - (self.baseline_self_time or 0.0)
+
+
+@dataclass
+class StartupComparison:
+    """Step by step comparison of two startup timelines."""
+
+    baseline_total_time: float
+    current_total_time: float
+    steps: List[StepComparison]
+
+    def get_regressions(
+        self, min_delta: float = 0.05, min_ratio: float = 1.5
+    ) -> List[StepComparison]:
+        """Get the steps whose self time grew.
+
+        Args:
+            min_delta: Minimum increase in seconds
+            min_ratio: Minimum ratio of current to baseline self time
+
+        Returns:
+            The steps present in both runs that got slower by at least
+            min_delta and min_ratio, largest increase first.
+        """
+        regressions = [
+            step
+            for step in self.steps
+            if step.baseline_self_time is not None
+            and step.current_self_time is not None
+            and step.get_self_time_delta() >= min_delta
+            and step.current_self_time >= step.baseline_self_time * min_ratio
+        ]
+        return sorted(regressions, key=StepComparison.get_self_time_delta, reverse=True)
+
+    def get_added(self) -> List[StepComparison]:
+        """Get the steps only present in the current run.
+
+        Returns:
+            A list of steps, slowest first.
+        """
+        added = [step for step in self.steps if step.baseline_self_time is None]
+        return sorted(added, key=lambda step: step.current_self_time, reverse=True)
+
+    def get_removed(self) -> List[StepComparison]:
+        """Get the steps only present in the baseline run.
+
+        Returns:
+            A list of steps, slowest first.
+        """
+        removed = [step for step in self.steps if step.current_self_time is None]
+        return sorted(removed, key=lambda step: step.baseline_self_time, reverse=True)
+
+
+def _index_steps(startup: Startup) -> Dict[Tuple[StepSignature, int], StepNode]:
+    # Steps with the same signature are told apart by their occurrence order
+    index: Dict[Tuple[StepSignature, int], StepNode] = {}
+    occurrences: Dict[StepSignature, int] = {}
+    for node in startup.get_analysis().get_nodes():
+        signature = step_signature(node)
+        occurrence = occurrences.get(signature, 0)
+        occurrences[signature] = occurrence + 1
+        index[(signature, occurrence)] = node
+    return index
+
+
+def compare_startups(baseline: Startup, current: Startup) -> StartupComparison:
+    """Compare two startup timelines of the same application.
+
+    Steps are aligned by name and tags (the nth occurrence of a signature in
+    one run with the nth in the other) using hash lookups, so the comparison
+    is linear in the number of steps.
+
+    Args:
+        baseline: The reference startup, e.g. of the previous deploy
+        current: The startup to compare
+
+    Returns:
+        A StartupComparison object.
+    """
+    baseline_steps = _index_steps(baseline)
+    current_steps = _index_steps(current)
+
+    steps = []
+    keys = list(baseline_steps)
+    keys.extend(key for key in current_steps if key not in baseline_steps)
+    for key in keys:
+        (name, tags), _ = key
+        before = baseline_steps.get(key)
+        after = current_steps.get(key)
+        steps.append(
+            StepComparison(
+                name=name,
+                tags=dict(tags),
+                baseline_self_time=before.self_time if before else None,
+                current_self_time=after.self_time if after else None,
+                baseline_total_time=before.total_time if before else None,
+                current_total_time=after.total_time if after else None,
+            )
+        )
+    return StartupComparison(
+        baseline.get_total_startup_time(), current.get_total_startup_time(), steps
+    )
+
+
+def compare_snapshots(
+    baseline: StartupSnapshot, current: StartupSnapshot
+) -> StartupComparison:
+    """Compare two stored startup snapshots.
+
+    Args:
+        baseline: The reference snapshot
+        current: The snapshot to compare
+
+    Returns:
+        A StartupComparison object.
+    """
+    return compare_startups(baseline.get_startup(), current.get_startup())
@@ -1,5 +1,6 @@
 from typing import TypeVar, Generic, Type, Callable, Optional, List, Any
 from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
 from tinydb import TinyDB, Query
 from tinydb.table import Table
 from datetime import datetime, timedelta, timezone
@@ -48,7 +49,8 @@ class TinyRepo(Generic[T]):
             if self.max_size is not None and len(self.table) >= self.max_size:
                 self._remove_oldest_record()
 
-            data = item.model_dump()
+            # JSON mode, so datetimes and other non-JSON types survive file storage
+            data = item.model_dump(mode="json")
             data["created_at"] = datetime.now(timezone.utc).isoformat()
             return self.table.insert(data)
 
@@ -90,6 +92,29 @@ class TinyRepo(Generic[T]):
         # Apply filter outside the lock to minimize lock time
         return [item for item in items if condition(item)]
 
+    def filter_by_fields(self, **fields: Any) -> List[T]:
+        """Get the items whose fields equal some values.
+
+        The values are compared with the stored JSON documents, so only the
+        matching items are validated.
+
+        Args:
+            **fields: The field values, e.g. server_id="server-1"
+
+        Returns:
+            A list of matching items, in insertion order.
+        """
+        expected = {name: to_jsonable_python(value) for name, value in fields.items()}
+
+        def matches(doc) -> bool:
+            return all(
+                name in doc and doc[name] == value for name, value in expected.items()
+            )
+
+        with self._lock:
+            docs = self.table.search(matches)
+        return [self.model.model_validate(doc) for doc in docs]
+
     def count(self, condition: Optional[Callable[[T], bool]] = None) -> int:
         if condition:
             return len(self.filter(condition))
@@ -129,11 +154,13 @@ class TinyRepo(Generic[T]):
             return start <= created <= end
 
         with self._lock:
-            return [
-                doc[field]
+            docs = [
+                doc
                 for doc in self.table.all()
                 if "created_at" in doc and field in doc and in_range(doc)
             ]
+        # Documents hold JSON values; validate them to return the field's type
+        return [getattr(self.model.model_validate(doc), field) for doc in docs]
 
     def delete_older_than_x_minutes(self, minutes: int) -> None:
         with self._lock:
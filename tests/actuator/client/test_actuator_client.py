@@ -0,0 +1,108 @@
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from src.actuator.client import ActuatorClient
+from src.actuator.containers.metrics import Metric
+from src.config.servers.spring_boot_server import SpringBootServer
+
+
+def mock_response(payload):
+    response = MagicMock()
+    response.read.return_value = json.dumps(payload).encode() if payload else b""
+    response.__enter__.return_value = response
+    return response
+
+
+def test_build_url():
+    client = ActuatorClient("http://localhost:9090/actuator/")
+    assert client.build_url("health") == "http://localhost:9090/actuator/health"
+    assert client.build_url(
+        "metrics/http.server.requests",
+        [("tag", "uri:/api/info"), ("tag", "status:200")],
+    ) == (
+        "http://localhost:9090/actuator/metrics/http.server.requests"
+        "?tag=uri%3A%2Fapi%2Finfo&tag=status%3A200"
+    )
+
+
+def test_get_metric_with_tags():
+    client = ActuatorClient("http://localhost:9090/actuator")
+    payload = {
+        "name": "http.server.requests",
+        "baseUnit": "seconds",
+        "measurements": [{"statistic": "COUNT", "value": 29}],
+        "availableTags": [],
+    }
+    with patch(
+        "urllib.request.urlopen", return_value=mock_response(payload)
+    ) as urlopen:
+        metric = client.get_metric("http.server.requests", {"uri": "/api/info"})
+
+    assert isinstance(metric, Metric)
+    assert metric.description is None
+    assert metric.get_value("COUNT") == 29
+    request = urlopen.call_args[0][0]
+    assert request.get_method() == "GET"
+    assert request.full_url.endswith(
+        "metrics/http.server.requests?tag=uri%3A%2Fapi%2Finfo"
+    )
+
+
+def test_post_json_with_basic_auth():
+    server = SpringBootServer(
+        name="demo",
+        url="http://localhost:9090/actuator",
+        username="admin",
+        password="secret",
+    )
+    client = ActuatorClient.from_server(server)
+    with patch("urllib.request.urlopen", return_value=mock_response(None)) as urlopen:
+        assert (
+            client.post_json("loggers/com.example", {"configuredLevel": "DEBUG"})
+            is None
+        )
+
+    request = urlopen.call_args[0][0]
+    assert request.get_method() == "POST"
+    assert json.loads(request.data) == {"configuredLevel": "DEBUG"}
+    assert request.get_header("Authorization") == "Basic YWRtaW46c2VjcmV0"
+    assert request.get_header("Content-type") == "application/json"
+
+
+def test_set_logger_level():
+    client = ActuatorClient("http://localhost:9090/actuator")
+    with patch("urllib.request.urlopen", return_value=mock_response(None)) as urlopen:
+        client.set_logger_level("com.example", None)
+
+    request = urlopen.call_args[0][0]
+    assert request.get_method() == "POST"
+    assert request.full_url == "http://localhost:9090/actuator/loggers/com.example"
+    assert json.loads(request.data) == {"configuredLevel": None}
+
+
+def test_get_audit_events_with_filters():
+    client = ActuatorClient("http://localhost:9090/actuator")
+    payload = {
+        "events": [
+            {
+                "timestamp": "2025-04-23T10:24:55.240133900Z",
+                "principal": "alice",
+                "type": "AUTHENTICATION_FAILURE",
+                "data": {},
+            }
+        ]
+    }
+    with patch(
+        "urllib.request.urlopen", return_value=mock_response(payload)
+    ) as urlopen:
+        events = client.get_audit_events(
+            after=datetime(2025, 4, 23, 10, 0, tzinfo=timezone.utc),
+            type="AUTHENTICATION_FAILURE",
+        )
+
+    assert events.events[0].principal == "alice"
+    assert urlopen.call_args[0][0].full_url.endswith(
+        "auditevents?after=2025-04-23T10%3A00%3A00%2B00%3A00"
+        "&type=AUTHENTICATION_FAILURE"
+    )
@@ -0,0 +1,106 @@
+from src.actuator.containers.beans import Beans, BeanGraph
+
+
+def make_beans(dependencies, aliases=None):
+    aliases = aliases or {}
+    return Beans.model_validate(
+        {
+            "contexts": {
+                "app": {
+                    "beans": {
+                        name: {
+                            "aliases": aliases.get(name, []),
+                            "scope": "singleton",
+                            "type": f"com.example.{name}",
+                            "dependencies": deps,
+                        }
+                        for name, deps in dependencies.items()
+                    }
+                }
+            }
+        }
+    )
+
+
+def test_adjacency_and_transitive_queries():
+    beans = make_beans(
+        {
+            "dataSource": [],
+            "jdbcTemplate": ["dataSource"],
+            "userRepository": ["jdbcTemplate"],
+            "userService": ["userRepository", "ds"],
+            "healthIndicator": ["dataSource"],
+        },
+        aliases={"dataSource": ["ds"]},
+    )
+
+    graph = beans.get_graph("app")
+    assert isinstance(graph, BeanGraph)
+    assert beans.get_graph("app") is graph
+    assert beans.get_graph("missing") is None
+
+    assert graph.get_dependencies("userService") == ["userRepository", "dataSource"]
+    assert sorted(graph.get_dependents("dataSource")) == [
+        "healthIndicator",
+        "jdbcTemplate",
+        "userService",
+    ]
+    assert graph.get_transitive_dependents("dataSource") == {
+        "jdbcTemplate",
+        "userRepository",
+        "userService",
+        "healthIndicator",
+    }
+    assert graph.get_transitive_dependencies("userService") == {
+        "userRepository",
+        "jdbcTemplate",
+        "dataSource",
+    }
+    assert graph.get_transitive_dependencies("missing") == frozenset()
+    assert graph.get_cycles() == []
+
+
+def test_topological_order_puts_dependencies_first():
+    beans = make_beans(
+        {
+            "c": ["b"],
+            "b": ["a", "external"],
+            "a": [],
+        }
+    )
+    graph = beans.get_graph("app")
+
+    order = graph.get_topological_order()
+    assert len(order) == 4
+    assert "external" in graph
+    position = {name: index for index, name in enumerate(order)}
+    assert position["a"] < position["b"] < position["c"]
+    assert position["external"] < position["b"]
+
+
+def test_cycles_and_components():
+    beans = make_beans(
+        {
+            "a": ["b"],
+            "b": ["c"],
+            "c": ["a"],
+            "d": ["a"],
+            "self": ["self"],
+        }
+    )
+    graph = beans.get_graph("app")
+
+    cycles = sorted(sorted(cycle) for cycle in graph.get_cycles())
+    assert cycles == [["a", "b", "c"], ["self"]]
+    assert graph.get_transitive_dependencies("a") == {"a", "b", "c"}
+    assert graph.get_transitive_dependents("a") == {"a", "b", "c", "d"}
+    assert len(graph.get_strongly_connected_components()) == 3
+
+
+def test_large_chain_does_not_recurse():
+    size = 5000
+    dependencies = {f"bean{i}": [f"bean{i - 1}"] if i else [] for i in range(size)}
+    graph = make_beans(dependencies).get_graph("app")
+
+    assert graph.get_topological_order()[0] == "bean0"
+    assert len(graph.get_transitive_dependents("bean0")) == size - 1
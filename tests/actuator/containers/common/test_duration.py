@@ -0,0 +1,22 @@
+import pytest
+from src.actuator.containers.common.duration import parse_duration
+
+
+def test_parse_seconds_duration():
+    assert parse_duration("PT0.0150707S") == 0.0150707
+    assert parse_duration("PT2S") == 2.0
+    assert parse_duration("PT-0.5S") == -0.5
+
+
+def test_parse_compound_duration():
+    assert parse_duration("PT1M2.5S") == 62.5
+    assert parse_duration("PT2H") == 7200.0
+    assert parse_duration("PT1H30M") == 5400.0
+    assert parse_duration("P1DT1S") == 86401.0
+    assert parse_duration("-PT1S") == -1.0
+
+
+def test_parse_invalid_duration():
+    for value in ["", "P", "PT", "PTS", "0.5", "PT1X"]:
+        with pytest.raises(ValueError):
+            parse_duration(value)
@@ -0,0 +1,66 @@
+from src.actuator.containers.common.path_templates import (
+    PathTemplateTrie,
+    split_path,
+    template_key,
+)
+
+
+def test_split_path():
+    assert split_path("/actuator/metrics/") == ["actuator", "metrics"]
+    assert split_path("/") == []
+    assert split_path("") == []
+
+
+def test_literal_segments_win_over_variables():
+    trie = PathTemplateTrie()
+    trie.add("/users/{id}", "by-id")
+    trie.add("/users/me", "me")
+    trie.add("/users/{id}/orders", "orders")
+
+    assert trie.match("/users/me") == ("/users/me", "me")
+    assert trie.match("/users/42") == ("/users/{id}", "by-id")
+    assert trie.match("/users/me/orders") == ("/users/{id}/orders", "orders")
+    assert trie.match("/users") is None
+    assert len(trie) == 3
+
+
+def test_catch_all_and_root():
+    trie = PathTemplateTrie()
+    trie.add("/actuator/health", "health")
+    trie.add("/actuator/health/**", "health-group")
+    trie.add("/files/{*path}", "files")
+    trie.add("/", "root")
+
+    assert trie.match("/actuator/health")[1] == "health"
+    assert trie.match("/actuator/health/db")[1] == "health-group"
+    assert trie.match("/actuator/health/db/primary")[1] == "health-group"
+    assert trie.match("/files/a/b/c.txt")[1] == "files"
+    assert trie.match("/")[1] == "root"
+
+
+def test_mixed_and_constrained_segments():
+    trie = PathTemplateTrie()
+    trie.add("/reports/{name}.json", "json")
+    trie.add("/items/{id:\\d+}", "numeric")
+    trie.add("/items/*", "any")
+
+    assert trie.match("/reports/daily.json")[1] == "json"
+    assert trie.match("/reports/daily.csv") is None
+    assert trie.match("/items/42")[1] == "numeric"
+    assert trie.match("/items/abc")[1] == "any"
+
+
+def test_backtracks_to_less_specific_branch():
+    trie = PathTemplateTrie()
+    trie.add("/a/b/c", "literal")
+    trie.add("/a/{x}/d", "variable")
+
+    assert trie.match("/a/b/d")[1] == "variable"
+    assert trie.match("/a/b/c")[1] == "literal"
+
+
+def test_template_key():
+    assert template_key("/users/{id}") == template_key("/users/{userId}")
+    assert template_key("/users/*") == ("users", "{}")
+    assert template_key("/users/me") != template_key("/users/{id}")
+    assert template_key("/files/{*path}") == template_key("/files/**")
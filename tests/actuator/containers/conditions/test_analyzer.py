@@ -0,0 +1,216 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from src.actuator.containers.conditions import (
+    Conditions,
+    get_referenced_classes,
+    get_referenced_properties,
+)
+from src.actuator.containers.startup import Startup
+
+START = datetime(2025, 4, 23, 10, 23, 43, tzinfo=timezone.utc)
+
+
+def conditions():
+    return Conditions.model_validate(
+        {
+            "contexts": {
+                "application": {
+                    "positiveMatches": {
+                        "JmxAutoConfiguration": [
+                            {
+                                "condition": "OnClassCondition",
+                                "message": "@ConditionalOnClass found required class "
+                                "'org.springframework.jmx.export.MBeanExporter'",
+                            },
+                            {
+                                "condition": "OnPropertyCondition",
+                                "message": "@ConditionalOnProperty "
+                                "(spring.jmx.enabled=true) matched",
+                            },
+                        ],
+                        "JmxAutoConfiguration#mbeanExporter": [
+                            {
+                                "condition": "OnBeanCondition",
+                                "message": "@ConditionalOnMissingBean (types: "
+                                "org.springframework.jmx.export.MBeanExporter; "
+                                "SearchStrategy: current) did not find any beans",
+                            }
+                        ],
+                        "CacheAutoConfiguration": [
+                            {
+                                "condition": "OnClassCondition",
+                                "message": "@ConditionalOnClass found required class "
+                                "'org.springframework.cache.CacheManager'",
+                            }
+                        ],
+                    },
+                    "negativeMatches": {
+                        "DataSourceAutoConfiguration": {
+                            "notMatched": [
+                                {
+                                    "condition": "OnClassCondition",
+                                    "message": "@ConditionalOnClass did not find "
+                                    "required class 'javax.sql.DataSource'",
+                                }
+                            ],
+                            "matched": [
+                                {
+                                    "condition": "OnPropertyCondition",
+                                    "message": "@ConditionalOnProperty "
+                                    "(spring.datasource.enabled) matched",
+                                }
+                            ],
+                        },
+                        "ReactiveWebConfiguration": {
+                            "notMatched": [
+                                {
+                                    "condition": "OnWebApplicationCondition",
+                                    "message": "not a reactive web application",
+                                }
+                            ],
+                            "matched": [],
+                        },
+                    },
+                    "unconditionalClasses": [],
+                }
+            }
+        }
+    )
+
+
+def bean(step_id, start, duration, bean_name, bean_type):
+    return {
+        "startTime": (START + timedelta(seconds=start)).isoformat(),
+        "endTime": (START + timedelta(seconds=start + duration)).isoformat(),
+        "duration": f"PT{duration}S",
+        "startupStep": {
+            "name": "spring.beans.instantiate",
+            "id": step_id,
+            "tags": [
+                {"key": "beanName", "value": bean_name},
+                {"key": "beanType", "value": bean_type},
+            ],
+        },
+    }
+
+
+def test_negative_matches_report_shape():
+    context = conditions().get_context("application")
+    not_matched = context.get_negative_matches("DataSourceAutoConfiguration")
+    assert [evaluation.condition for evaluation in not_matched] == ["OnClassCondition"]
+    assert [
+        evaluation.condition
+        for evaluation in context.partial_matches["DataSourceAutoConfiguration"]
+    ] == ["OnPropertyCondition"]
+    assert "ReactiveWebConfiguration" not in context.partial_matches
+
+
+def test_referenced_names():
+    assert get_referenced_classes(
+        "@ConditionalOnBean (types: org.springframework.web.client.RestClient$Builder; "
+        "SearchStrategy: all) found bean 'restClientBuilder'"
+    ) == {"org.springframework.web.client.RestClient$Builder"}
+    assert get_referenced_properties(
+        "@ConditionalOnProperty (spring.jmx.enabled=true, spring.jmx.server) matched"
+    ) == {"spring.jmx.enabled", "spring.jmx.server"}
+    assert get_referenced_properties(
+        "@ConditionalOnAvailableEndpoint marked as exposed by a "
+        "'management.endpoints.web.exposure' property"
+    ) == {"management.endpoints.web.exposure"}
+
+
+def test_indexes():
+    analysis = conditions().get_analysis()
+    assert analysis.get_condition_types()["OnClassCondition"] == 3
+    assert [
+        record.configuration
+        for record in analysis.get_by_condition("OnClassCondition", matched=False)
+    ] == ["DataSourceAutoConfiguration"]
+    assert {
+        record.configuration for record in analysis.get_by_class("MBeanExporter")
+    } == {"JmxAutoConfiguration", "JmxAutoConfiguration#mbeanExporter"}
+    assert [
+        record.configuration
+        for record in analysis.get_by_property("spring.jmx.enabled")
+    ] == ["JmxAutoConfiguration"]
+    assert analysis.find_configurations("jmx") == [
+        "JmxAutoConfiguration",
+        "JmxAutoConfiguration#mbeanExporter",
+    ]
+
+
+def test_explain_inactive_configuration():
+    analysis = conditions().get_analysis()
+    assert not analysis.is_active("DataSourceAutoConfiguration")
+    assert analysis.is_active("CacheAutoConfiguration")
+    reasons = analysis.explain("DataSourceAutoConfiguration")
+    assert [(record.condition, record.matched) for record in reasons] == [
+        ("OnClassCondition", False),
+        ("OnPropertyCondition", True),
+    ]
+
+
+def test_configuration_costs():
+    startup = Startup.model_validate(
+        {
+            "springBootVersion": "3.4.4",
+            "timeline": {
+                "startTime": START.isoformat(),
+                "events": [
+                    bean(
+                        1,
+                        0.0,
+                        0.05,
+                        "org.springframework.boot.autoconfigure.jmx.JmxAutoConfiguration",
+                        "org.springframework.boot.autoconfigure.jmx.JmxAutoConfiguration",
+                    ),
+                    bean(
+                        2,
+                        0.1,
+                        0.3,
+                        "mbeanExporter",
+                        "org.springframework.jmx.export.annotation.AnnotationMBeanExporter",
+                    ),
+                    bean(
+                        3,
+                        0.5,
+                        0.1,
+                        "cacheAutoConfiguration",
+                        "org.springframework.boot.autoconfigure.cache.CacheAutoConfiguration",
+                    ),
+                ],
+            },
+        }
+    )
+    costs = conditions().get_analysis().get_configuration_costs(startup)
+    assert [cost.configuration for cost in costs] == [
+        "JmxAutoConfiguration",
+        "CacheAutoConfiguration",
+    ]
+    assert abs(costs[0].time - 0.35) < 1e-9
+    assert sorted(costs[0].beans) == [
+        "mbeanExporter",
+        "org.springframework.boot.autoconfigure.jmx.JmxAutoConfiguration",
+    ]
+
+
+def test_analysis_in_background():
+    snapshot = conditions()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        analysis = snapshot.get_analysis_async(executor).result()
+    assert snapshot.get_analysis() is analysis
+    assert snapshot.get_analysis_async().result() is analysis
+
+
+def test_snapshot_copies_keep_analysis():
+    snapshot = conditions()
+    analysis = snapshot.get_analysis()
+    for copied in (copy.deepcopy(snapshot), snapshot.model_copy(deep=True)):
+        assert copied.contexts == snapshot.contexts
+        assert copied.get_analysis() is not analysis
+        assert (
+            copied.get_analysis().get_condition_types()
+            == analysis.get_condition_types()
+        )
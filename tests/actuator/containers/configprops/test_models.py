@@ -0,0 +1,88 @@
+from src.actuator.containers.configprops import ConfigProps, flatten_properties
+
+JSON_DATA = {
+    "contexts": {
+        "demo": {
+            "beans": {
+                "spring.transaction-TransactionProperties": {
+                    "prefix": "spring.transaction",
+                    "properties": {},
+                    "inputs": {},
+                },
+                "spring.datasource-DataSourceProperties": {
+                    "prefix": "spring.datasource",
+                    "properties": {
+                        "url": "jdbc:h2:mem:test",
+                        "hikari": {"maxPoolSize": 10, "schemas": ["a", "b"]},
+                    },
+                    "inputs": {
+                        "url": {
+                            "value": "jdbc:h2:mem:test",
+                            "origin": "class path resource [application.properties] - 3:23",
+                        },
+                        "hikari": {"maxPoolSize": {}, "schemas": {}},
+                    },
+                },
+                "spring.datasource.hikari-HikariDataSource": {
+                    "prefix": "spring.datasource.hikari",
+                    "properties": {"poolName": "main"},
+                    "inputs": {},
+                },
+            },
+            "parentId": None,
+        }
+    }
+}
+
+
+def test_flatten_properties():
+    assert list(flatten_properties("p", {"a": {"b": 1, "c": []}, "d": {}})) == [
+        ("p.a.b", 1),
+        ("p.a.c", []),
+        ("p.d", {}),
+    ]
+    assert list(flatten_properties("p", {})) == [("p", {})]
+
+
+def test_configprops_prefixes_and_beans():
+    configprops = ConfigProps.model_validate(JSON_DATA)
+    assert configprops.get_prefixes() == [
+        "spring.datasource",
+        "spring.datasource.hikari",
+        "spring.transaction",
+    ]
+    assert sorted(configprops.get_beans("spring.datasource")) == [
+        "spring.datasource-DataSourceProperties",
+        "spring.datasource.hikari-HikariDataSource",
+    ]
+    assert configprops._index is None
+
+    bean = configprops.get_beans()["spring.datasource-DataSourceProperties"]
+    assert bean.get_property("hikari.maxPoolSize") == 10
+    assert bean.get_property("hikari") == {"maxPoolSize": 10, "schemas": ["a", "b"]}
+    assert bean.get_property("missing.key") is None
+    assert bean.get_input("url")["origin"].endswith("3:23")
+    assert bean.get_input("hikari.maxPoolSize") is None
+
+
+def test_configprops_index():
+    configprops = ConfigProps.model_validate(JSON_DATA)
+    assert [
+        entry.key for entry in configprops.find_by_prefix("spring.datasource.h")
+    ] == [
+        "spring.datasource.hikari.maxPoolSize",
+        "spring.datasource.hikari.poolName",
+        "spring.datasource.hikari.schemas",
+    ]
+    entry = configprops.find_by_prefix("spring.datasource.hikari.pool")[0]
+    assert (entry.value, entry.bean, entry.context) == (
+        "main",
+        "spring.datasource.hikari-HikariDataSource",
+        "demo",
+    )
+    assert [entry.key for entry in configprops.search("POOLSIZE")] == [
+        "spring.datasource.hikari.maxPoolSize"
+    ]
+    assert configprops.get_value("spring.datasource.url") == "jdbc:h2:mem:test"
+    assert configprops.get_value("spring.datasource") is None
+    assert configprops.get_value("spring.transaction") == {}
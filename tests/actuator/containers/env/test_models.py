@@ -1,4 +1,9 @@
-from src.actuator.containers.env import Env, PropertySource, PropertyValue
+from src.actuator.containers.env import (
+    Env,
+    PropertySource,
+    PropertyValue,
+    canonical_property_name,
+)
 
 
 def test_env_model_parsing():
@@ -95,3 +100,104 @@ def test_empty_env():
     assert len(env.property_sources) == 0
     assert env.get_property_source_names() == []
     assert env.find_property("any-property") == []
+
+
+def test_effective_property_resolution():
+    env = Env.model_validate(
+        {
+            "activeProfiles": ["prod"],
+            "propertySources": [
+                {"name": "server.ports", "properties": {}},
+                {
+                    "name": "systemEnvironment",
+                    "properties": {
+                        "SERVER_PORT": {
+                            "value": "8081",
+                            "origin": 'System Environment Property "SERVER_PORT"',
+                        },
+                        "SPRING_JPA_OPENINVIEW": {"value": "false"},
+                    },
+                },
+                {
+                    "name": "Config resource 'class path resource [application.properties]'",
+                    "properties": {
+                        "server.port": {"value": "8080"},
+                        "spring.jpa.open-in-view": {"value": "true"},
+                        "app.name": {"value": "demo"},
+                    },
+                },
+            ],
+        }
+    )
+
+    resolved = env.get_resolved_properties()
+    assert env.get_resolved_properties() is resolved
+    assert set(resolved) == {"server.port", "spring.jpa.openinview", "app.name"}
+
+    port = env.get_effective_property("server.port")
+    assert port.source == "systemEnvironment"
+    assert port.name == "SERVER_PORT"
+    assert port.value.value == "8081"
+    assert [(s.source, s.name) for s in port.shadowed] == [
+        (
+            "Config resource 'class path resource [application.properties]'",
+            "server.port",
+        )
+    ]
+
+    assert env.get_effective_value("SERVER_PORT") == "8081"
+    assert env.get_effective_value("spring.jpa.openInView") == "false"
+    assert env.get_effective_value("app.name") == "demo"
+    assert env.get_effective_value("missing") is None
+    assert env.get_effective_property("missing") is None
+
+    # find_property keeps returning every definition
+    assert len(env.find_property("server.port")) == 1
+
+    assert env.get_source_overrides() == {
+        "systemEnvironment": {
+            "Config resource 'class path resource [application.properties]'": [
+                "server.port",
+                "spring.jpa.open-in-view",
+            ]
+        }
+    }
+
+
+def test_environment_style_names_only_match_the_environment():
+    env = Env.model_validate(
+        {
+            "propertySources": [
+                {
+                    "name": "systemEnvironment",
+                    "properties": {"SERVER_PORT": {"value": "8081"}},
+                },
+                {
+                    "name": "Config resource 'class path resource [application.properties]'",
+                    "properties": {
+                        "app.cache.size": {"value": "10"},
+                        "app.cache_ttl": {"value": "60"},
+                    },
+                },
+            ]
+        }
+    )
+
+    assert env.get_effective_value("SERVER_PORT") == "8081"
+    assert env.get_effective_value("app.cache_ttl") == "60"
+    # Not an environment variable, so the underscore does not separate elements
+    assert env.get_effective_property("app.cache_size") is None
+    assert env.get_effective_property("APP_CACHE_SIZE") is None
+
+
+def test_canonical_property_name():
+    assert canonical_property_name("server.max-http-header-size") == (
+        "server.maxhttpheadersize"
+    )
+    assert canonical_property_name("server.maxHttpHeaderSize") == (
+        "server.maxhttpheadersize"
+    )
+    assert canonical_property_name("SERVER_MAXHTTPHEADERSIZE", True) == (
+        "server.maxhttpheadersize"
+    )
+    assert canonical_property_name("my_prop") == "my_prop"
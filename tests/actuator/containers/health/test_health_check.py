@@ -1,11 +1,16 @@
+from src.actuator.containers.common.extra_base_model import ExtraBaseModel
 from src.actuator.containers.health import (
+    Component,
+    CompositeComponent,
     HealthCheck,
     PingComponent,
     DiskSpaceComponent,
     SslComponent,
     DiskSpaceDetails,
     SslDetails,
+    register_component_type,
 )
+from src.actuator.containers.health.composite_component import _COMPONENT_TYPES
 
 
 def test_health_check_model_parsing():
@@ -66,3 +71,140 @@ def test_health_check_model_parsing():
     assert isinstance(ssl.details, SslDetails)
     assert len(ssl.details.valid_chains) == 0
     assert len(ssl.details.invalid_chains) == 0
+
+
+def test_unknown_component_is_generic():
+    health = HealthCheck.model_validate(
+        {
+            "status": "DOWN",
+            "components": {"db": {"status": "DOWN", "details": {"error": "timeout"}}},
+        }
+    )
+    component = health.components["db"]
+    assert type(component) is Component
+    assert component.status == "DOWN"
+    assert component.details == {"error": "timeout"}
+
+
+def test_register_component_type():
+    class DbDetails(ExtraBaseModel):
+        database: str
+
+    class DbComponent(Component[DbDetails]):
+        pass
+
+    register_component_type("db", DbComponent)
+    try:
+        health = HealthCheck.model_validate(
+            {
+                "status": "UP",
+                "components": {
+                    "db": {"status": "UP", "details": {"database": "PostgreSQL"}}
+                },
+            }
+        )
+    finally:
+        _COMPONENT_TYPES.pop("db")
+    assert isinstance(health.components["db"], DbComponent)
+    assert health.components["db"].details.database == "PostgreSQL"
+
+
+def test_composite_components_are_expanded_lazily():
+    health = HealthCheck.model_validate(
+        {
+            "status": "DOWN",
+            "groups": ["liveness", "readiness"],
+            "components": {
+                "db": {
+                    "status": "DOWN",
+                    "components": {
+                        "primary": {
+                            "status": "UP",
+                            "details": {"database": "PostgreSQL"},
+                        },
+                        "secondary": {
+                            "status": "DOWN",
+                            "details": {"error": "Connection refused"},
+                        },
+                    },
+                },
+                "ping": {"status": "UP"},
+            },
+        }
+    )
+    assert health.groups == ["liveness", "readiness"]
+
+    db = health.components["db"]
+    assert isinstance(db, CompositeComponent)
+    assert db.status == "DOWN"
+    assert db.get_names() == ["primary", "secondary"]
+    assert db.get_status("secondary") == "DOWN"
+    assert db._parsed == {}
+
+    primary = health.get_component("db/primary")
+    assert isinstance(primary, Component)
+    assert primary.details == {"database": "PostgreSQL"}
+    assert db.get_component("primary") is primary
+    assert set(db._parsed) == {"primary"}
+
+    assert set(db.get_components()) == {"primary", "secondary"}
+    assert health.get_component("db/tertiary") is None
+    assert health.get_component("ping/anything") is None
+    assert health.get_component("ping").status == "UP"
+
+
+def test_nested_composite_and_registered_types():
+    health = HealthCheck.model_validate(
+        {
+            "status": "UP",
+            "components": {
+                "custom": {
+                    "status": "UP",
+                    "components": {
+                        "storage": {
+                            "status": "UP",
+                            "components": {
+                                "diskSpace": {
+                                    "status": "UP",
+                                    "details": {
+                                        "total": 100,
+                                        "free": 50,
+                                        "threshold": 10,
+                                        "path": "/",
+                                        "exists": True,
+                                    },
+                                }
+                            },
+                        }
+                    },
+                }
+            },
+        }
+    )
+    disk = health.get_component("custom/storage/diskSpace")
+    assert isinstance(disk, DiskSpaceComponent)
+    assert disk.details.free == 50
+    assert (
+        health.model_dump()["components"]["custom"]["components"]["storage"]["status"]
+        == "UP"
+    )
+
+
+def test_ssl_chains_reported_as_strings_are_skipped():
+    health = HealthCheck.model_validate(
+        {
+            "status": "UP",
+            "components": {
+                "ssl": {
+                    "status": "UP",
+                    "details": {
+                        "validChains": ["server"],
+                        "invalidChains": [{"alias": "legacy", "certificates": []}],
+                    },
+                }
+            },
+        }
+    )
+    details = health.components["ssl"].details
+    assert details.valid_chains == []
+    assert [chain.alias for chain in details.get_chains()] == ["legacy"]
@@ -99,3 +99,100 @@ def test_empty_http_exchanges():
 
     # Verify empty exchanges list
     assert len(http_exchanges.exchanges) == 0
+
+
+def test_http_exchange_time_taken_seconds():
+    exchange = HttpExchange.model_validate(
+        {
+            "timestamp": "2025-04-23T11:00:15.553006200Z",
+            "request": {"uri": "http://localhost:9090/", "method": "GET"},
+            "response": {"status": 200},
+            "timeTaken": "PT1M0.5S",
+        }
+    )
+    assert exchange.get_time_taken_seconds() == 60.5
+
+
+def test_header_index_is_cached_and_case_insensitive():
+    request = HttpRequest.model_validate(
+        {
+            "uri": "http://localhost:9090/",
+            "method": "GET",
+            "headers": {"Accept": ["text/html"], "accept": ["*/*"], "Host": ["h"]},
+        }
+    )
+
+    index = request.get_header_index()
+    assert index == {"accept": ["text/html", "*/*"], "host": ["h"]}
+    assert request.get_header_index() is index
+    assert request.get_header("ACCEPT") == "text/html"
+    assert request.get_header_values("accept") == ["text/html", "*/*"]
+    assert request.get_header_values("missing") == []
+    assert "_header_index" not in request.model_dump()
+
+
+def test_header_index_follows_header_changes():
+    request = HttpRequest.model_validate(
+        {"uri": "/", "method": "GET", "headers": {"Accept": ["text/html"]}}
+    )
+    values = request.get_header_values("accept")
+    values.append("*/*")
+    assert request.get_header_values("accept") == ["text/html"]
+    assert request.headers == {"Accept": ["text/html"]}
+
+    request.headers["X-Request-Id"] = ["42"]
+    assert request.get_header("x-request-id") == "42"
+    request.headers = {"Accept": ["application/json"]}
+    assert request.get_header("accept") == "application/json"
+    assert request.get_header("x-request-id") is None
+
+
+def test_bulk_header_extraction():
+    def exchange(user_agent, content_type):
+        request_headers = {"User-Agent": [user_agent]} if user_agent else {}
+        return {
+            "timestamp": "2025-04-23T11:00:15Z",
+            "request": {"uri": "/", "method": "GET", "headers": request_headers},
+            "response": {
+                "status": 200,
+                "headers": {"Content-Type": [content_type]},
+            },
+            "timeTaken": "PT0.01S",
+        }
+
+    http_exchanges = HttpExchanges.model_validate(
+        {
+            "exchanges": [
+                exchange("curl", "application/json"),
+                exchange("chrome", "text/html"),
+                exchange(None, "application/json"),
+                exchange("curl", "text/plain"),
+            ]
+        }
+    )
+
+    columns = http_exchanges.extract_headers(["user-agent", "X-Request-Id"])
+    assert columns == {
+        "user-agent": ["curl", "chrome", None, "curl"],
+        "X-Request-Id": [None, None, None, None],
+    }
+    assert http_exchanges.extract_headers(["content-type"], source="response") == {
+        "content-type": [
+            "application/json",
+            "text/html",
+            "application/json",
+            "text/plain",
+        ]
+    }
+
+    groups = http_exchanges.group_by_header("User-Agent")
+    assert {key: len(value) for key, value in groups.items()} == {
+        "curl": 2,
+        "chrome": 1,
+        None: 1,
+    }
+
+    json_exchanges = http_exchanges.filter_by_header(
+        "content-type", "application/json", source="response"
+    )
+    assert len(json_exchanges) == 2
@@ -0,0 +1,116 @@
+from src.actuator.containers.httpexchanges import UriNormalizer, get_predicate_patterns
+from src.actuator.containers.mappings import Mappings
+from src.actuator.containers.metrics import Metric
+
+
+def test_get_predicate_patterns():
+    assert get_predicate_patterns(
+        "{GET [/actuator/loggers/{name}], produces [application/json]}"
+    ) == ["/actuator/loggers/{name}"]
+    assert get_predicate_patterns(
+        "{[PATCH, PUT, POST] [/{repository}/{id}], consumes [application/json]}"
+    ) == ["/{repository}/{id}"]
+    assert get_predicate_patterns("{GET [/ || ], produces [application/json]}") == [
+        "/",
+        "/",
+    ]
+    assert get_predicate_patterns("/webjars/**") == ["/webjars/**"]
+    assert get_predicate_patterns("unrelated") == []
+
+
+def test_learn_from_mappings():
+    mappings = {
+        "contexts": {
+            "demo": {
+                "mappings": {
+                    "dispatcherServlets": {
+                        "dispatcherServlet": [
+                            {
+                                "predicate": "{GET [/api/users/{id}]}",
+                                "handler": "UserController#get(Long)",
+                                "details": {
+                                    "requestMappingConditions": {
+                                        "methods": ["GET"],
+                                        "patterns": ["/api/users/{id}"],
+                                    }
+                                },
+                            },
+                            {
+                                "predicate": "{GET [/actuator/health/**]}",
+                                "handler": "Actuator web endpoint 'health'",
+                                "details": None,
+                            },
+                        ]
+                    }
+                }
+            }
+        }
+    }
+
+    normalizer = UriNormalizer()
+    assert normalizer.learn_from_mappings(mappings) == 2
+    assert normalizer.normalize("http://host/api/users/42?x=1") == "/api/users/{id}"
+    assert normalizer.normalize("/actuator/health/db") == "/actuator/health/**"
+
+
+def test_learn_from_metric_tags():
+    metric = Metric.model_validate(
+        {
+            "name": "http.server.requests",
+            "description": "",
+            "baseUnit": "seconds",
+            "availableTags": [
+                {
+                    "tag": "uri",
+                    "values": [
+                        "/actuator/metrics/{requiredMetricName}",
+                        "/actuator/metrics",
+                        "UNKNOWN",
+                    ],
+                }
+            ],
+        }
+    )
+
+    normalizer = UriNormalizer()
+    assert normalizer.learn_from_metric(metric) == 2
+    assert (
+        normalizer.normalize("http://localhost:9090/actuator/metrics/jvm.memory.used")
+        == "/actuator/metrics/{requiredMetricName}"
+    )
+    assert normalizer.normalize("/actuator/metrics") == "/actuator/metrics"
+
+
+def test_unmatched_uris_mask_ids():
+    normalizer = UriNormalizer(["/known"])
+    assert normalizer.normalize("/orders/12345/items") == "/orders/{id}/items"
+    assert (
+        normalizer.normalize("/sessions/550e8400-e29b-41d4-a716-446655440000")
+        == "/sessions/{id}"
+    )
+    assert normalizer.normalize("/orders/latest") == "/orders/latest"
+    assert normalizer.normalize("http://host") == "/"
+
+
+def test_learn_from_mappings_model():
+    mappings = Mappings.model_validate(
+        {
+            "contexts": {
+                "demo": {
+                    "mappings": {
+                        "dispatcherServlets": {
+                            "dispatcherServlet": [
+                                {
+                                    "predicate": "{GET [/api/orders/{id}]}",
+                                    "handler": "OrderController#get(Long)",
+                                }
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+    )
+    normalizer = UriNormalizer()
+    assert normalizer.learn_from_mappings(mappings) == 1
+    assert normalizer.normalize("/api/orders/7") == "/api/orders/{id}"
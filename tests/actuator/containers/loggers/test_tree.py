@@ -0,0 +1,67 @@
+from src.actuator.containers.loggers import Loggers
+
+
+def loggers():
+    return Loggers.model_validate(
+        {
+            "levels": ["OFF", "ERROR", "WARN", "INFO", "DEBUG", "TRACE"],
+            "loggers": {
+                "ROOT": {"configuredLevel": "INFO", "effectiveLevel": "INFO"},
+                "com": {"effectiveLevel": "INFO"},
+                "com.example": {"configuredLevel": "WARN", "effectiveLevel": "WARN"},
+                "com.example.orders": {"effectiveLevel": "WARN"},
+                "com.example.orders.OrderService": {"effectiveLevel": "WARN"},
+                "com.example.orders.web": {
+                    "configuredLevel": "DEBUG",
+                    "effectiveLevel": "DEBUG",
+                },
+                "com.example.ordering": {"effectiveLevel": "WARN"},
+                "org.springframework.web": {"effectiveLevel": "INFO"},
+            },
+        }
+    )
+
+
+def test_tree_is_cached():
+    snapshot = loggers()
+    assert snapshot.get_tree() is snapshot.get_tree()
+
+
+def test_subtree():
+    tree = loggers().get_tree()
+    assert tree.get_subtree("com.example.orders") == [
+        "com.example.orders",
+        "com.example.orders.OrderService",
+        "com.example.orders.web",
+    ]
+    assert tree.get_subtree("com.example.orders", include_self=False) == [
+        "com.example.orders.OrderService",
+        "com.example.orders.web",
+    ]
+    # "org" and "org.springframework" are only packages, not loggers
+    assert tree.get_subtree("org") == ["org.springframework.web"]
+    assert tree.get_subtree("net") == []
+
+
+def test_find_by_prefix():
+    tree = loggers().get_tree()
+    assert tree.find_by_prefix("com.example.order") == [
+        "com.example.ordering",
+        "com.example.orders",
+        "com.example.orders.OrderService",
+        "com.example.orders.web",
+    ]
+    assert tree.find_by_prefix("or") == ["org.springframework.web"]
+
+
+def test_effective_level_inheritance():
+    tree = loggers().get_tree()
+    assert tree.get_level_source("com.example.orders.OrderService") == "com.example"
+    assert tree.get_level_source("com.example.orders.web.Controller") == (
+        "com.example.orders.web"
+    )
+    assert tree.get_level_source("net.other") == "ROOT"
+    assert tree.get_effective_level("com.example.orders.web.Controller") == "DEBUG"
+    assert tree.get_effective_level("com.example.orders") == "WARN"
+    assert tree.get_effective_level("net.other") == "INFO"
+    assert tree.get_configured_descendants("com.example") == ["com.example.orders.web"]
@@ -0,0 +1,170 @@
+from src.actuator.containers.mappings import Mappings
+
+
+def mapping(methods, patterns, handler, class_name=None, name=None):
+    predicate = "{" + " ".join(methods) + " [" + " || ".join(patterns) + "]}"
+    return {
+        "predicate": predicate,
+        "handler": handler,
+        "details": {
+            "handlerMethod": {
+                "className": class_name or handler.split("#")[0],
+                "name": name or "handle",
+                "descriptor": "()V",
+            },
+            "requestMappingConditions": {
+                "consumes": [],
+                "headers": [],
+                "methods": methods,
+                "params": [{"name": "page", "negated": False}],
+                "patterns": patterns,
+                "produces": [{"mediaType": "application/json", "negated": False}],
+            },
+        },
+    }
+
+
+JSON_DATA = {
+    "contexts": {
+        "demo": {
+            "mappings": {
+                "dispatcherServlets": {
+                    "dispatcherServlet": [
+                        mapping(
+                            ["GET"],
+                            ["/api/info"],
+                            "com.example.SimpleController#getInfo()",
+                            name="getInfo",
+                        ),
+                        mapping(
+                            ["GET"],
+                            ["/{repository}/{id}"],
+                            "com.example.RepositoryController#getItem()",
+                            name="getItem",
+                        ),
+                        mapping(
+                            ["DELETE"],
+                            ["/{repository}/{id}"],
+                            "com.example.RepositoryController#deleteItem()",
+                            name="deleteItem",
+                        ),
+                        mapping(
+                            ["GET"],
+                            ["", "/"],
+                            "com.example.RootController#list()",
+                            name="list",
+                        ),
+                        mapping([], ["/error"], "com.example.ErrorController#error()"),
+                        {
+                            "predicate": "/webjars/**",
+                            "handler": "ResourceHttpRequestHandler [classpath [META-INF/resources/webjars/]]",
+                        },
+                    ]
+                },
+                "servletFilters": [
+                    {
+                        "urlPatternMappings": ["/*"],
+                        "servletNameMappings": [],
+                        "name": "requestContextFilter",
+                        "className": "org.springframework.web.filter.RequestContextFilter",
+                    }
+                ],
+                "servlets": [
+                    {
+                        "mappings": ["/"],
+                        "name": "dispatcherServlet",
+                        "className": "org.springframework.web.servlet.DispatcherServlet",
+                    }
+                ],
+            }
+        }
+    }
+}
+
+
+def test_mappings_model_parsing():
+    mappings = Mappings.model_validate(JSON_DATA)
+
+    context = mappings.contexts["demo"]
+    handlers = context.mappings.dispatcher_servlets["dispatcherServlet"]
+    assert len(handlers) == 6
+    assert handlers[0].get_patterns() == ["/api/info"]
+    assert handlers[0].get_methods() == ["GET"]
+    assert handlers[0].get_handler_method().get_signature() == (
+        "com.example.SimpleController#getInfo"
+    )
+    conditions = handlers[0].details.request_mapping_conditions
+    assert conditions.produces[0].media_type == "application/json"
+    assert conditions.params[0].name == "page"
+    assert handlers[3].get_patterns() == ["/"]
+    assert handlers[5].details is None
+    assert handlers[5].get_patterns() == ["/webjars/**"]
+    assert handlers[5].get_handler_method() is None
+
+    assert context.mappings.servlets[0].class_name.endswith("DispatcherServlet")
+    assert mappings.get_servlet_filters()[0].url_pattern_mappings == ["/*"]
+
+
+def test_route_index_matches_method_and_path():
+    mappings = Mappings.model_validate(JSON_DATA)
+    index = mappings.get_route_index()
+    assert mappings.get_route_index() is index
+    assert len(index) == 6
+
+    assert mappings.find_handler("/api/info", "GET").handler_method == (
+        "com.example.SimpleController#getInfo"
+    )
+    assert mappings.find_handler("http://host/orders/42?x=1", "GET").handler_method == (
+        "com.example.RepositoryController#getItem"
+    )
+    assert mappings.find_handler("/orders/42", "delete").handler_method == (
+        "com.example.RepositoryController#deleteItem"
+    )
+    # GET routes serve HEAD; routes without methods serve any method
+    assert mappings.find_handler("/orders/42", "HEAD").handler_method == (
+        "com.example.RepositoryController#getItem"
+    )
+    assert mappings.find_handler("/error", "POST").handler == (
+        "com.example.ErrorController#error()"
+    )
+    assert mappings.find_handler("/", "GET").pattern == "/"
+    assert mappings.find_handler("/webjars/app.js").pattern == "/webjars/**"
+    assert mappings.find_handler("/orders/42", "PUT") is None
+
+    # Metric uri tags are templates and match their own route
+    assert mappings.find_handler("/{repository}/{id}", "GET").pattern == (
+        "/{repository}/{id}"
+    )
+    assert index.get_methods("/orders/42") == ["DELETE", "GET"]
+    assert index.get_methods("/error") == list(
+        ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE")
+    )
+
+
+def test_route_index_keeps_patterns_differing_in_variable_names():
+    mappings = Mappings.model_validate(
+        {
+            "contexts": {
+                "demo": {
+                    "mappings": {
+                        "dispatcherServlets": {
+                            "dispatcherServlet": [
+                                mapping(["GET"], ["/users/{id}"], "Users#get"),
+                                mapping(
+                                    ["DELETE"], ["/users/{userId}"], "Users#delete"
+                                ),
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+    )
+    index = mappings.get_route_index()
+    assert [route.handler for route in index.match("/users/5")] == [
+        "Users#get",
+        "Users#delete",
+    ]
+    assert index.get_methods("/users/5") == ["DELETE", "GET"]
+    assert index.match("/users/5", "GET")[0].pattern == "/users/{id}"
+    assert index.match("/users/5", "DELETE")[0].pattern == "/users/{userId}"
@@ -0,0 +1,70 @@
+from src.actuator.containers.metrics import (
+    Metric,
+    format_nanoseconds,
+    format_seconds,
+    format_time,
+    format_values,
+    get_formatter,
+    register_formatter,
+)
+from src.actuator.containers.metrics.formatters import _FORMATTERS, format_number
+
+
+def test_format_time_keeps_decimal_of_fractional_values():
+    assert format_time(12) == "12 ms"
+    assert format_time(12.04) == "12.0 ms"
+    assert format_time(999.96) == "1000.0 ms"
+    assert format_time(2000) == "2 s"
+    assert format_time(2040) == "2.0 s"
+    assert format_time(120000) == "2 m"
+    assert format_time(121000) == "2.0 m"
+
+
+def test_format_seconds():
+    assert format_seconds(0.0125) == "12.5 ms"
+    assert format_seconds(1.5) == "1.5 s"
+    assert format_seconds(90) == "1.5 m"
+
+
+def test_format_nanoseconds():
+    assert format_nanoseconds(2_500_000) == "2.5 ms"
+    assert format_nanoseconds(3_000_000_000) == "3 s"
+
+
+def test_get_formatter():
+    assert get_formatter("bytes")(2048) == "2 KB"
+    assert get_formatter("seconds") is format_seconds
+    assert get_formatter(None) is format_number
+    assert get_formatter("requests") is format_number
+
+
+def test_format_values_matches_single_values():
+    values = [0, 0.5, 999, 1024, 1536, 5 * 1024**3]
+    assert format_values(values, "bytes") == [
+        get_formatter("bytes")(value) for value in values
+    ]
+    assert format_values([1.0, 2.25], None) == ["1", "2.25"]
+
+
+def test_register_formatter():
+    try:
+        register_formatter("connections", lambda value: f"{int(value)} conn")
+        assert format_values([3.0], "connections") == ["3 conn"]
+    finally:
+        _FORMATTERS.pop("connections", None)
+
+
+def test_metric_formats_seconds():
+    metric = Metric.model_validate(
+        {
+            "name": "jvm.gc.pause.max",
+            "baseUnit": "seconds",
+            "measurements": [
+                {"statistic": "VALUE", "value": 0.25},
+            ],
+            "availableTags": [],
+        }
+    )
+    assert metric.get_formatter() is metric.get_formatter()
+    assert metric.format_value() == "250 ms"
+    assert metric.get_formatter()(1.5) == "1.5 s"
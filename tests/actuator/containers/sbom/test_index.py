@@ -0,0 +1,55 @@
+from src.actuator.containers.sbom import version_key
+
+
+def test_lookups(make_sbom, maven_purl):
+    model = make_sbom()
+    index = model.get_index()
+    assert model.get_index() is index
+
+    log4j = maven_purl("org.apache.logging.log4j", "log4j-core", "2.14.1")
+    assert index.get_component(log4j).name == "log4j-core"
+    assert index.get_component_by_purl(log4j).version == "2.14.1"
+    assert model.get_component_by_ref("tool:cyclonedx-gradle-plugin").version == "2.2.0"
+    assert model.get_component_by_ref("missing") is None
+    assert [
+        component.version
+        for component in index.get_components_by_name(
+            "log4j-core", "org.apache.logging.log4j"
+        )
+    ] == ["2.14.1"]
+    # Without a group, components of every group match
+    assert [
+        component.group for component in index.get_components_by_name("log4j-core")
+    ] == ["org.apache.logging.log4j"]
+    assert index.get_components_by_name("log4j-core", "org.example") == []
+
+
+def test_dependency_graph(make_sbom, maven_purl):
+    model = make_sbom()
+    index = model.get_index()
+    app = maven_purl("com.example", "orders", "1.0.0")
+    starter = maven_purl(
+        "org.springframework.boot", "spring-boot-starter-log4j2", "2.5.0"
+    )
+    log4j = maven_purl("org.apache.logging.log4j", "log4j-core", "2.14.1")
+    api = maven_purl("org.apache.logging.log4j", "log4j-api", "2.14.1")
+
+    assert model.get_dependencies_for(log4j) == [api]
+    assert model.get_dependencies_for("missing") == []
+    assert index.get_dependents(log4j) == [starter]
+    assert index.get_transitive_dependents(api) == [log4j, starter, app]
+    assert index.get_transitive_dependencies(app) == [starter, log4j, api]
+
+
+def test_version_key():
+    assert version_key("2.9.1") < version_key("2.17.0")
+    assert version_key("2.17") == version_key("2.17.0")
+    assert version_key("2.17.0-rc1") < version_key("2.17.0")
+    assert version_key("6.4.4.Final") == version_key("6.4.4")
+    assert version_key("2.17.0") < version_key("2.17.1")
+    assert version_key("1.0.0-SNAPSHOT") < version_key("1.0.0")
+    assert version_key("1.0-rc2") < version_key("1.0-rc10")
+    assert version_key("1.0-rc10") < version_key("1.0")
+    assert version_key("6.0.0-M2") < version_key("6.0.0-M10")
+    assert version_key("6.0.0-M10") < version_key("6.0.0-RC1")
+    assert version_key("1.0-beta-2") < version_key("1.0-beta-11")
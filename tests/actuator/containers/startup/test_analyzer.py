@@ -0,0 +1,120 @@
+import pytest
+
+from src.actuator.containers.startup import Startup, StartupAnalysis
+
+
+@pytest.fixture
+def startup(startup_event, startup_time):
+    # Events are listed in the order they end, children before parents
+    events = [
+        startup_event(0, "spring.boot.application.starting", 0, 0.1),
+        startup_event(
+            3, "spring.beans.instantiate", 0.3, 0.2, 2, beanName="dataSource"
+        ),
+        startup_event(
+            4, "spring.beans.instantiate", 0.6, 0.3, 2, beanName="repository"
+        ),
+        startup_event(2, "spring.beans.instantiate", 0.2, 1.0, 1, beanName="service"),
+        startup_event(
+            5, "spring.beans.instantiate", 1.3, 0.4, 1, beanName="controller"
+        ),
+        startup_event(1, "spring.context.refresh", 0.1, 2.0),
+        startup_event(6, "spring.boot.application.ready", 2.1, 0.05),
+    ]
+    return Startup.model_validate(
+        {
+            "springBootVersion": "3.4.4",
+            "timeline": {"startTime": startup_time.isoformat(), "events": events},
+        }
+    )
+
+
+def test_tree_and_times(startup):
+    analysis = startup.get_analysis()
+    assert len(analysis) == 7
+    assert [root.id for root in analysis.roots] == [0, 1, 6]
+
+    refresh = analysis.get_node(1)
+    assert [child.id for child in refresh.children] == [2, 5]
+    assert refresh.total_time == 2.0
+    assert abs(refresh.self_time - 0.6) < 1e-9
+
+    service = analysis.get_node(2)
+    assert service.get_tag("beanName") == "service"
+    assert abs(service.self_time - 0.5) < 1e-9
+    assert analysis.get_node(3).self_time == 0.2
+
+
+def test_critical_path(startup):
+    path = startup.get_analysis().get_critical_path()
+    assert [node.id for node in path] == [1, 2, 4]
+
+
+def test_slowest_beans(startup):
+    analysis = startup.get_analysis()
+    by_total = analysis.get_slowest_beans(2)
+    assert [node.get_tag("beanName") for node in by_total] == ["service", "controller"]
+    by_self = analysis.get_slowest_beans(3, by_self_time=True)
+    assert [node.get_tag("beanName") for node in by_self] == [
+        "service",
+        "controller",
+        "repository",
+    ]
+
+
+def test_time_by_name(startup):
+    times = startup.get_analysis().get_time_by_name()
+    assert list(times)[0] == "spring.beans.instantiate"
+    assert abs(times["spring.beans.instantiate"] - 1.4) < 1e-9
+
+
+def test_missing_parent_is_root(startup_event, startup_time):
+    analysis = StartupAnalysis(
+        Startup.model_validate(
+            {
+                "springBootVersion": "3.4.4",
+                "timeline": {
+                    "startTime": startup_time.isoformat(),
+                    "events": [
+                        startup_event(7, "spring.beans.instantiate", 0, 0.1, 99)
+                    ],
+                },
+            }
+        ).timeline.events
+    )
+    assert [root.id for root in analysis.roots] == [7]
+
+
+def test_indexed_lookups_and_cached_analysis(startup):
+    model = startup
+    assert [
+        e.startup_step.id for e in model.get_steps_by_name("spring.beans.instantiate")
+    ] == [
+        3,
+        4,
+        2,
+        5,
+    ]
+    assert model.get_step_by_id(5).startup_step.name == "spring.beans.instantiate"
+    assert model.get_step_by_id(42) is None
+    assert model.get_analysis() is model.get_analysis()
+    assert model.get_startup_phases()["spring.context.refresh"] == 2.0
+
+
+def test_duplicate_step_id_keeps_the_first_event(startup_event, startup_time):
+    model = Startup.model_validate(
+        {
+            "springBootVersion": "3.4.4",
+            "timeline": {
+                "startTime": startup_time.isoformat(),
+                "events": [
+                    startup_event(1, "spring.context.refresh", 0, 1.0),
+                    startup_event(1, "spring.boot.application.ready", 1.0, 0.1),
+                ],
+            },
+        }
+    )
+    analysis = model.get_analysis()
+    assert len(analysis) == 1
+    assert analysis.get_node(1).event is model.get_step_by_id(1)
+    assert analysis.get_node(1).name == "spring.context.refresh"
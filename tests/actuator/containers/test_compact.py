@@ -0,0 +1,106 @@
+from src.actuator.containers.auditevents import AuditEvent
+from src.actuator.containers.compact import (
+    compact_audit_event,
+    compact_event,
+    compact_exchange,
+    compact_measurements,
+    compact_stack_trace,
+    compact_tag,
+)
+from src.actuator.containers.httpexchanges import HttpExchange
+from src.actuator.containers.metrics import Metric
+from src.actuator.containers.startup import Event
+from src.actuator.containers.threaddump import StackTraceElement
+
+
+def test_compact_metric():
+    metric = Metric.model_validate(
+        {
+            "name": "http.server.requests",
+            "measurements": [
+                {"statistic": "COUNT", "value": 29},
+                {"statistic": "TOTAL_TIME", "value": 0.5},
+            ],
+            "availableTags": [{"tag": "uri", "values": ["/api/info"]}],
+        }
+    )
+    measurements = compact_measurements(metric.measurements)
+    assert measurements[0] == ("COUNT", 29.0)
+    assert measurements[1].statistic == "TOTAL_TIME"
+    assert compact_tag(metric.available_tags[0]) == ("uri", ("/api/info",))
+
+
+def test_compact_stack_trace_interns_names():
+    data = {
+        "methodName": "run",
+        "fileName": "Thread.java",
+        "lineNumber": 1583,
+        "nativeMethod": False,
+    }
+    # Equal but distinct strings, as parsed from two responses
+    frames = compact_stack_trace(
+        [
+            StackTraceElement.model_validate(
+                {**data, "className": "".join(["java.lang.", "Thread"])}
+            )
+            for _ in range(2)
+        ]
+    )
+    assert frames[0].class_name == "java.lang.Thread"
+    assert frames[0].line_number == 1583
+    assert frames[0].module_name is None
+    assert frames[0].class_name is frames[1].class_name
+
+
+def test_compact_exchange_and_events():
+    exchange = compact_exchange(
+        HttpExchange.model_validate(
+            {
+                "timestamp": "2025-04-23T10:24:55.240133900Z",
+                "request": {
+                    "uri": "http://localhost:9090/api/info",
+                    "method": "GET",
+                    "headers": {"accept": ["*/*"]},
+                },
+                "response": {"status": 200, "headers": {}},
+                "timeTaken": "PT0.015S",
+            }
+        )
+    )
+    assert (exchange.method, exchange.status, exchange.time_taken) == (
+        "GET",
+        200,
+        0.015,
+    )
+    assert exchange.request_headers == {"accept": ["*/*"]}
+
+    audit_event = compact_audit_event(
+        AuditEvent.model_validate(
+            {
+                "timestamp": "2025-04-23T10:24:55Z",
+                "principal": "alice",
+                "type": "AUTHENTICATION_FAILURE",
+                "data": {"details": {"remoteAddress": "10.0.0.1"}},
+            }
+        )
+    )
+    assert audit_event.type == "AUTHENTICATION_FAILURE"
+    assert audit_event.data["details"] == {"remoteAddress": "10.0.0.1"}
+
+    event = compact_event(
+        Event.model_validate(
+            {
+                "endTime": "2025-04-23T10:24:55.5Z",
+                "duration": "PT0.5S",
+                "startTime": "2025-04-23T10:24:55Z",
+                "startupStep": {
+                    "name": "spring.beans.instantiate",
+                    "id": 3,
+                    "tags": [{"key": "beanName", "value": "dataSource"}],
+                    "parentId": 1,
+                },
+            }
+        )
+    )
+    assert (event.id, event.parent_id, event.duration) == (3, 1, 0.5)
+    assert event.tags == (("beanName", "dataSource"),)
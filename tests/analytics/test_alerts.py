@@ -0,0 +1,265 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from tinydb import TinyDB
+
+from src.actuator.containers.health import DiskSpaceDetails
+from src.actuator.containers.metrics import Metric
+from src.analytics import (
+    Alert,
+    AlertEngine,
+    AlertRule,
+    RateOfChangeRule,
+    ThresholdRule,
+    ZScoreRule,
+    disk_space_values,
+    metric_values,
+)
+from src.analytics.alerts import DISK_FREE_SERIES, DISK_THRESHOLD_SERIES
+from src.tinydb.tiny_repo import TinyRepo
+
+START = datetime(2025, 4, 23, 11, 0, 0, tzinfo=timezone.utc)
+
+
+def at(seconds):
+    return START + timedelta(seconds=seconds)
+
+
+def gauge(name, value):
+    return Metric.model_validate(
+        {"name": name, "measurements": [{"statistic": "VALUE", "value": value}]}
+    )
+
+
+def test_ratio_threshold_fires_once_and_resolves():
+    engine = AlertEngine(
+        [
+            ThresholdRule(
+                "heap", "jvm.memory.used", above=0.9, reference="jvm.memory.max"
+            )
+        ]
+    )
+
+    def sample(used, seconds):
+        metrics = [gauge("jvm.memory.used", used), gauge("jvm.memory.max", 1000)]
+        return engine.evaluate("server-1", metric_values(metrics), at(seconds))
+
+    assert sample(500, 0) == []
+    alerts = sample(950, 10)
+    assert len(alerts) == 1
+    assert alerts[0].rule == "heap"
+    assert alerts[0].value == 0.95
+    assert not alerts[0].resolved
+    assert engine.get_firing() == {("server-1", "heap")}
+
+    # Still above the limit: no new alert
+    assert sample(960, 20) == []
+
+    alerts = sample(400, 30)
+    assert len(alerts) == 1
+    assert alerts[0].resolved
+    assert engine.get_firing() == set()
+
+
+def test_ratio_rule_needs_both_series():
+    engine = AlertEngine(
+        [
+            ThresholdRule(
+                "heap", "jvm.memory.used", above=0.9, reference="jvm.memory.max"
+            )
+        ]
+    )
+    assert engine.evaluate("server-1", {"jvm.memory.used": 990}, START) == []
+    assert engine.evaluate("server-1", {"jvm.memory.max": 0}, START) == []
+
+
+def test_disk_space_below_threshold():
+    engine = AlertEngine(
+        [
+            ThresholdRule(
+                "disk",
+                DISK_FREE_SERIES,
+                below=1.0,
+                reference=DISK_THRESHOLD_SERIES,
+                severity="critical",
+            )
+        ]
+    )
+    details = DiskSpaceDetails(
+        total=100_000, free=5_000, threshold=10_000, path="/", exists=True
+    )
+    alerts = engine.evaluate("server-1", disk_space_values(details), START)
+    assert len(alerts) == 1
+    assert alerts[0].severity == "critical"
+    assert alerts[0].value == 0.5
+
+
+def test_rate_of_change():
+    engine = AlertEngine([RateOfChangeRule("threads", "jvm.threads.live", 5)])
+    assert engine.evaluate("server-1", {"jvm.threads.live": 40}, at(0)) == []
+    assert engine.evaluate("server-1", {"jvm.threads.live": 60}, at(10)) == []
+    alerts = engine.evaluate("server-1", {"jvm.threads.live": 200}, at(20))
+    assert len(alerts) == 1
+    assert "14/s" in alerts[0].message
+
+
+def test_z_score_baseline():
+    random.seed(1)
+    engine = AlertEngine([ZScoreRule("cpu", "process.cpu.usage", warmup=20)])
+    for second in range(100):
+        value = 0.2 + random.uniform(-0.02, 0.02)
+        assert (
+            engine.evaluate("server-1", {"process.cpu.usage": value}, at(second)) == []
+        )
+
+    alerts = engine.evaluate("server-1", {"process.cpu.usage": 0.9}, at(100))
+    assert len(alerts) == 1
+    assert alerts[0].rule == "cpu"
+
+
+def test_z_score_waits_for_warmup():
+    engine = AlertEngine([ZScoreRule("cpu", "process.cpu.usage", warmup=5)])
+    values = [0.2, 0.21, 0.9]
+    for second, value in enumerate(values):
+        assert (
+            engine.evaluate("server-1", {"process.cpu.usage": value}, at(second)) == []
+        )
+
+
+def test_state_is_per_server():
+    engine = AlertEngine([ThresholdRule("threads", "jvm.threads.live", above=100)])
+    assert len(engine.evaluate("server-1", {"jvm.threads.live": 150}, START)) == 1
+    assert len(engine.evaluate("server-2", {"jvm.threads.live": 150}, START)) == 1
+    engine.remove_server("server-1")
+    assert engine.get_firing() == {("server-2", "threads")}
+
+
+def test_replace_and_remove_rule():
+    engine = AlertEngine([ThresholdRule("threads", "jvm.threads.live", above=100)])
+    engine.add_rule(ThresholdRule("threads", "jvm.threads.live", above=500))
+    assert engine.evaluate("server-1", {"jvm.threads.live": 150}, START) == []
+    engine.remove_rule("threads")
+    assert engine.evaluate("server-1", {"jvm.threads.live": 1000}, START) == []
+
+
+def test_rules_on_a_series_fire_as_their_limits_are_crossed():
+    engine = AlertEngine(
+        [
+            ThresholdRule(f"threads.{limit}", "jvm.threads.live", above=limit)
+            for limit in (100, 200, 300)
+        ]
+        + [ThresholdRule("threads.low", "jvm.threads.live", below=10)]
+    )
+
+    def names(alerts):
+        return sorted((alert.rule, alert.resolved) for alert in alerts)
+
+    assert names(engine.evaluate("server-1", {"jvm.threads.live": 150}, at(0))) == [
+        ("threads.100", False)
+    ]
+    assert names(engine.evaluate("server-1", {"jvm.threads.live": 350}, at(1))) == [
+        ("threads.200", False),
+        ("threads.300", False),
+    ]
+    assert engine.evaluate("server-1", {"jvm.threads.live": 320}, at(2)) == []
+    assert names(engine.evaluate("server-1", {"jvm.threads.live": 5}, at(3))) == [
+        ("threads.100", True),
+        ("threads.200", True),
+        ("threads.300", True),
+        ("threads.low", False),
+    ]
+    assert engine.get_firing() == {("server-1", "threads.low")}
+
+
+def test_rule_added_while_its_group_fires_alerts_on_the_next_sample():
+    engine = AlertEngine([ThresholdRule("threads", "jvm.threads.live", above=100)])
+    assert len(engine.evaluate("server-1", {"jvm.threads.live": 150}, at(0))) == 1
+
+    engine.add_rule(ThresholdRule("threads.more", "jvm.threads.live", above=120))
+    assert engine.get_firing() == {("server-1", "threads")}
+    [alert] = engine.evaluate("server-1", {"jvm.threads.live": 150}, at(1))
+    assert alert.rule == "threads.more"
+    assert not alert.resolved
+
+
+def test_removing_rules_from_a_group():
+    engine = AlertEngine(
+        [
+            RateOfChangeRule("threads.fast", "jvm.threads.live", 5),
+            RateOfChangeRule("threads.faster", "jvm.threads.live", 10),
+        ]
+    )
+    engine.evaluate("server-1", {"jvm.threads.live": 0}, at(0))
+    engine.remove_rule("threads.fast")
+    [alert] = engine.evaluate("server-1", {"jvm.threads.live": 200}, at(10))
+    assert alert.rule == "threads.faster"
+
+    engine.remove_rule("threads.faster")
+    assert engine.evaluate("server-1", {"jvm.threads.live": 0}, at(20)) == []
+    assert engine.get_firing() == set()
+
+
+def test_grouped_evaluation_matches_rule_by_rule_checks():
+    random.seed(7)
+    rules = []
+    for index in range(60):
+        kind = index % 3
+        if kind == 0:
+            rules.append(
+                ThresholdRule(
+                    f"threshold.{index}",
+                    "cpu",
+                    above=random.uniform(0.4, 1.0),
+                    below=random.choice([None, random.uniform(0.0, 0.3)]),
+                )
+            )
+        elif kind == 1:
+            rules.append(
+                RateOfChangeRule(f"rate.{index}", "cpu", random.uniform(0, 0.1))
+            )
+        else:
+            rules.append(
+                ZScoreRule(f"zscore.{index}", "cpu", random.uniform(1, 3), warmup=5)
+            )
+    engine = AlertEngine(rules)
+    states = {rule.name: rule.new_state() for rule in rules}
+
+    value = 0.5
+    for second in range(200):
+        value = min(max(value + random.gauss(0, 0.1), 0.0), 1.0)
+        expected = set()
+        for rule in rules:
+            state = states[rule.name]
+            message = rule.check(state, value, at(second))
+            if (message is not None) != state.firing:
+                state.firing = message is not None
+                expected.add((rule.name, message))
+        alerts = engine.evaluate("server-1", {"cpu": value}, at(second))
+        assert {
+            (alert.rule, None if alert.resolved else alert.message) for alert in alerts
+        } == expected
+    assert engine.get_firing() == {
+        ("server-1", name) for name, state in states.items() if state.firing
+    }
+
+
+def test_rule_must_implement_check():
+    with pytest.raises(TypeError):
+        AlertRule("threads", "jvm.threads.live")
+
+
+def test_alerts_are_stored_in_json_file(tmp_path):
+    db = TinyDB(tmp_path / "history.json")
+    repo = TinyRepo[Alert](db=db, table_name="alerts", model=Alert)
+    engine = AlertEngine(
+        [ThresholdRule("threads", "jvm.threads.live", above=100)], repo=repo
+    )
+    engine.evaluate("server-1", {"jvm.threads.live": 150}, START)
+    db.close()
+
+    db = TinyDB(tmp_path / "history.json")
+    repo = TinyRepo[Alert](db=db, table_name="alerts", model=Alert)
+    [stored] = repo.get_all()
+    assert stored.rule == "threads"
+    assert stored.timestamp == START
@@ -0,0 +1,83 @@
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from src.actuator.client import ActuatorClient
+from src.actuator.containers.auditevents import AuditEvents
+from src.analytics import AuditEventStream, TimeBucketCounter
+
+START = datetime(2025, 4, 23, 10, 0, tzinfo=timezone.utc)
+
+
+def event(seconds, principal="alice", type="AUTHENTICATION_FAILURE"):
+    return {
+        "timestamp": (START + timedelta(seconds=seconds)).isoformat(),
+        "principal": principal,
+        "type": type,
+        "data": {"details": {"remoteAddress": "10.0.0.1"}},
+    }
+
+
+def events(*items):
+    return AuditEvents.model_validate({"events": list(items)})
+
+
+def test_ingest_skips_events_already_seen():
+    stream = AuditEventStream()
+    assert len(stream.ingest("s1", events(event(0), event(5), event(5, "bob")))) == 3
+    assert stream.get_after("s1") == START + timedelta(seconds=5)
+
+    # The server returns the events at the `after` timestamp again
+    new = stream.ingest("s1", events(event(5), event(5, "bob"), event(7, "carol")))
+    assert [item.principal for item in new] == ["carol"]
+    assert stream.ingest("s1", events(event(7, "carol"))) == []
+    assert stream.get_count("AUTHENTICATION_FAILURE") == 4
+
+
+def test_poll_uses_after_parameter():
+    stream = AuditEventStream()
+    stream.ingest("s1", events(event(0)))
+    response = MagicMock()
+    response.read.return_value = json.dumps({"events": [event(0), event(30)]}).encode()
+    response.__enter__.return_value = response
+    client = ActuatorClient("http://localhost:9090/actuator")
+    with patch("urllib.request.urlopen", return_value=response) as urlopen:
+        new = stream.poll("s1", client)
+
+    assert len(new) == 1
+    assert "auditevents?after=2025-04-23T10%3A00%3A00%2B00%3A00" in (
+        urlopen.call_args[0][0].full_url
+    )
+
+
+def test_find_bursts():
+    stream = AuditEventStream(bucket_seconds=60)
+    stream.ingest(
+        "s1",
+        events(
+            *[event(second, "admin") for second in range(60, 90)],
+            event(61, "alice"),
+            event(62, "alice", "AUTHENTICATION_SUCCESS"),
+        ),
+    )
+    stream.ingest("s2", events(event(10, "admin"), event(70, "admin")))
+    assert stream.find_bursts(10) == {"admin": 31}
+    assert stream.find_bursts(10, buckets=2) == {"admin": 32}
+    assert stream.get_count("AUTHENTICATION_FAILURE", "alice") == 1
+
+
+def test_counter_memory_is_bounded():
+    counter = TimeBucketCounter(bucket_seconds=60, retention=3, max_keys=2)
+    for minute in range(10):
+        counter.add(("A", "alice"), START + timedelta(minutes=minute))
+    assert list(counter.get_series(("A", "alice")).values()) == [1, 1, 1]
+
+    counter.add(("A", "bob"), START + timedelta(minutes=9))
+    counter.add(("A", "alice"), START + timedelta(minutes=8))
+    counter.add(("A", "carol"), START + timedelta(minutes=9))
+    assert counter.get_keys() == [("A", "alice"), ("A", "carol")]
+    assert counter.get_total(("A", "alice"), buckets=2) == 3
+
+    # Events older than the retained buckets are ignored
+    counter.add(("A", "alice"), START)
+    assert sum(counter.get_series(("A", "alice")).values()) == 4
@@ -0,0 +1,117 @@
+import urllib.error
+from datetime import datetime, timedelta, timezone
+
+from tinydb import TinyDB
+
+from src.actuator.client import ActuatorClient
+from src.actuator.containers.caches import Caches
+from src.actuator.containers.metrics import Metric
+from src.analytics import CacheMonitor, CacheRates, get_cache_manager_tag
+from src.tinydb.tiny_repo import TinyRepo
+
+START = datetime(2025, 4, 23, 10, 0, tzinfo=timezone.utc)
+
+CACHES = Caches.model_validate(
+    {
+        "cacheManagers": {
+            "cacheManager": {
+                "caches": {
+                    "users": {"target": "com.github.benmanes.caffeine.cache.Cache"},
+                    "plain": {"target": "java.util.concurrent.ConcurrentHashMap"},
+                }
+            },
+            "redisCacheManager": {
+                "caches": {"users": {"target": "org.springframework.data.redis"}}
+            },
+        }
+    }
+)
+
+
+class FakeClient(ActuatorClient):
+    def __init__(self):
+        super().__init__("http://localhost:9090/actuator")
+        self.values = {}
+
+    def get_metric(self, name, tags=None):
+        # Spring Boot tags cache meters with cache and cache.manager
+        assert set(tags) <= {"cache", "cache.manager", "result"}
+        key = (name, tags["cache.manager"], tags["cache"], tags.get("result"))
+        if key not in self.values:
+            raise urllib.error.HTTPError("url", 404, "Not Found", {}, None)
+        statistic = "VALUE" if name == "cache.size" else "COUNT"
+        return Metric.model_validate(
+            {
+                "name": name,
+                "measurements": [{"statistic": statistic, "value": self.values[key]}],
+            }
+        )
+
+    def set(self, hits, misses, evictions, size):
+        self.values = {
+            ("cache.gets", "cacheManager", "users", "hit"): hits,
+            ("cache.gets", "cacheManager", "users", "miss"): misses,
+            ("cache.puts", "cacheManager", "users", None): misses,
+            ("cache.evictions", "cacheManager", "users", None): evictions,
+            ("cache.size", "cacheManager", "users", None): size,
+        }
+
+
+def test_sample_joins_caches_with_metrics():
+    client = FakeClient()
+    client.set(hits=90, misses=10, evictions=0, size=10)
+    client.values[("cache.size", "redis", "users", None)] = 30
+    samples = CacheMonitor(client).sample(CACHES, START)
+
+    assert len(samples) == 2
+    sample = samples[0]
+    assert (sample.cache_manager, sample.cache) == ("cacheManager", "users")
+    assert (sample.hits, sample.misses, sample.puts, sample.size) == (90, 10, 10, 10)
+    redis = samples[1]
+    assert (redis.cache_manager, redis.cache) == ("redisCacheManager", "users")
+    assert (redis.hits, redis.size) == (None, 30)
+
+
+def test_cache_manager_tag():
+    assert get_cache_manager_tag("redisCacheManager") == "redis"
+    assert get_cache_manager_tag("caffeineCACHEMANAGER") == "caffeine"
+    assert get_cache_manager_tag("cacheManager") == "cacheManager"
+    assert get_cache_manager_tag("caches") == "caches"
+
+
+def test_hit_ratio_and_thrashing():
+    client = FakeClient()
+    monitor = CacheMonitor(client)
+    client.set(hits=90, misses=10, evictions=0, size=10)
+    assert monitor.poll(CACHES, START) == []
+
+    client.set(hits=100, misses=110, evictions=60, size=10)
+    rates = monitor.poll(CACHES, START + timedelta(seconds=10))
+    assert len(rates) == 1
+    assert rates[0].gets_rate == 11
+    assert rates[0].hit_ratio == 10 / 110
+    assert rates[0].eviction_rate == 6
+    assert monitor.find_thrashing(rates) == rates
+    assert monitor.find_thrashing(rates, min_eviction_rate=10) == []
+
+    # Counters restart with the application
+    client.set(hits=5, misses=5, evictions=0, size=5)
+    assert monitor.poll(CACHES, START + timedelta(seconds=20)) == []
+
+
+def test_rates_are_stored_in_json_file(tmp_path):
+    client = FakeClient()
+    db = TinyDB(tmp_path / "history.json")
+    repo = TinyRepo[CacheRates](db=db, table_name="caches", model=CacheRates)
+    monitor = CacheMonitor(client, repo=repo)
+    client.set(hits=90, misses=10, evictions=0, size=10)
+    monitor.poll(CACHES, START)
+    client.set(hits=100, misses=110, evictions=60, size=10)
+    monitor.poll(CACHES, START + timedelta(seconds=10))
+    db.close()
+
+    db = TinyDB(tmp_path / "history.json")
+    repo = TinyRepo[CacheRates](db=db, table_name="caches", model=CacheRates)
+    [stored] = repo.get_all()
+    assert stored.hit_ratio == 10 / 110
+    assert stored.timestamp == START + timedelta(seconds=10)
@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta, timezone
+
+from src.actuator.containers.health import HealthCheck
+from src.analytics import CertificateExpiryIndex
+
+NOW = datetime(2025, 4, 23, 11, 0, 0, tzinfo=timezone.utc)
+
+
+def certificate(subject, days, status="VALID"):
+    return {
+        "subject": subject,
+        "issuer": "CN=Example CA",
+        "serialNumber": f"{abs(days):x}",
+        "version": "V3",
+        "signatureAlgorithmName": "SHA256withRSA",
+        "validityStarts": (NOW - timedelta(days=365)).isoformat(),
+        "validityEnds": (NOW + timedelta(days=days)).isoformat(),
+        "validity": {"status": status},
+    }
+
+
+def health(*chains, invalid=()):
+    return HealthCheck.model_validate(
+        {
+            "status": "UP",
+            "components": {
+                "ssl": {
+                    "status": "UP",
+                    "details": {
+                        "validChains": [
+                            {"alias": alias, "certificates": certificates}
+                            for alias, certificates in chains
+                        ],
+                        "invalidChains": [
+                            {"alias": alias, "certificates": certificates}
+                            for alias, certificates in invalid
+                        ],
+                    },
+                }
+            },
+        }
+    )
+
+
+def test_ssl_details_parse_chains():
+    details = (
+        health(
+            (
+                "server",
+                [certificate("CN=localhost", 30), certificate("CN=Example CA", 400)],
+            )
+        )
+        .components["ssl"]
+        .details
+    )
+    chain = details.valid_chains[0]
+    assert chain.alias == "server"
+    assert chain.certificates[0].subject == "CN=localhost"
+    assert chain.certificates[0].signature_algorithm_name == "SHA256withRSA"
+    assert chain.certificates[0].validity.status == "VALID"
+    assert chain.certificates[0].get_days_to_expiry(NOW) == 30
+    assert chain.get_expiry() == NOW + timedelta(days=30)
+
+
+def test_soonest_expiring_across_servers():
+    index = CertificateExpiryIndex()
+    index.update("server-1", health(("server", [certificate("CN=one", 90)])))
+    index.update(
+        "server-2",
+        health(
+            ("server", [certificate("CN=two", 10)]),
+            invalid=[("old", [certificate("CN=expired", -3, "EXPIRED")])],
+        ),
+    )
+    index.update("server-3", health(("server", [certificate("CN=three", 45)])))
+
+    soonest = index.get_soonest(3)
+    assert [entry.subject for entry in soonest] == ["CN=expired", "CN=two", "CN=three"]
+    assert soonest[0].status == "EXPIRED"
+    assert soonest[0].get_days_to_expiry(NOW) == -3
+    assert len(index) == 4
+
+    expiring = index.get_expiring_before(NOW + timedelta(days=30))
+    assert [entry.server_id for entry in expiring] == ["server-2", "server-2"]
+
+
+def test_update_replaces_server_certificates():
+    index = CertificateExpiryIndex()
+    index.update("server-1", health(("server", [certificate("CN=one", 5)])))
+    index.update("server-1", health(("server", [certificate("CN=one", 365)])))
+    assert len(index) == 1
+    assert index.get_soonest()[0].get_days_to_expiry(NOW) == 365
+
+    index.update("server-1", HealthCheck.model_validate({"status": "UP"}))
+    assert len(index) == 0
+    assert index.get_server_certificates("server-1") == []
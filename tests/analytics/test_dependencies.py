@@ -0,0 +1,56 @@
+from src.analytics import DependencyUsage, FleetDependencyIndex
+
+LOG4J = "org.apache.logging.log4j"
+
+
+def test_find_vulnerable_versions(make_sbom):
+    index = FleetDependencyIndex()
+    index.update("orders-1", make_sbom("2.14.1"))
+    index.update("orders-2", make_sbom("2.17.1"))
+    index.update("billing-1", make_sbom("2.16.0"))
+
+    assert index.find("log4j-core", LOG4J, below="2.17.0") == [
+        DependencyUsage("billing-1", f"{LOG4J}:log4j-core", "2.16.0"),
+        DependencyUsage("orders-1", f"{LOG4J}:log4j-core", "2.14.1"),
+    ]
+    assert [
+        usage.server_id for usage in index.find("log4j-core", LOG4J, at_least="2.17")
+    ] == ["orders-2"]
+    assert index.get_versions("log4j-core", LOG4J) == {
+        "2.14.1": ["orders-1"],
+        "2.16.0": ["billing-1"],
+        "2.17.1": ["orders-2"],
+    }
+    # Without a group, every group matches
+    assert [usage.server_id for usage in index.find("log4j-core")] == [
+        "billing-1",
+        "orders-1",
+        "orders-2",
+    ]
+
+
+def test_find_by_name_across_groups(make_sbom):
+    index = FleetDependencyIndex()
+    index.update("orders-1", make_sbom("2.14.1"))
+    index.update("orders-2", make_sbom("2.14.1", log4j_group="org.example.shaded"))
+
+    assert [usage.key for usage in index.find("log4j-core", below="2.17")] == [
+        f"{LOG4J}:log4j-core",
+        "org.example.shaded:log4j-core",
+    ]
+    assert index.get_versions("log4j-core") == {"2.14.1": ["orders-1", "orders-2"]}
+    assert len(index.find("log4j-core", LOG4J)) == 1
+
+    index.remove("orders-2")
+    assert [usage.server_id for usage in index.find("log4j-core")] == ["orders-1"]
+
+
+def test_update_and_remove(make_sbom):
+    index = FleetDependencyIndex()
+    index.update("orders-1", make_sbom("2.14.1"))
+    index.update("orders-1", make_sbom("2.17.1"))
+    assert index.find("log4j-core", LOG4J, below="2.17.0") == []
+    assert f"{LOG4J}:log4j-api" in index.get_keys()
+
+    index.remove("orders-1")
+    assert index.get_keys() == []
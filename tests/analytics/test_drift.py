@@ -0,0 +1,114 @@
+from src.actuator.containers.env import Env
+from src.actuator.containers.info import Info
+from src.analytics import DriftEngine, fingerprint_snapshot
+
+
+def make_env(pool_size="10", pid="1234", profiles=("prod",)):
+    return Env.model_validate(
+        {
+            "activeProfiles": list(profiles),
+            "propertySources": [
+                {
+                    "name": "systemProperties",
+                    "properties": {"PID": {"value": pid}},
+                },
+                {
+                    "name": "applicationConfig",
+                    "properties": {
+                        "spring.datasource.hikari.maximum-pool-size": {
+                            "value": pool_size
+                        },
+                        "server.port": {"value": 8080},
+                    },
+                },
+            ],
+        }
+    )
+
+
+def make_info(version="1.0.0", commit="abc"):
+    return Info.model_validate(
+        {
+            "build": {
+                "artifact": "demo",
+                "name": "demo",
+                "time": "2025-04-23T10:00:00Z",
+                "version": version,
+            },
+            "git": {
+                "branch": "main",
+                "commit": {
+                    "time": "2025-04-23T09:00:00Z",
+                    "message": {"full": "msg", "short": "msg"},
+                    "id": {"abbrev": commit[:3], "full": commit},
+                    "user": {"name": "dev"},
+                },
+            },
+        }
+    )
+
+
+def test_fingerprint_keys_and_ignored_keys():
+    fingerprint = fingerprint_snapshot(make_env(), make_info())
+    assert fingerprint.values == {
+        "profiles:active": "prod",
+        "env:spring.datasource.hikari.maximumpoolsize": "10",
+        "env:server.port": "8080",
+        "info:build.version": "1.0.0",
+        "info:git.commit.id": "abc",
+    }
+    assert set(fingerprint.digests) == set(fingerprint.values)
+
+    # The PID differs between instances and does not change the fingerprint
+    assert fingerprint_snapshot(make_env(pid="999"), make_info()).digest == (
+        fingerprint.digest
+    )
+    assert (
+        "env:pid" in fingerprint_snapshot(make_env(), ignore=lambda key: False).values
+    )
+
+
+def test_drift_report_groups_identical_servers():
+    engine = DriftEngine()
+    for server_id in ["pod-1", "pod-2", "pod-3"]:
+        engine.update(server_id, fingerprint_snapshot(make_env(), make_info()))
+    engine.update(
+        "pod-4", fingerprint_snapshot(make_env(pool_size="50"), make_info(commit="def"))
+    )
+    engine.update("pod-5", fingerprint_snapshot(make_env(profiles=()), make_info()))
+
+    report = engine.get_report()
+    assert not report.is_consistent()
+    assert report.groups[0] == ["pod-1", "pod-2", "pod-3"]
+    assert sorted(report.groups[1:]) == [["pod-4"], ["pod-5"]]
+    assert report.differing_keys == {
+        "env:spring.datasource.hikari.maximumpoolsize": {
+            "10": ["pod-1", "pod-2", "pod-3", "pod-5"],
+            "50": ["pod-4"],
+        },
+        "info:git.commit.id": {
+            "abc": ["pod-1", "pod-2", "pod-3", "pod-5"],
+            "def": ["pod-4"],
+        },
+        "profiles:active": {
+            "prod": ["pod-1", "pod-2", "pod-3", "pod-4"],
+            "": ["pod-5"],
+        },
+    }
+
+    subset = engine.get_report(["pod-1", "pod-2", "unknown"])
+    assert subset.is_consistent()
+    assert subset.differing_keys == {}
+
+
+def test_missing_keys_are_reported_as_none():
+    engine = DriftEngine()
+    engine.update("a", fingerprint_snapshot(make_env(), make_info()))
+    engine.update("b", fingerprint_snapshot(make_env()))
+
+    report = engine.get_report()
+    assert report.differing_keys["info:build.version"] == {"1.0.0": ["a"], None: ["b"]}
+
+    engine.remove("b")
+    assert engine.get_report().is_consistent()
+    assert DriftEngine().get_report().groups == []
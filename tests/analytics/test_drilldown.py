@@ -0,0 +1,104 @@
+import urllib.error
+from datetime import datetime, timezone
+
+import pytest
+from tinydb import TinyDB
+
+from src.actuator.client import ActuatorClient
+from src.actuator.containers.metrics import Metric
+from src.analytics import LabelledSample, MetricDrillDown, series_key
+from src.tinydb.tiny_repo import TinyRepo
+
+HTTP_REQUESTS = Metric.model_validate(
+    {
+        "name": "http.server.requests",
+        "baseUnit": "seconds",
+        "measurements": [{"statistic": "COUNT", "value": 30}],
+        "availableTags": [
+            {"tag": "uri", "values": ["/api/info", "/actuator/health", "/missing"]},
+            {"tag": "status", "values": ["200", "404"]},
+        ],
+    }
+)
+
+
+class FakeClient(ActuatorClient):
+    def __init__(self, counts, error_code=404):
+        super().__init__("http://localhost:9090/actuator")
+        self.counts = counts
+        self.error_code = error_code
+        self.requests = []
+
+    def get_metric(self, name, tags=None):
+        self.requests.append(tags)
+        key = tuple(sorted(tags.items()))
+        if key not in self.counts:
+            raise urllib.error.HTTPError("url", self.error_code, "Not Found", {}, None)
+        return Metric.model_validate(
+            {
+                "name": name,
+                "measurements": [{"statistic": "COUNT", "value": self.counts[key]}],
+            }
+        )
+
+
+def test_series_key():
+    assert series_key("jvm.gc.pause", {}) == "jvm.gc.pause"
+    assert (
+        series_key("http.server.requests", {"uri": "/a", "status": "200"})
+        == "http.server.requests{status=200,uri=/a}"
+    )
+
+
+def test_expand_respects_cardinality_limit():
+    drill_down = MetricDrillDown(FakeClient({}), max_combinations=4)
+    assert drill_down.expand(HTTP_REQUESTS, ["uri"]) == [
+        {"uri": "/api/info"},
+        {"uri": "/actuator/health"},
+        {"uri": "/missing"},
+    ]
+    combinations = drill_down.expand(HTTP_REQUESTS, ["uri", "status", "unknown"])
+    assert len(combinations) == 4
+    assert combinations[0] == {"uri": "/api/info", "status": "200"}
+    assert drill_down.expand(HTTP_REQUESTS, ["unknown"]) == []
+
+
+def test_drill_down_fetches_each_combination():
+    client = FakeClient(
+        {(("uri", "/api/info"),): 20, (("uri", "/actuator/health"),): 10}
+    )
+    drill_down = MetricDrillDown(client, max_workers=2)
+    timestamp = datetime(2025, 4, 23, tzinfo=timezone.utc)
+
+    samples = drill_down.drill_down(HTTP_REQUESTS, ["uri"], timestamp)
+
+    assert len(client.requests) == 3
+    assert [sample.series for sample in samples] == [
+        "http.server.requests{uri=/api/info}",
+        "http.server.requests{uri=/actuator/health}",
+    ]
+    assert samples[0].tags == {"uri": "/api/info"}
+    assert samples[0].measurements == {"COUNT": 20}
+    assert samples[0].timestamp == timestamp
+
+
+def test_drill_down_propagates_server_errors():
+    drill_down = MetricDrillDown(FakeClient({}, error_code=500))
+    with pytest.raises(urllib.error.HTTPError):
+        drill_down.drill_down(HTTP_REQUESTS, ["uri"])
+
+
+def test_drill_down_samples_are_stored_in_json_file(tmp_path):
+    client = FakeClient({(("uri", "/api/info"),): 20})
+    timestamp = datetime(2025, 4, 23, tzinfo=timezone.utc)
+    db = TinyDB(tmp_path / "history.json")
+    repo = TinyRepo[LabelledSample](db=db, table_name="labelled", model=LabelledSample)
+    MetricDrillDown(client, repo=repo).drill_down(HTTP_REQUESTS, ["uri"], timestamp)
+    db.close()
+
+    db = TinyDB(tmp_path / "history.json")
+    repo = TinyRepo[LabelledSample](db=db, table_name="labelled", model=LabelledSample)
+    [stored] = repo.get_all()
+    assert stored.series == "http.server.requests{uri=/api/info}"
+    assert stored.measurements == {"COUNT": 20}
+    assert stored.timestamp == timestamp
@@ -0,0 +1,64 @@
+from src.actuator.containers.health import HealthCheck
+from src.analytics import FleetHealth, get_worst_status
+
+
+def health(status, **components):
+    return HealthCheck.model_validate(
+        {
+            "status": status,
+            "components": {
+                name: {"status": component_status}
+                for name, component_status in components.items()
+            },
+        }
+    )
+
+
+def test_counts_follow_updates():
+    fleet = FleetHealth()
+    assert fleet.get_overall_status() is None
+
+    assert fleet.update("server-1", health("UP", db="UP", ping="UP"))
+    assert fleet.update("server-2", health("UP", db="UP", ping="UP"))
+    assert fleet.update("server-3", health("DOWN", db="DOWN", ping="UP"))
+    assert fleet.get_status_counts() == {"UP": 2, "DOWN": 1}
+    assert fleet.get_component_status_counts() == {
+        "db": {"UP": 2, "DOWN": 1},
+        "ping": {"UP": 3},
+    }
+    assert fleet.get_overall_status() == "DOWN"
+    assert fleet.get_servers("DOWN") == ["server-3"]
+
+    assert fleet.update("server-3", health("UP", db="UP", ping="UP"))
+    assert fleet.get_status_counts() == {"UP": 3}
+    assert fleet.get_component_status_counts()["db"] == {"UP": 3}
+    assert fleet.get_overall_status() == "UP"
+
+
+def test_unchanged_health_is_not_a_change():
+    fleet = FleetHealth()
+    assert fleet.update("server-1", health("UP", ping="UP"))
+    assert not fleet.update("server-1", health("UP", ping="UP"))
+    assert fleet.get_status_counts() == {"UP": 1}
+
+
+def test_unreachable_and_remove():
+    fleet = FleetHealth()
+    fleet.update("server-1", health("UP", ping="UP"))
+    fleet.update("server-2", health("OUT_OF_SERVICE", ping="UP"))
+    assert fleet.mark_unreachable("server-1")
+    assert not fleet.mark_unreachable("server-1")
+    assert fleet.get_status("server-1") == "UNREACHABLE"
+    assert fleet.get_component_status_counts() == {"ping": {"UP": 1}}
+    assert fleet.get_overall_status() == "UNREACHABLE"
+
+    fleet.remove("server-1")
+    assert fleet.get_status("server-1") is None
+    assert fleet.get_overall_status() == "OUT_OF_SERVICE"
+
+
+def test_worst_status():
+    assert get_worst_status({"UP", "UNKNOWN"}) == "UP"
+    assert get_worst_status({"UP", "DOWN"}) == "DOWN"
+    assert get_worst_status({"DEGRADED"}) == "DEGRADED"
+    assert get_worst_status(set()) is None
@@ -0,0 +1,133 @@
+from src.actuator.containers.httpexchanges import HttpExchanges
+from src.analytics import HttpLatencyAnalytics, LatencyHistogram, LatencyKey
+
+
+def make_exchange(timestamp, uri, time_taken, method="GET", status=200):
+    return {
+        "timestamp": timestamp,
+        "request": {"uri": uri, "method": method, "headers": {}},
+        "response": {"status": status, "headers": {}},
+        "timeTaken": time_taken,
+    }
+
+
+def test_histogram_quantiles_within_relative_accuracy():
+    histogram = LatencyHistogram(relative_accuracy=0.01)
+    values = [i / 1000 for i in range(1, 1001)]  # 1 ms .. 1 s
+    for value in values:
+        histogram.add(value)
+
+    assert histogram.count == 1000
+    assert histogram.min == 0.001
+    assert histogram.max == 1.0
+    assert abs(histogram.get_mean() - 0.5005) < 1e-9
+    for quantile, expected in [(0.5, 0.5), (0.95, 0.95), (0.99, 0.99)]:
+        estimate = histogram.get_quantile(quantile)
+        assert abs(estimate - expected) / expected <= 0.02
+    assert histogram.get_quantile(0) == 0.001
+    assert histogram.get_quantile(1) == 1.0
+
+
+def test_histogram_memory_is_bounded():
+    histogram = LatencyHistogram(relative_accuracy=0.01)
+    for i in range(100_000):
+        histogram.add((i % 5000) / 1000)
+    assert len(histogram._buckets) <= histogram._max_index + 1
+    assert LatencyHistogram().get_quantile(0.5) is None
+
+
+def test_histogram_merge():
+    first = LatencyHistogram()
+    second = LatencyHistogram()
+    first.add(0.1)
+    second.add(0.3)
+    first.merge(second)
+    assert first.count == 2
+    assert first.min == 0.1
+    assert first.max == 0.3
+
+
+def test_ingest_groups_by_uri_method_status():
+    exchanges = HttpExchanges.model_validate(
+        {
+            "exchanges": [
+                make_exchange(
+                    "2025-04-23T11:00:15Z",
+                    "http://localhost:9090/actuator/health?x=1",
+                    "PT0.01S",
+                ),
+                make_exchange(
+                    "2025-04-23T11:00:16Z",
+                    "http://localhost:9090/actuator/health",
+                    "PT0.03S",
+                ),
+                make_exchange(
+                    "2025-04-23T11:00:17Z",
+                    "http://localhost:9090/actuator/nope",
+                    "PT0.002S",
+                    status=404,
+                ),
+            ]
+        }
+    )
+
+    analytics = HttpLatencyAnalytics()
+    assert analytics.ingest(exchanges.exchanges) == 3
+
+    health = LatencyKey("/actuator/health", "GET", 200)
+    assert set(analytics.get_keys()) == {
+        health,
+        LatencyKey("/actuator/nope", "GET", 404),
+    }
+    summaries = analytics.get_summaries()
+    assert summaries[health].count == 2
+    assert summaries[health].max == 0.03
+    assert abs(summaries[health].mean - 0.02) < 1e-9
+
+    percentiles = analytics.get_percentiles(health, (50, 100))
+    assert abs(percentiles[50] - 0.01) / 0.01 <= 0.02
+    assert percentiles[100] == 0.03
+    assert analytics.get_percentiles(LatencyKey("/missing", "GET", 200)) == {}
+
+
+def test_ingest_skips_already_seen_exchanges():
+    first_poll = [
+        make_exchange("2025-04-23T11:00:15Z", "http://h/a", "PT0.01S"),
+        make_exchange("2025-04-23T11:00:16Z", "http://h/b", "PT0.01S"),
+    ]
+    second_poll = first_poll + [
+        make_exchange("2025-04-23T11:00:16Z", "http://h/c", "PT0.01S"),
+        make_exchange("2025-04-23T11:00:17Z", "http://h/a", "PT0.01S"),
+    ]
+
+    analytics = HttpLatencyAnalytics()
+    assert (
+        analytics.ingest(
+            HttpExchanges.model_validate({"exchanges": first_poll}).exchanges
+        )
+        == 2
+    )
+    assert (
+        analytics.ingest(
+            HttpExchanges.model_validate({"exchanges": second_poll}).exchanges
+        )
+        == 2
+    )
+    assert analytics.get_summaries()[LatencyKey("/a", "GET", 200)].count == 2
+
+    analytics.reset()
+    assert analytics.get_keys() == []
+
+
+def test_max_series_overflow():
+    analytics = HttpLatencyAnalytics(max_series=2, uri_mapper=lambda uri: uri)
+    for uri in ["/a", "/b", "/c", "/d"]:
+        analytics.record(uri, "GET", 200, 0.01)
+
+    keys = set(analytics.get_keys())
+    assert keys == {
+        LatencyKey("/a", "GET", 200),
+        LatencyKey("/b", "GET", 200),
+        LatencyKey("OTHER", "GET", 200),
+    }
+    assert analytics.get_summaries()[LatencyKey("OTHER", "GET", 200)].count == 2
@@ -0,0 +1,131 @@
+import http.client
+import json
+import urllib.error
+from unittest.mock import MagicMock, patch
+
+from src.actuator.client import ActuatorClient
+from src.actuator.containers.loggers import Loggers
+from src.analytics import FleetLoggerLevels
+
+
+def urlopen(request, timeout=None):
+    if "server-2" in request.full_url:
+        raise urllib.error.URLError("connection refused")
+    response = MagicMock()
+    response.read.return_value = b""
+    response.__enter__.return_value = response
+    return response
+
+
+CLIENTS = {
+    server_id: ActuatorClient(f"http://{server_id}:8080/actuator")
+    for server_id in ("server-1", "server-2", "server-3")
+}
+
+SNAPSHOTS = {
+    "server-3": Loggers.model_validate(
+        {
+            "loggers": {
+                "com.example": {"effectiveLevel": "INFO"},
+                "com.example.web": {
+                    "configuredLevel": "WARN",
+                    "effectiveLevel": "WARN",
+                },
+            }
+        }
+    )
+}
+
+
+def test_set_level_across_fleet():
+    with patch("urllib.request.urlopen", side_effect=urlopen) as mock_urlopen:
+        changes = FleetLoggerLevels().set_level(
+            CLIENTS, "com.example", "DEBUG", SNAPSHOTS, cascade=True
+        )
+
+    assert [(change.server_id, change.logger) for change in changes] == [
+        ("server-1", "com.example"),
+        ("server-2", "com.example"),
+        ("server-3", "com.example"),
+        ("server-3", "com.example.web"),
+    ]
+    requests = [call[0][0] for call in mock_urlopen.call_args_list]
+    assert all(request.get_method() == "POST" for request in requests)
+    assert all(
+        json.loads(request.data) == {"configuredLevel": "DEBUG"} for request in requests
+    )
+    assert "http://server-3:8080/actuator/loggers/com.example.web" in {
+        request.full_url for request in requests
+    }
+
+    failures = FleetLoggerLevels().get_failures(changes)
+    assert list(failures) == ["server-2"]
+    assert "connection refused" in failures["server-2"][0].error
+
+
+def test_broken_responses_fail_only_their_server():
+    def broken_urlopen(request, timeout=None):
+        response = MagicMock()
+        response.__enter__.return_value = response
+        if "server-1" in request.full_url:
+            response.read.side_effect = http.client.IncompleteRead(b"{")
+        elif "server-2" in request.full_url:
+            response.read.return_value = b"<html>"
+        else:
+            response.read.return_value = b""
+        return response
+
+    with patch("urllib.request.urlopen", side_effect=broken_urlopen):
+        changes = FleetLoggerLevels().set_level(CLIENTS, "com.example", "DEBUG")
+
+    assert [change.is_successful() for change in changes] == [False, False, True]
+    assert list(FleetLoggerLevels().get_failures(changes)) == ["server-1", "server-2"]
+
+
+def test_set_level_keeps_descendants_unless_cascading():
+    with patch("urllib.request.urlopen", side_effect=urlopen):
+        changes = FleetLoggerLevels().set_level(
+            CLIENTS, "com.example", "DEBUG", SNAPSHOTS
+        )
+    assert [(change.server_id, change.logger) for change in changes] == [
+        ("server-1", "com.example"),
+        ("server-2", "com.example"),
+        ("server-3", "com.example"),
+    ]
+
+
+def test_restore_previous_levels():
+    levels = FleetLoggerLevels()
+    with patch("urllib.request.urlopen", side_effect=urlopen):
+        changes = levels.set_level(
+            CLIENTS, "com.example", "DEBUG", SNAPSHOTS, cascade=True
+        )
+    assert [
+        (change.logger, change.previous_level, change.previous_known)
+        for change in changes
+    ] == [
+        ("com.example", None, False),
+        ("com.example", None, False),
+        ("com.example", None, True),
+        ("com.example.web", "WARN", True),
+    ]
+
+    with patch("urllib.request.urlopen", side_effect=urlopen) as mock_urlopen:
+        restored = levels.restore(CLIENTS, changes)
+
+    # Only server-3 had a snapshot to read the previous levels from
+    assert [(change.logger, change.level) for change in restored] == [
+        ("com.example", None),
+        ("com.example.web", "WARN"),
+    ]
+    assert all(change.is_successful() for change in restored)
+    requests = {
+        call[0][0].full_url: json.loads(call[0][0].data)
+        for call in mock_urlopen.call_args_list
+    }
+    assert requests == {
+        "http://server-3:8080/actuator/loggers/com.example": {"configuredLevel": None},
+        "http://server-3:8080/actuator/loggers/com.example.web": {
+            "configuredLevel": "WARN"
+        },
+    }
@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta, timezone
+
+from tinydb import TinyDB
+from tinydb.storages import MemoryStorage
+
+from src.actuator.containers.metrics import Metric
+from src.analytics import DerivedSample, RateDeriver
+from src.tinydb.tiny_repo import TinyRepo
+
+START = datetime(2025, 4, 23, 11, 0, 0, tzinfo=timezone.utc)
+
+
+def http_requests(count, total_time, max_time=0.1):
+    return Metric.model_validate(
+        {
+            "name": "http.server.requests",
+            "description": "",
+            "baseUnit": "seconds",
+            "measurements": [
+                {"statistic": "COUNT", "value": count},
+                {"statistic": "TOTAL_TIME", "value": total_time},
+                {"statistic": "MAX", "value": max_time},
+            ],
+        }
+    )
+
+
+def by_series(samples):
+    return {sample.series: sample.value for sample in samples}
+
+
+def test_rates_and_interval_mean():
+    deriver = RateDeriver()
+    assert deriver.update(http_requests(100, 5.0), START) == []
+
+    samples = deriver.update(http_requests(160, 6.2), START + timedelta(seconds=10))
+    values = by_series(samples)
+    assert set(values) == {"count_rate", "total_time_rate", "mean"}
+    assert values["count_rate"] == 6.0
+    assert abs(values["total_time_rate"] - 0.12) < 1e-9
+    assert abs(values["mean"] - 0.02) < 1e-9
+    assert all(sample.interval == 10 for sample in samples)
+    assert all(sample.metric == "http.server.requests" for sample in samples)
+
+
+def test_no_mean_without_new_events():
+    deriver = RateDeriver()
+    deriver.update(http_requests(100, 5.0), START)
+    values = by_series(
+        deriver.update(http_requests(100, 5.0), START + timedelta(seconds=5))
+    )
+    assert values == {"count_rate": 0.0, "total_time_rate": 0.0}
+
+
+def test_gauges_are_ignored():
+    gauge = Metric.model_validate(
+        {
+            "name": "jvm.memory.used",
+            "description": "",
+            "measurements": [{"statistic": "VALUE", "value": 1024}],
+        }
+    )
+    deriver = RateDeriver()
+    assert deriver.update(gauge, START) == []
+    assert deriver.update(gauge, START + timedelta(seconds=5)) == []
+
+
+def test_counter_going_backwards_resets_baseline():
+    deriver = RateDeriver()
+    deriver.update(http_requests(100, 5.0), START)
+    assert deriver.update(http_requests(3, 0.1), START + timedelta(seconds=10)) == []
+
+    values = by_series(
+        deriver.update(http_requests(13, 0.3), START + timedelta(seconds=20))
+    )
+    assert values["count_rate"] == 1.0
+
+
+def test_process_restart_resets_every_series():
+    deriver = RateDeriver()
+    assert deriver.update_process_start_time(1745403822.543) is False
+    deriver.update(http_requests(100, 5.0), START)
+    deriver.update(
+        http_requests(10, 1.0), START, series_key="http.server.requests;uri=/a"
+    )
+
+    assert deriver.update_process_start_time(1745409999.0) is True
+    # Higher values than before, but from a new JVM: must not produce a rate
+    assert deriver.update(http_requests(200, 9.0), START + timedelta(seconds=10)) == []
+    assert deriver.update_process_start_time(1745409999.0) is False
+
+
+def test_series_keys_are_independent():
+    deriver = RateDeriver()
+    deriver.update(http_requests(10, 1.0), START, series_key="uri=/a")
+    deriver.update(http_requests(50, 1.0), START, series_key="uri=/b")
+
+    samples = deriver.update(
+        http_requests(20, 1.0), START + timedelta(seconds=10), series_key="uri=/a"
+    )
+    assert by_series(samples)["count_rate"] == 1.0
+    assert samples[0].metric == "uri=/a"
+
+
+def test_derived_samples_are_stored_in_history():
+    repo = TinyRepo[DerivedSample](
+        db=TinyDB(storage=MemoryStorage), table_name="derived", model=DerivedSample
+    )
+    deriver = RateDeriver(repo=repo)
+    deriver.update(http_requests(100, 5.0), START)
+    deriver.update(http_requests(160, 6.2), START + timedelta(seconds=10))
+
+    stored = repo.get_all()
+    assert len(stored) == 3
+    assert {sample.series for sample in stored} == {
+        "count_rate",
+        "total_time_rate",
+        "mean",
+    }
+
+
+def test_derived_samples_are_stored_in_json_file(tmp_path):
+    db = TinyDB(tmp_path / "history.json")
+    repo = TinyRepo[DerivedSample](db=db, table_name="derived", model=DerivedSample)
+    deriver = RateDeriver(repo=repo)
+    deriver.update(http_requests(100, 5.0), START)
+    deriver.update(http_requests(160, 6.2), START + timedelta(seconds=10))
+    db.close()
+
+    db = TinyDB(tmp_path / "history.json")
+    repo = TinyRepo[DerivedSample](db=db, table_name="derived", model=DerivedSample)
+    stored = repo.get_all()
+    assert len(stored) == 3
+    assert {sample.timestamp for sample in stored} == {START + timedelta(seconds=10)}
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+
+from src.actuator.containers.scheduledtasks import ScheduledTasks
+from src.analytics import LabelledSample, ScheduledTaskMonitor, execution_counts
+
+TARGET = "com.example.Jobs.refresh"
+START = datetime(2025, 4, 23, 10, 0, tzinfo=timezone.utc)
+
+
+def tasks(last, next_time, status="SUCCESS"):
+    task = {"runnable": {"target": TARGET}, "initialDelay": 0, "interval": 10000}
+    if last is not None:
+        task["lastExecution"] = {"time": last.isoformat(), "status": status}
+    if next_time is not None:
+        task["nextExecution"] = {"time": next_time.isoformat()}
+    return ScheduledTasks.model_validate({"fixedRate": [task]})
+
+
+def at(seconds):
+    return START + timedelta(seconds=seconds)
+
+
+def test_records_history_in_ring_buffer():
+    monitor = ScheduledTaskMonitor(history_size=3)
+    for run in range(5):
+        alerts = monitor.update(
+            "s1", tasks(at(run * 10), at(run * 10 + 10)), at(run * 10 + 1)
+        )
+        assert alerts == []
+
+    history = monitor.get_history("s1", TARGET)
+    assert [record.time for record in history] == [at(20), at(30), at(40)]
+    assert all(record.delay == 0 for record in history)
+    summary = monitor.get_summaries()[0]
+    assert (summary.task_type, summary.runs, summary.missed) == ("fixedRate", 5, 0)
+
+
+def test_late_and_failed_runs():
+    monitor = ScheduledTaskMonitor()
+    monitor.update("s1", tasks(at(0), at(10)), at(1))
+    alerts = monitor.update("s1", tasks(at(15), at(25), "ERROR"), at(16))
+    assert sorted(alert.kind for alert in alerts) == ["failed", "late"]
+    assert monitor.get_history("s1", TARGET)[-1].delay == 5
+
+
+def test_late_fixed_rate_run_is_measured_from_the_interval():
+    monitor = ScheduledTaskMonitor()
+    monitor.update("s1", tasks(at(0), at(10)), at(1), {TARGET: 1})
+
+    # 4s late: the next run is announced 6s after the last one, but the
+    # period is still the 10s interval, so no slot was skipped
+    alerts = monitor.update("s1", tasks(at(14), at(20)), at(15), {TARGET: 2})
+    assert [alert.kind for alert in alerts] == ["late"]
+    assert monitor.get_history("s1", TARGET)[-1].delay == 4
+
+    # 17s after the expected run: one run happened on time, the last is 7s late
+    alerts = monitor.update("s1", tasks(at(37), at(40)), at(38), {TARGET: 4})
+    assert [alert.kind for alert in alerts] == ["late"]
+    assert monitor.get_history("s1", TARGET)[-1].delay == 7
+
+
+def test_overrun_and_missed_runs():
+    monitor = ScheduledTaskMonitor()
+    monitor.update("s1", tasks(at(0), at(10)), at(1))
+
+    # The next run is overdue and still announced: the previous run overruns
+    alerts = monitor.update("s1", tasks(at(0), at(10)), at(15))
+    assert [alert.kind for alert in alerts] == ["overrun"]
+    assert monitor.update("s1", tasks(at(0), at(10)), at(16)) == []
+
+    # The scheduler moved on without running the task
+    monitor = ScheduledTaskMonitor()
+    monitor.update("s1", tasks(at(0), at(10)), at(1))
+    alerts = monitor.update("s1", tasks(at(0), at(20)), at(15))
+    assert [alert.kind for alert in alerts] == ["missed"]
+
+
+def test_skipped_runs_from_execution_counts():
+    monitor = ScheduledTaskMonitor()
+    monitor.update("s1", tasks(at(0), at(10)), at(1), {TARGET: 10})
+
+    # Polled every 30s, three runs are expected but only two happened
+    alerts = monitor.update("s1", tasks(at(30), at(40)), at(31), {TARGET: 12})
+    assert [alert.kind for alert in alerts] == ["missed"]
+    assert monitor.get_summaries("s1")[0].missed == 1
+
+    assert monitor.update("s1", tasks(at(60), at(70)), at(61), {TARGET: 15}) == []
+    monitor.remove_server("s1")
+    assert monitor.get_summaries() == []
+
+
+def test_execution_counts():
+    samples = [
+        LabelledSample(
+            metric="tasks.scheduled.execution",
+            series=outcome,
+            tags={
+                "code.namespace": "com.example.Jobs",
+                "code.function": "refresh",
+                "outcome": outcome,
+            },
+            measurements={"COUNT": count, "TOTAL_TIME": 1.0},
+            timestamp=START,
+        )
+        for outcome, count in (("SUCCESS", 8.0), ("ERROR", 2.0))
+    ]
+    assert execution_counts(samples) == {TARGET: 10.0}
@@ -0,0 +1,155 @@
+from src.actuator.containers.beans import Beans
+from src.actuator.containers.conditions import Conditions
+from src.actuator.containers.env import Env
+from src.analytics import BackgroundSearchIndex, SearchDocument, build_search_index
+from src.analytics.search import tokenize
+
+BEANS = Beans.model_validate(
+    {
+        "contexts": {
+            "app": {
+                "beans": {
+                    "dataSource": {
+                        "scope": "singleton",
+                        "type": "com.zaxxer.hikari.HikariDataSource",
+                        "aliases": ["primaryDataSource"],
+                    },
+                    "jdbcTemplate": {
+                        "scope": "singleton",
+                        "type": "org.springframework.jdbc.core.JdbcTemplate",
+                    },
+                }
+            }
+        }
+    }
+)
+
+CONDITIONS = Conditions.model_validate(
+    {
+        "contexts": {
+            "app": {
+                "positiveMatches": {
+                    "DataSourceAutoConfiguration": [
+                        {
+                            "condition": "OnClassCondition",
+                            "message": "@ConditionalOnClass found required class 'javax.sql.DataSource'",
+                        }
+                    ]
+                },
+                "negativeMatches": {
+                    "RedisAutoConfiguration": [
+                        {
+                            "condition": "OnClassCondition",
+                            "message": "did not find required class 'org.springframework.data.redis.core.RedisOperations'",
+                        }
+                    ]
+                },
+                "unconditionalClasses": [],
+            }
+        }
+    }
+)
+
+ENV = Env.model_validate(
+    {
+        "activeProfiles": [],
+        "propertySources": [
+            {
+                "name": "systemEnvironment",
+                "properties": {"SERVER_PORT": {"value": "8081"}},
+            },
+            {
+                "name": "applicationConfig",
+                "properties": {
+                    "server.port": {"value": 8080},
+                    "spring.datasource.url": {"value": "jdbc:h2:mem:test"},
+                },
+            },
+        ],
+    }
+)
+
+CONFIGPROPS = {
+    "contexts": {
+        "app": {
+            "beans": {
+                "spring.datasource-DataSourceProperties": {
+                    "prefix": "spring.datasource",
+                    "properties": {
+                        "url": "jdbc:h2:mem:test",
+                        "hikari": {"maxPoolSize": 10},
+                    },
+                    "inputs": {},
+                }
+            }
+        }
+    }
+}
+
+
+def test_tokenize_splits_camel_case_and_punctuation():
+    assert tokenize("spring.datasource.hikari") == {"spring", "datasource", "hikari"}
+    assert tokenize("HikariDataSource") == {
+        "hikaridatasource",
+        "hikari",
+        "data",
+        "source",
+    }
+    assert tokenize("SERVER_PORT") == {"server", "port"}
+
+
+def test_search_across_endpoint_trees():
+    index = build_search_index(BEANS, CONDITIONS, ENV, CONFIGPROPS)
+    assert len(index) == 2 + 2 + 3 + 2
+
+    results = index.search("datasource", limit=None)
+    kinds = {document.kind for document in results}
+    assert kinds == {"bean", "condition", "property", "configprops"}
+    assert results[0] == SearchDocument(
+        "bean", "dataSource", "app", "com.zaxxer.hikari.HikariDataSource"
+    )
+
+    assert [document.key for document in index.search("redis")] == [
+        "RedisAutoConfiguration"
+    ]
+    assert [document.key for document in index.search("server port")] == [
+        "server.port",
+        "SERVER_PORT",
+    ]
+    assert index.search("spring.datasource.hik")[0].key == (
+        "spring.datasource.hikari.maxPoolSize"
+    )
+    assert index.search("") == []
+    assert index.search("nothing-matches-this") == []
+
+
+def test_search_kinds_and_limit():
+    index = build_search_index(BEANS, CONDITIONS, ENV, CONFIGPROPS)
+    assert {d.kind for d in index.search("datasource", kinds=["property"])} == {
+        "property"
+    }
+    assert len(index.search("datasource", limit=2)) == 2
+
+
+def test_search_as_you_type_matches_full_search():
+    index = build_search_index(BEANS, CONDITIONS, ENV, CONFIGPROPS)
+    typed = [index.search(query, limit=None) for query in ["d", "da", "data", "data s"]]
+    fresh = build_search_index(BEANS, CONDITIONS, ENV, CONFIGPROPS)
+    assert typed[-1] == fresh.search("data s", limit=None)
+    # Going back to a shorter query recomputes the matches
+    assert index.search("d", limit=None) == typed[0]
+
+
+def test_background_refresh_swaps_index():
+    search_index = BackgroundSearchIndex()
+    assert search_index.search("datasource") == []
+
+    future = search_index.refresh(beans=BEANS)
+    future.result(timeout=5)
+    assert [document.key for document in search_index.search("jdbc")] == [
+        "jdbcTemplate"
+    ]
+
+    search_index.refresh(env=ENV).result(timeout=5)
+    assert search_index.search("jdbc") == []
+    assert len(search_index.get_index()) == 3
@@ -0,0 +1,146 @@
+from datetime import timedelta
+
+import pytest
+from tinydb import TinyDB
+from tinydb.storages import MemoryStorage
+
+from src.actuator.containers.info import Info
+from src.actuator.containers.startup import Startup
+from src.analytics import (
+    StartupHistory,
+    StartupSnapshot,
+    compare_snapshots,
+    compare_startups,
+)
+from src.tinydb.tiny_repo import TinyRepo
+
+
+@pytest.fixture
+def make_startup(startup_event, startup_time):
+    def startup(repository_time, post_processor="Processor@1a2b3c", extra=()):
+        events = [
+            startup_event(
+                1,
+                "spring.context.beans.post-process",
+                0.0,
+                0.01,
+                postProcessor=post_processor,
+            ),
+            startup_event(
+                3, "spring.beans.instantiate", 0.1, 0.02, 2, beanName="dataSource"
+            ),
+            startup_event(
+                4,
+                "spring.beans.instantiate",
+                0.2,
+                repository_time,
+                2,
+                beanName="repository",
+            ),
+            startup_event(2, "spring.context.refresh", 0.05, 0.5 + repository_time),
+            *extra,
+        ]
+        return Startup.model_validate(
+            {
+                "springBootVersion": "3.4.4",
+                "timeline": {"startTime": startup_time.isoformat(), "events": events},
+            }
+        )
+
+    return startup
+
+
+def info(version):
+    return Info.model_validate(
+        {
+            "build": {
+                "artifact": "demo",
+                "name": "demo",
+                "time": "2025-04-23T10:00:00Z",
+                "version": version,
+            }
+        }
+    )
+
+
+def test_regression_is_found(make_startup):
+    comparison = compare_startups(
+        make_startup(0.02), make_startup(2.0, post_processor="Processor@9f8e7d")
+    )
+    regressions = comparison.get_regressions()
+    assert len(regressions) == 1
+    assert regressions[0].tags == {"beanName": "repository"}
+    assert regressions[0].baseline_self_time == 0.02
+    assert regressions[0].current_self_time == 2.0
+
+    # The post-processor step is aligned despite its identity hash code
+    assert comparison.get_added() == []
+    assert comparison.get_removed() == []
+    assert len(comparison.steps) == 4
+
+
+def test_added_and_removed_steps(make_startup, startup_event):
+    extra = [
+        startup_event(5, "spring.beans.instantiate", 0.3, 0.1, 2, beanName="cache")
+    ]
+    comparison = compare_startups(make_startup(0.02), make_startup(0.02, extra=extra))
+    assert [step.tags["beanName"] for step in comparison.get_added()] == ["cache"]
+    assert comparison.get_regressions() == []
+
+    comparison = compare_startups(make_startup(0.02, extra=extra), make_startup(0.02))
+    assert [step.tags["beanName"] for step in comparison.get_removed()] == ["cache"]
+
+
+def test_history_by_build_version(make_startup, startup_time):
+    db = TinyDB(storage=MemoryStorage)
+    history = StartupHistory(TinyRepo(db, "startups", StartupSnapshot))
+    history.record("server-1", make_startup(0.02), info("1.0.0"), startup_time)
+    history.record("server-1", make_startup(0.02), info("1.0.0"), startup_time)
+    history.record(
+        "server-1", make_startup(1.5), info("1.1.0"), startup_time + timedelta(hours=3)
+    )
+    history.record("server-2", make_startup(0.02), info("1.1.0"), startup_time)
+
+    snapshots = history.get_snapshots("server-1")
+    assert [snapshot.build_version for snapshot in snapshots] == ["1.0.0", "1.1.0"]
+
+    baseline = history.get_latest("server-1", "1.0.0")
+    current = history.get_latest("server-1")
+    assert current.build_version == "1.1.0"
+    regressions = compare_snapshots(baseline, current).get_regressions()
+    assert [step.tags["beanName"] for step in regressions] == ["repository"]
+
+
+def test_record_only_reads_matching_snapshots(make_startup, startup_time, monkeypatch):
+    db = TinyDB(storage=MemoryStorage)
+    history = StartupHistory(TinyRepo(db, "startups", StartupSnapshot))
+    for hour in range(3):
+        history.record(
+            "server-1", make_startup(0.02), None, startup_time + timedelta(hours=hour)
+        )
+
+    validated = []
+    validate = StartupSnapshot.model_validate
+    monkeypatch.setattr(
+        StartupSnapshot,
+        "model_validate",
+        lambda doc: validated.append(doc) or validate(doc),
+    )
+    existing = history.record("server-1", make_startup(0.02), None, startup_time)
+    assert existing.timestamp == startup_time
+    assert len(validated) == 1
+
+
+def test_history_in_json_file(tmp_path, make_startup, startup_time):
+    db = TinyDB(tmp_path / "history.json")
+    history = StartupHistory(TinyRepo(db, "startups", StartupSnapshot))
+    history.record("server-1", make_startup(0.02), info("1.0.0"), startup_time)
+    history.record("server-1", make_startup(0.02), info("1.0.0"), startup_time)
+    db.close()
+
+    db = TinyDB(tmp_path / "history.json")
+    history = StartupHistory(TinyRepo(db, "startups", StartupSnapshot))
+    snapshots = history.get_snapshots("server-1")
+    assert len(snapshots) == 1
+    assert snapshots[0].timestamp == startup_time
+    assert snapshots[0].get_startup().timeline.start_time == startup_time
@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.actuator.containers.sbom import SBOM
+
+
+@pytest.fixture
+def startup_time():
+    """The start time of the application in /actuator/startup timelines."""
+    return datetime(2025, 4, 23, 10, 23, 43, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def startup_event(startup_time):
+    """Build an /actuator/startup timeline event.
+
+    The returned function takes the step ID, the step name, the start time and
+    duration in seconds since startup_time, an optional parent step ID, and
+    the step tags as keyword arguments.
+    """
+
+    def event(step_id, name, start, duration, parent_id=None, **tags):
+        step = {
+            "name": name,
+            "id": step_id,
+            "tags": [{"key": key, "value": value} for key, value in tags.items()],
+        }
+        if parent_id is not None:
+            step["parentId"] = parent_id
+        return {
+            "startTime": (startup_time + timedelta(seconds=start)).isoformat(),
+            "endTime": (startup_time + timedelta(seconds=start + duration)).isoformat(),
+            "duration": f"PT{duration}S",
+            "startupStep": step,
+        }
+
+    return event
+
+
+def _maven_purl(group, name, version):
+    return f"pkg:maven/{group}/{name}@{version}?type=jar"
+
+
+def _library(group, name, version):
+    return {
+        "type": "library",
+        "bom-ref": _maven_purl(group, name, version),
+        "group": group,
+        "name": name,
+        "version": version,
+        "purl": _maven_purl(group, name, version),
+    }
+
+
+@pytest.fixture
+def maven_purl():
+    """Build the package URL of a Maven jar from its group, name and version."""
+    return _maven_purl
+
+
+@pytest.fixture
+def make_sbom():
+    """Build the SBOM of an application shipping log4j through a starter.
+
+    The returned function takes the log4j version and group.
+    """
+
+    def sbom(log4j_version="2.14.1", log4j_group="org.apache.logging.log4j"):
+        app = _maven_purl("com.example", "orders", "1.0.0")
+        starter = _maven_purl(
+            "org.springframework.boot", "spring-boot-starter-log4j2", "2.5.0"
+        )
+        log4j = _maven_purl(log4j_group, "log4j-core", log4j_version)
+        api = _maven_purl(log4j_group, "log4j-api", log4j_version)
+        return SBOM.model_validate(
+            {
+                "bomFormat": "CycloneDX",
+                "specVersion": "1.6",
+                "serialNumber": "urn:uuid:51b6941b-ba08-451f-bbef-50dcf66bb117",
+                "version": 1,
+                "metadata": {
+                    "timestamp": "2025-04-23T07:00:38Z",
+                    "tools": {
+                        "components": [
+                            {
+                                "type": "application",
+                                "bom-ref": "tool:cyclonedx-gradle-plugin",
+                                "name": "cyclonedx-gradle-plugin",
+                                "version": "2.2.0",
+                            }
+                        ]
+                    },
+                    "component": {
+                        "type": "application",
+                        "bom-ref": app,
+                        "group": "com.example",
+                        "name": "orders",
+                        "version": "1.0.0",
+                    },
+                },
+                "components": [
+                    _library(
+                        "org.springframework.boot",
+                        "spring-boot-starter-log4j2",
+                        "2.5.0",
+                    ),
+                    _library(log4j_group, "log4j-core", log4j_version),
+                    _library(log4j_group, "log4j-api", log4j_version),
+                ],
+                "dependencies": [
+                    {"ref": app, "dependsOn": [starter]},
+                    {"ref": starter, "dependsOn": [log4j]},
+                    {"ref": log4j, "dependsOn": [api]},
+                    {"ref": api, "dependsOn": []},
+                ],
+            }
+        )
+
+    return sbom
@@ -11,6 +11,11 @@ class Item(BaseModel):
     value: int
 
 
+class TimedItem(BaseModel):
+    name: str
+    timestamp: datetime
+
+
 @pytest.fixture
 def repo():
     db = TinyDB(storage=MemoryStorage)
@@ -84,6 +89,50 @@ def test_get_field_values_by_date_range(repo):
     assert sorted(values) == [10, 20]
 
 
+def test_datetime_fields_keep_their_type():
+    db = TinyDB(storage=MemoryStorage)
+    repo = TinyRepo[TimedItem](db=db, table_name="timed_items", model=TimedItem)
+    now = datetime.now(timezone.utc)
+    repo.add(TimedItem(name="A", timestamp=now))
+
+    # Stored as JSON, returned as the model's types
+    assert isinstance(repo.table.all()[0]["timestamp"], str)
+    assert repo.get_all()[0].timestamp == now
+    assert repo.get_field_values("timestamp") == [now]
+    values = repo.get_field_values_by_date_range(
+        "timestamp", now - timedelta(minutes=1), now + timedelta(minutes=1)
+    )
+    assert values == [now]
+
+
+def test_filter_by_fields():
+    db = TinyDB(storage=MemoryStorage)
+    repo = TinyRepo[TimedItem](db=db, table_name="timed_items", model=TimedItem)
+    now = datetime.now(timezone.utc)
+    repo.add(TimedItem(name="A", timestamp=now))
+    repo.add(TimedItem(name="A", timestamp=now + timedelta(minutes=1)))
+    repo.add(TimedItem(name="B", timestamp=now))
+
+    assert repo.filter_by_fields(name="A", timestamp=now) == [
+        TimedItem(name="A", timestamp=now)
+    ]
+    assert len(repo.filter_by_fields(name="A")) == 2
+    assert repo.filter_by_fields(name="C") == []
+
+
+def test_items_persist_to_json_file(tmp_path):
+    now = datetime.now(timezone.utc)
+    db = TinyDB(tmp_path / "items.json")
+    TinyRepo[TimedItem](db=db, table_name="timed_items", model=TimedItem).add(
+        TimedItem(name="A", timestamp=now)
+    )
+    db.close()
+
+    db = TinyDB(tmp_path / "items.json")
+    repo = TinyRepo[TimedItem](db=db, table_name="timed_items", model=TimedItem)
+    assert repo.get_all() == [TimedItem(name="A", timestamp=now)]
+
+
 def test_delete_older_than_x_minutes(repo):
     repo.add(Item(name="A", value=10))
     repo.add(Item(name="B", value=20))